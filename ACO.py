@@ -1,110 +1,284 @@
 import random
-import math
 import time
-import matplotlib.pyplot as plt
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from InstanciaTSP import InstanciaTSP
+from BuscaLocal import BuscaLocal
+from Checkpoint import estado_random, restaurar_random
+from Perfilador import PERFILADOR_NULO
+from Eventos import EventoIteracao
 
 class ACO_TSP:
+    VARIANTES = ('AS', 'MMAS', 'ACS')
+    FORMIGAS_POR_BLOCO = 32
+    
     def __init__(self, grafo_adj, num_formigas=None, num_iteracoes=100, 
-                 alfa=1.0, beta=2.0, taxa_evaporacao=0.5, Q_constante=100.0):
+                 alfa=1.0, beta=2.0, taxa_evaporacao=0.5, Q_constante=100.0,
+                 modo_construcao='sequencial', semente=None,
+                 num_candidatos=None, politica_fallback='completa',
+                 variante='AS', q0=0.9, xi_local=0.1, p_melhor=0.05,
+                 iteracoes_estagnacao=50, frequencia_melhor_global=5,
+                 num_processos=None, perfilador=None):
         """
         Inicializa o algoritmo ACO para TSP
         
         Args:
-            grafo_adj: Dicionário de adjacência no formato {cidade: {vizinho: distancia, ...}}
-            num_formigas: Número de formigas (padrão: 10 * número de cidades)
+            grafo_adj: InstanciaTSP ou dicionário de adjacência no formato {cidade: {vizinho: distancia, ...}}
+            num_formigas: Número de formigas (padrão: 10 * número de cidades no AS,
+                número de cidades no MMAS e 10 no ACS)
             num_iteracoes: Número de iterações
             alfa: Parâmetro de influência do feromônio
             beta: Parâmetro de influência da heurística
             taxa_evaporacao: Taxa de evaporação do feromônio
             Q_constante: Constante para deposição de feromônio
+            modo_construcao: 'sequencial' (uma formiga por vez) ou 'lote' (todas as
+                formigas da iteração construídas simultaneamente com NumPy)
+            semente: Semente do gerador aleatório usado na construção em lote
+            num_candidatos: Tamanho k das listas de vizinhos mais próximos (None desativa)
+            politica_fallback: Escolha quando todos os candidatos já foram visitados:
+                'completa' (roleta sobre todas as cidades disponíveis) ou
+                'melhor' (cidade disponível de maior atratividade)
+            variante: 'AS' (Ant System), 'MMAS' (MAX-MIN Ant System) ou 'ACS' (Ant Colony System)
+            q0: ACS - probabilidade de escolher a aresta de maior atratividade
+            xi_local: ACS - taxa da atualização local de feromônio
+            p_melhor: MMAS - probabilidade usada no cálculo de τmin
+            iteracoes_estagnacao: MMAS - iterações sem melhora até reinicializar as trilhas
+            frequencia_melhor_global: MMAS - a cada quantas iterações a melhor formiga
+                global deposita no lugar da melhor da iteração (0 desativa)
+            num_processos: Processos que constroem as formigas em paralelo sobre a
+                informação de escolha em memória compartilhada (None desativa). As
+                formigas são divididas em blocos fixos com geradores próprios, então o
+                resultado para uma semente não depende do número de processos
+            perfilador: Perfilador com o tempo das fases construcao, avaliacao,
+                feromonio, busca_local e checkpoint e os contadores de cada execução
+                (None usa o PerfiladorNulo, sem custo)
         """
-        self.grafo_adj = grafo_adj
-        self.num_cidades = len(grafo_adj)
-        self.cidades = list(grafo_adj.keys())
+        self.instancia = InstanciaTSP.de_grafo(grafo_adj)
+        if not self.instancia.densa:
+            # Feromônio e informação de escolha são n x n: o ACO exige a matriz densa
+            raise ValueError("ACO_TSP exige uma instância com matriz densa de distâncias")
+        self.grafo_adj = self.instancia.grafo_adj
+        self.num_cidades = self.instancia.num_cidades
+        self.cidades = self.instancia.cidades
         
         # Parâmetros do algoritmo
-        self.num_formigas = num_formigas if num_formigas else 10 * self.num_cidades
+        self._num_formigas_informado = num_formigas
+        self.num_formigas = num_formigas if num_formigas else self._formigas_padrao(variante)
         self.num_iteracoes = num_iteracoes
         self.alfa = alfa
         self.beta = beta
         self.taxa_evaporacao = taxa_evaporacao
         self.Q_constante = Q_constante
         
-        # Converte lista de adjacência para matriz de distâncias para facilitar cálculos
+        if modo_construcao not in ('sequencial', 'lote'):
+            raise ValueError(f"Modo de construção inválido: {modo_construcao}")
+        self.modo_construcao = modo_construcao
+        self.rng = np.random.default_rng(semente)
+        
+        # Construção paralela: cada bloco de formigas usa SeedSequence(semente, (execução, iteração, bloco))
+        if num_processos is not None and num_processos < 1:
+            raise ValueError(f"Número de processos inválido: {num_processos}")
+        self.num_processos = num_processos
+        self._semente_colonias = np.random.SeedSequence(semente).entropy
+        self._execucoes_colonias = 0
+        self._memorias_colonias = None
+        
+        # Variantes do sistema de formigas
+        if variante not in self.VARIANTES:
+            raise ValueError(f"Variante inválida: {variante}")
+        self.variante = variante
+        self._variante_ativa = variante
+        self.q0 = q0
+        self.xi_local = xi_local
+        self.p_melhor = p_melhor
+        self.iteracoes_estagnacao = iteracoes_estagnacao
+        self.frequencia_melhor_global = frequencia_melhor_global
+        self.tau0 = None
+        self.tau_min = None
+        self.tau_max = None
+        
+        # Matriz densa de distâncias compartilhada pela instância
         self.matriz_distancias = self._converter_para_matriz()
         
-        # Inicializa feromônios
+        # Listas de candidatos (k vizinhos mais próximos de cada cidade)
+        if politica_fallback not in ('completa', 'melhor'):
+            raise ValueError(f"Política de fallback inválida: {politica_fallback}")
+        self.politica_fallback = politica_fallback
+        self.num_candidatos = num_candidatos
+        self.lista_candidatos = None
+        self._lista_candidatos_py = None
+        if num_candidatos:
+            self.lista_candidatos = self.instancia.vizinhos_proximos(num_candidatos)
+            self.num_candidatos = self.lista_candidatos.shape[1]
+            self._lista_candidatos_py = self.lista_candidatos.tolist()
+        
+        # Fator heurístico η^β é fixo durante a execução: calculado uma única vez
+        self.heuristica_beta = self._calcular_heuristica()
+        
+        # Inicializa feromônios e a matriz de informação de escolha τ^α · η^β
         self._inicializar_feromonios()
+        self._atualizar_info_escolha()
         
         # Variáveis para armazenar resultados
         self.melhor_rota = None
         self.menor_distancia = float('inf')
         self.historico_convergencia = []
+        self.tempo_execucao = 0
+        self._iteracao_inicial = 0
+        self._busca_local_aplicada = None
+        self.perfilador = perfilador if perfilador is not None else PERFILADOR_NULO
+        self._reiniciar_estatisticas()
+    
+    def _reiniciar_estatisticas(self):
+        """Zera os contadores de construção da execução"""
+        self.estatisticas = {
+            'passos_candidatos': 0,
+            'passos_fallback': 0,
+            'reinicios_feromonio': 0
+        }
+    
+    def get_estatisticas(self):
+        """
+        Retorna estatísticas da última execução.
+        
+        Returns:
+            dict: Estatísticas de execução, da construção com listas de candidatos
+                e o perfil por fase (None sem perfilador)
+        """
+        return {
+            'tempo_execucao': self.tempo_execucao,
+            'num_iteracoes': self.num_iteracoes,
+            'num_formigas': self.num_formigas,
+            'modo_construcao': self.modo_construcao,
+            'variante': self._variante_ativa,
+            'menor_distancia': self.menor_distancia,
+            'num_candidatos': self.num_candidatos,
+            'politica_fallback': self.politica_fallback if self.num_candidatos else None,
+            'passos_candidatos': self.estatisticas['passos_candidatos'],
+            'passos_fallback': self.estatisticas['passos_fallback'],
+            'reinicios_feromonio': self.estatisticas['reinicios_feromonio'],
+            'perfil': self.perfilador.get_estatisticas()
+        }
+    
+    def _formigas_padrao(self, variante):
+        """Número padrão de formigas de cada variante"""
+        if variante == 'ACS':
+            return 10
+        if variante == 'MMAS':
+            return self.num_cidades
+        return 10 * self.num_cidades
     
     def _converter_para_matriz(self):
-        """Converte dicionário de adjacência para matriz de distâncias"""
-        matriz = [[float('inf') for _ in range(self.num_cidades)] for _ in range(self.num_cidades)]
-        
-        # Mapeia cidades para índices
-        self.cidade_para_indice = {cidade: i for i, cidade in enumerate(self.cidades)}
-        self.indice_para_cidade = {i: cidade for i, cidade in enumerate(self.cidades)}
-        
-        # Preenche a matriz
-        for i in range(self.num_cidades):
-            matriz[i][i] = 0  # Distância para si mesmo é 0
-        
-        for cidade, vizinhos in self.grafo_adj.items():
-            i = self.cidade_para_indice[cidade]
-            for vizinho, distancia in vizinhos.items():
-                j = self.cidade_para_indice[vizinho]
-                matriz[i][j] = distancia
-                
-        return matriz
+        """Obtém a matriz de distâncias e os mapeamentos de cidades da instância"""
+        self.cidade_para_indice = self.instancia.cidade_para_indice
+        self.indice_para_cidade = self.instancia.indice_para_cidade
+        return self.instancia.matriz_distancias
     
     def _inicializar_feromonios(self):
-        """Inicializa matriz de feromônios"""
+        """Inicializa matriz de feromônios (NumPy, float32)"""
         feromonio_inicial = 1.0 / (self.num_cidades * self.num_cidades)
-        self.feromonios = [[feromonio_inicial for _ in range(self.num_cidades)] 
-                          for _ in range(self.num_cidades)]
+        self.feromonios = np.full((self.num_cidades, self.num_cidades), feromonio_inicial, dtype=np.float32)
+    
+    def _custo_vizinho_mais_proximo(self, cidade_inicial_idx):
+        """Custo da rota gulosa do vizinho mais próximo, usado para escalar os feromônios"""
+        distancias = self.matriz_distancias
+        visitadas = np.zeros(self.num_cidades, dtype=bool)
+        visitadas[cidade_inicial_idx] = True
+        cidade_atual = cidade_inicial_idx
+        custo = 0.0
+        
+        for _ in range(self.num_cidades - 1):
+            linha = np.where(visitadas, np.inf, distancias[cidade_atual])
+            proxima = int(np.argmin(linha))
+            custo += linha[proxima]
+            visitadas[proxima] = True
+            cidade_atual = proxima
+        
+        return custo + distancias[cidade_atual, cidade_inicial_idx]
+    
+    def _inicializar_feromonios_variante(self, cidade_inicial_idx):
+        """Inicializa os feromônios conforme a variante ativa (MMAS ou ACS)"""
+        custo_nn = self._custo_vizinho_mais_proximo(cidade_inicial_idx)
+        
+        if self._variante_ativa == 'MMAS':
+            self._atualizar_limites_mmas(custo_nn)
+            self.feromonios.fill(self.tau_max)
+        elif self._variante_ativa == 'ACS':
+            self.tau0 = self.Q_constante / (self.num_cidades * custo_nn)
+            self.feromonios.fill(self.tau0)
+    
+    def _atualizar_limites_mmas(self, melhor_custo):
+        """Recalcula [τmin, τmax] do MMAS a partir do melhor custo conhecido"""
+        n = self.num_cidades
+        self.tau_max = self.Q_constante / (self.taxa_evaporacao * melhor_custo)
+        raiz_p = self.p_melhor ** (1.0 / n)
+        self.tau_min = self.tau_max * (1.0 - raiz_p) / (max(n / 2.0 - 1.0, 1.0) * raiz_p)
     
     def calcular_distancia_total(self, rota):
         """Calcula a distância total de uma rota"""
-        distancia = 0
-        num_cidades_rota = len(rota)
-        
-        for i in range(num_cidades_rota):
-            cidade_atual = rota[i]
-            proxima_cidade = rota[(i + 1) % num_cidades_rota]
-            distancia += self.matriz_distancias[cidade_atual][proxima_cidade]
-            
-        return distancia
+        return self.instancia.custo_rota(rota)
+    
+    def _calcular_heuristica(self):
+        """Calcula η^β = (1/d)^β de todas as arestas; zero para arestas sem distância positiva"""
+        distancias = self.matriz_distancias
+        with np.errstate(divide='ignore'):
+            heuristica = np.where(distancias > 0, 1.0 / distancias, 0.0)
+        return np.power(heuristica, self.beta)
+    
+    def _atualizar_info_escolha(self):
+        """
+        Recalcula a informação de escolha τ^α · η^β, usada pela construção apenas
+        por consulta. Chamado uma vez por iteração, após a atualização dos feromônios.
+        """
+        fator_feromonio = self.feromonios if self.alfa == 1.0 else np.power(self.feromonios, self.alfa)
+        if self._memorias_colonias is not None:
+            # Escreve direto na memória compartilhada lida pelos processos das colônias
+            np.multiply(fator_feromonio, self.heuristica_beta, out=self.info_escolha)
+        else:
+            self.info_escolha = fator_feromonio * self.heuristica_beta
     
     def _construir_solucao_formiga(self, cidade_inicial_idx):
         """Constrói uma solução (rota) para uma formiga"""
         rota = [cidade_inicial_idx]
         cidades_disponiveis = list(range(self.num_cidades))
         cidades_disponiveis.remove(cidade_inicial_idx)
+        visitadas = [False] * self.num_cidades
+        visitadas[cidade_inicial_idx] = True
         
         cidade_atual = cidade_inicial_idx
+        acs = self._variante_ativa == 'ACS'
         
         while cidades_disponiveis:
             probabilidades = []
             soma_denominador = 0.0
+            linha_info = self.info_escolha[cidade_atual]
             
-            # Calcula probabilidades para cada cidade disponível
-            for proxima_cidade in cidades_disponiveis:
-                if self.matriz_distancias[cidade_atual][proxima_cidade] > 0:
-                    fator_feromonio = math.pow(self.feromonios[cidade_atual][proxima_cidade], self.alfa)
-                    fator_heuristico = math.pow(1.0 / self.matriz_distancias[cidade_atual][proxima_cidade], self.beta)
-                    valor_prob = fator_feromonio * fator_heuristico
-                    probabilidades.append({'cidade': proxima_cidade, 'prob': valor_prob})
-                    soma_denominador += valor_prob
+            # Restringe a escolha aos candidatos ainda não visitados, se houver
+            opcoes = cidades_disponiveis
+            if self._lista_candidatos_py is not None:
+                candidatas = [c for c in self._lista_candidatos_py[cidade_atual] if not visitadas[c]]
+                if candidatas:
+                    opcoes = candidatas
+                    self.estatisticas['passos_candidatos'] += 1
                 else:
-                    probabilidades.append({'cidade': proxima_cidade, 'prob': 0})
+                    self.estatisticas['passos_fallback'] += 1
+                    if self.politica_fallback == 'melhor':
+                        opcoes = [cidades_disponiveis[int(np.argmax(linha_info[cidades_disponiveis]))]]
+            
+            # Calcula probabilidades para cada cidade disponível (só a linha da cidade atual,
+            # e só nas opções, é convertida para floats do Python)
+            valores_info = linha_info[opcoes].tolist()
+            for proxima_cidade, valor_prob in zip(opcoes, valores_info):
+                probabilidades.append({'cidade': proxima_cidade, 'prob': valor_prob})
+                soma_denominador += valor_prob
             
             # Seleciona próxima cidade
             proxima_cidade = None
-            if soma_denominador > 0:
+            if acs and random.random() < self.q0:
+                # Regra pseudo-aleatória proporcional do ACS: explora a melhor aresta
+                proxima_cidade = opcoes[max(range(len(opcoes)), key=valores_info.__getitem__)]
+            elif soma_denominador > 0:
                 # Normaliza probabilidades
                 for item in probabilidades:
                     item['prob'] /= soma_denominador
@@ -121,101 +295,343 @@ class ACO_TSP:
                         break
             
             # Fallback: escolha aleatória se necessário
-            if proxima_cidade is None and cidades_disponiveis:
-                proxima_cidade = random.choice(cidades_disponiveis)
+            if proxima_cidade is None and opcoes:
+                proxima_cidade = random.choice(opcoes)
             
             if proxima_cidade is not None:
                 rota.append(proxima_cidade)
                 cidades_disponiveis.remove(proxima_cidade)
+                visitadas[proxima_cidade] = True
+                if acs:
+                    self._atualizacao_local(cidade_atual, proxima_cidade)
                 cidade_atual = proxima_cidade
             else:
                 break
+        
+        if acs and len(rota) > 1:
+            self._atualizacao_local(cidade_atual, cidade_inicial_idx)
                 
         return rota
     
+    def _atualizacao_local(self, origens, destinos):
+        """
+        Atualização local do ACS nas arestas recém-percorridas (nos dois sentidos):
+        τ ← (1 - ξ)·τ + ξ·τ0, refletida de forma incremental na informação de escolha.
+        """
+        for a, b in ((origens, destinos), (destinos, origens)):
+            tau = (1.0 - self.xi_local) * self.feromonios[a, b] + self.xi_local * self.tau0
+            self.feromonios[a, b] = tau
+            fator_feromonio = tau if self.alfa == 1.0 else np.power(tau, self.alfa)
+            self.info_escolha[a, b] = fator_feromonio * self.heuristica_beta[a, b]
+    
+    def _construir_solucoes_lote(self, cidade_inicial_idx, num_formigas=None):
+        """
+        Constrói as rotas de todas as formigas da iteração ao mesmo tempo.
+        
+        Args:
+            cidade_inicial_idx: Índice da cidade inicial
+            num_formigas: Tamanho do lote (padrão: todas as formigas da iteração)
+        
+        Returns:
+            np.ndarray: Matriz (num_formigas x num_cidades) com as rotas em índices compactos (uint16/int32)
+        """
+        n = self.num_cidades
+        num_formigas = num_formigas or self.num_formigas
+        formigas = np.arange(num_formigas)
+        info_escolha = self.info_escolha
+        
+        rotas = np.empty((num_formigas, n), dtype=InstanciaTSP.tipo_indices(n))
+        rotas[:, 0] = cidade_inicial_idx
+        visitadas = np.zeros((num_formigas, n), dtype=bool)
+        visitadas[:, cidade_inicial_idx] = True
+        
+        cidades_atuais = rotas[:, 0].copy()
+        for passo in range(1, n):
+            if self.lista_candidatos is not None:
+                proximas = self._escolher_candidatas_lote(info_escolha, cidades_atuais, visitadas)
+            else:
+                pesos = info_escolha[cidades_atuais]
+                pesos[visitadas] = 0.0
+                proximas = self._selecionar_lote(pesos, visitadas)
+            
+            rotas[:, passo] = proximas
+            visitadas[formigas, proximas] = True
+            if self._variante_ativa == 'ACS':
+                self._atualizacao_local(cidades_atuais, proximas)
+            cidades_atuais = proximas
+        
+        if self._variante_ativa == 'ACS' and n > 1:
+            self._atualizacao_local(cidades_atuais, rotas[:, 0])
+        
+        return rotas
+    
+    def _construir_bloco(self, chave, num_formigas, cidade_inicial_idx):
+        """
+        Constrói um bloco de formigas com um gerador próprio derivado da semente e
+        da chave (execução, iteração, bloco), independente de quem executa o bloco.
+        
+        Returns:
+            tuple: (rotas em índices compactos, custos, estatísticas de construção do bloco)
+        """
+        rng, estatisticas = self.rng, self.estatisticas
+        self.rng = np.random.default_rng(np.random.SeedSequence(self._semente_colonias, spawn_key=chave))
+        self._reiniciar_estatisticas()
+        try:
+            rotas = self._construir_solucoes_lote(cidade_inicial_idx, num_formigas)
+            custos = self.matriz_distancias[rotas, np.roll(rotas, -1, axis=1)].sum(axis=1, dtype=np.float64)
+            return rotas, custos, self.estatisticas
+        finally:
+            self.rng, self.estatisticas = rng, estatisticas
+    
+    def _construir_solucoes_paralelo(self, executor, cidade_inicial_idx, iteracao):
+        """
+        Distribui os blocos de formigas da iteração entre os processos e junta as
+        rotas na ordem dos blocos.
+        
+        Returns:
+            tuple: (rotas, custos) de todas as formigas da iteração
+        """
+        tamanhos = [min(self.FORMIGAS_POR_BLOCO, self.num_formigas - inicio)
+                    for inicio in range(0, self.num_formigas, self.FORMIGAS_POR_BLOCO)]
+        chaves = [(self._execucoes_colonias, iteracao, bloco) for bloco in range(len(tamanhos))]
+        iniciais = [cidade_inicial_idx] * len(tamanhos)
+        
+        if executor is None:
+            resultados = list(map(self._construir_bloco, chaves, tamanhos, iniciais))
+        else:
+            resultados = list(executor.map(_construir_bloco_colonia, chaves, tamanhos, iniciais))
+        
+        for _, _, estatisticas in resultados:
+            self.estatisticas['passos_candidatos'] += estatisticas['passos_candidatos']
+            self.estatisticas['passos_fallback'] += estatisticas['passos_fallback']
+        
+        rotas = np.concatenate([r[0] for r in resultados])
+        custos = np.concatenate([r[1] for r in resultados])
+        return rotas, custos
+    
+    def _iniciar_colonias(self):
+        """
+        Copia a informação de escolha e as distâncias para memória compartilhada e
+        inicia os processos das colônias, que só leem essas matrizes.
+        
+        Returns:
+            ProcessPoolExecutor ou None quando num_processos == 1
+        """
+        self._execucoes_colonias += 1
+        if self.num_processos == 1:
+            return None
+        
+        forma = (self.num_cidades, self.num_cidades)
+        origens = (self.info_escolha, self.matriz_distancias)
+        tipos = [origem.dtype.str for origem in origens]
+        memorias = []
+        try:
+            for origem in origens:
+                memoria = shared_memory.SharedMemory(create=True, size=max(origem.nbytes, 1))
+                memorias.append(memoria)
+                np.ndarray(forma, dtype=origem.dtype, buffer=memoria.buf)[:] = origem
+        except Exception:
+            for memoria in memorias:
+                memoria.close()
+                memoria.unlink()
+            raise
+        
+        self._memorias_colonias = memorias
+        self.info_escolha = np.ndarray(forma, dtype=self.info_escolha.dtype, buffer=memorias[0].buf)
+        
+        configuracao = {
+            'num_cidades': self.num_cidades,
+            'lista_candidatos': self.lista_candidatos,
+            'politica_fallback': self.politica_fallback,
+            '_variante_ativa': self._variante_ativa,
+            'q0': self.q0,
+            '_semente_colonias': self._semente_colonias
+        }
+        return ProcessPoolExecutor(max_workers=self.num_processos, initializer=_inicializar_colonia,
+                                   initargs=([m.name for m in memorias], forma, tipos, configuracao))
+    
+    def _encerrar_colonias(self, executor):
+        """Encerra os processos e libera a memória compartilhada, mantendo uma cópia local"""
+        if executor is not None:
+            executor.shutdown()
+        if self._memorias_colonias is None:
+            return
+        
+        self.info_escolha = self.info_escolha.copy()
+        for memoria in self._memorias_colonias:
+            memoria.close()
+            memoria.unlink()
+        self._memorias_colonias = None
+    
+    def _escolher_candidatas_lote(self, info_escolha, cidades_atuais, visitadas):
+        """
+        Escolhe a próxima cidade de cada formiga entre os candidatos não visitados,
+        recorrendo ao conjunto completo apenas para as formigas sem candidatos livres.
+        """
+        formigas = np.arange(len(cidades_atuais))
+        candidatas = self.lista_candidatos[cidades_atuais]
+        bloqueadas = visitadas[formigas[:, np.newaxis], candidatas]
+        com_candidatas = ~bloqueadas.all(axis=1)
+        proximas = np.empty(len(cidades_atuais), dtype=np.intp)
+        
+        if com_candidatas.any():
+            pesos = info_escolha[cidades_atuais[com_candidatas, np.newaxis], candidatas[com_candidatas]]
+            pesos[bloqueadas[com_candidatas]] = 0.0
+            escolhas = self._selecionar_lote(pesos, bloqueadas[com_candidatas])
+            proximas[com_candidatas] = candidatas[com_candidatas, escolhas]
+        
+        sem_candidatas = ~com_candidatas
+        num_fallback = int(sem_candidatas.sum())
+        self.estatisticas['passos_candidatos'] += len(cidades_atuais) - num_fallback
+        self.estatisticas['passos_fallback'] += num_fallback
+        
+        if num_fallback:
+            pesos = info_escolha[cidades_atuais[sem_candidatas]]
+            pesos[visitadas[sem_candidatas]] = 0.0
+            if self.politica_fallback == 'melhor':
+                pesos[visitadas[sem_candidatas]] = -1.0
+                proximas[sem_candidatas] = np.argmax(pesos, axis=1)
+            else:
+                proximas[sem_candidatas] = self._selecionar_lote(pesos, visitadas[sem_candidatas])
+        
+        return proximas
+    
+    def _selecionar_lote(self, pesos, bloqueadas):
+        """
+        Regra de transição em lote: roleta (AS e MMAS) ou regra pseudo-aleatória
+        proporcional (ACS), que com probabilidade q0 escolhe a aresta de maior peso.
+        """
+        if self._variante_ativa != 'ACS':
+            return self._roleta_lote(pesos, bloqueadas)
+        
+        escolhas = np.empty(len(pesos), dtype=np.intp)
+        explorar = self.rng.random(len(pesos)) < self.q0
+        if explorar.any():
+            escolhas[explorar] = np.argmax(np.where(bloqueadas[explorar], -1.0, pesos[explorar]), axis=1)
+        if not explorar.all():
+            escolhas[~explorar] = self._roleta_lote(pesos[~explorar], bloqueadas[~explorar])
+        return escolhas
+    
+    def _roleta_lote(self, pesos, visitadas):
+        """
+        Seleção por roleta vetorizada: sorteia uma coluna por linha de pesos
+        com soma acumulada normalizada e um único searchsorted.
+        """
+        num_linhas, n = pesos.shape
+        linhas = np.arange(num_linhas)
+        totais = pesos.sum(axis=1)
+        
+        # Fallback: escolha uniforme entre as cidades disponíveis se nenhuma tem peso
+        sem_peso = totais <= 0
+        if sem_peso.any():
+            pesos[sem_peso] = ~visitadas[sem_peso]
+            totais[sem_peso] = pesos[sem_peso].sum(axis=1)
+        
+        # Cada linha vira o intervalo [linha, linha + 1] de uma sequência crescente
+        acumulada = np.cumsum(pesos, axis=1)
+        acumulada /= totais[:, np.newaxis]
+        acumulada += linhas[:, np.newaxis]
+        
+        alvos = linhas + self.rng.random(num_linhas)
+        escolhas = np.searchsorted(acumulada.ravel(), alvos, side='right') - linhas * n
+        np.clip(escolhas, 0, n - 1, out=escolhas)
+        
+        # Corrige escolhas inválidas causadas por arredondamento nas bordas
+        invalidas = pesos[linhas, escolhas] <= 0
+        if invalidas.any():
+            escolhas[invalidas] = np.argmax(pesos[invalidas], axis=1)
+        
+        return escolhas
+    
     def _atualizar_feromonios(self, todas_rotas, custos_rotas):
-        """Atualiza os níveis de feromônio"""
+        """
+        Atualiza os níveis de feromônio em uma única passada vetorizada:
+        evaporação in-place e depósito simétrico de todas as formigas por scatter-add.
+        """
+        n = self.num_cidades
+        
         # Evaporação
-        for i in range(self.num_cidades):
-            for j in range(self.num_cidades):
-                self.feromonios[i][j] *= (1.0 - self.taxa_evaporacao)
-        
-        # Deposição de novo feromônio
-        for k in range(len(todas_rotas)):
-            rota = todas_rotas[k]
-            custo = custos_rotas[k]
-            
-            if custo == 0:
-                continue
-                
-            deposito = self.Q_constante / custo
-            
-            for i in range(len(rota)):
-                cidade_origem = rota[i]
-                cidade_destino = rota[(i + 1) % len(rota)]
-                
-                self.feromonios[cidade_origem][cidade_destino] += deposito
-                self.feromonios[cidade_destino][cidade_origem] += deposito
+        self.feromonios *= (1.0 - self.taxa_evaporacao)
+        
+        # Deposição de novo feromônio (rotas de custo zero não depositam)
+        rotas = np.asarray(todas_rotas, dtype=np.intp)
+        custos = np.asarray(custos_rotas, dtype=np.float64)
+        validas = custos != 0
+        if not validas.any():
+            return
+        
+        rotas = rotas[validas]
+        depositos = np.repeat(self.Q_constante / custos[validas], n)
+        origens = rotas.ravel()
+        destinos = np.roll(rotas, -1, axis=1).ravel()
+        
+        # Soma os depósitos por aresta distinta e atualiza só essas células da matriz,
+        # sem temporários n x n (no MMAS e no ACS deposita uma única formiga)
+        arestas = np.concatenate((origens * n + destinos, destinos * n + origens))
+        arestas_unicas, posicoes = np.unique(arestas, return_inverse=True)
+        acumulado = np.bincount(posicoes.ravel(), weights=np.concatenate((depositos, depositos)))
+        self.feromonios[arestas_unicas // n, arestas_unicas % n] += acumulado
+    
+    def _atualizar_feromonios_mmas(self, rotas_iteracao, custos_iteracao, iteracao):
+        """
+        Atualização do MMAS: apenas a melhor formiga da iteração (ou, periodicamente,
+        a melhor global) deposita, e as trilhas ficam limitadas a [τmin, τmax].
+        """
+        usar_melhor_global = (self.frequencia_melhor_global and
+                              (iteracao + 1) % self.frequencia_melhor_global == 0)
+        if usar_melhor_global:
+            rota, custo = self.melhor_rota, self.menor_distancia
+        else:
+            melhor = int(np.argmin(custos_iteracao))
+            rota, custo = rotas_iteracao[melhor], custos_iteracao[melhor]
+        
+        self._atualizar_feromonios([rota], [custo])
+        np.clip(self.feromonios, self.tau_min, self.tau_max, out=self.feromonios)
+    
+    def _atualizar_feromonios_acs(self):
+        """Atualização global do ACS: evapora e deposita apenas nas arestas da melhor rota global"""
+        rota = np.asarray(self.melhor_rota, dtype=np.intp)
+        proximas = np.roll(rota, -1)
+        deposito = self.Q_constante / self.menor_distancia
+        for a, b in ((rota, proximas), (proximas, rota)):
+            self.feromonios[a, b] = ((1.0 - self.taxa_evaporacao) * self.feromonios[a, b] +
+                                     self.taxa_evaporacao * deposito)
     
-    def resolver(self, cidade_inicial=None, verbose=True):
+    def resolver(self, cidade_inicial=None, verbose=True, variante=None, busca_local=None,
+                 checkpoint=None, criterio=None):
         """
         Executa o algoritmo ACO para resolver o TSP
         
         Args:
             cidade_inicial: Cidade inicial (nome ou None para usar a primeira)
             verbose: Se deve imprimir progresso
+            variante: 'AS', 'MMAS' ou 'ACS' (None usa a variante do construtor)
+            busca_local: Movimentos da BuscaLocal aplicados à melhor rota ao final
+                ('2opt', 'oropt' ou '2opt+oropt'; None desativa)
+            checkpoint: Checkpoint gravado a cada checkpoint.intervalo iterações; se o
+                arquivo já existir, a execução é retomada dele e continua exatamente
+                como a execução original continuaria
+            criterio: CriterioParada verificado ao fim de cada iteração (avaliações =
+                formigas construídas); num_iteracoes continua sendo o teto
             
         Returns:
             tuple: (melhor_rota_nomes, menor_distancia, historico_convergencia)
         """
-        # Define cidade inicial
-        if cidade_inicial is None:
-            cidade_inicial_idx = 0
-        else:
-            cidade_inicial_idx = self.cidade_para_indice.get(cidade_inicial, 0)
-        
-        # Reinicia variáveis de resultado
-        self.melhor_rota = None
-        self.menor_distancia = float('inf')
-        self.historico_convergencia = []
-        
+        # O progresso impresso é apenas um consumidor dos eventos de iterar; a execução já
+        # está preparada (checkpoint restaurado) quando iterar retorna
+        eventos = self.iterar(cidade_inicial, variante, busca_local, checkpoint, criterio)
         if verbose:
-            print(f"Resolvendo TSP para {self.num_cidades} cidades.")
-            print(f"Parâmetros: Formigas={self.num_formigas}, Iterações={self.num_iteracoes}")
-            print(f"Alfa={self.alfa}, Beta={self.beta}, Evaporação={self.taxa_evaporacao}, Q={self.Q_constante}")
-        
-        tempo_inicio = time.time()
-        
-        for iteracao in range(self.num_iteracoes):
-            rotas_iteracao = []
-            custos_iteracao = []
-            
-            # Cada formiga constrói uma rota
-            for _ in range(self.num_formigas):
-                rota = self._construir_solucao_formiga(cidade_inicial_idx)
-                
-                # Verifica se a rota é válida
-                if len(set(rota)) == self.num_cidades:
-                    custo = self.calcular_distancia_total(rota)
-                    rotas_iteracao.append(rota)
-                    custos_iteracao.append(custo)
-                    
-                    # Atualiza melhor solução global
-                    if custo < self.menor_distancia:
-                        self.menor_distancia = custo
-                        self.melhor_rota = list(rota)
-            
-            # Atualiza feromônios
-            if rotas_iteracao:
-                self._atualizar_feromonios(rotas_iteracao, custos_iteracao)
-            
-            self.historico_convergencia.append(self.menor_distancia)
-            
+            self._imprimir_parametros(checkpoint)
+        for evento in eventos:
             if verbose:
-                print(f"Iteração {iteracao+1}/{self.num_iteracoes} | Melhor Distância: {self.menor_distancia:.2f}")
+                print(f"Iteração {evento.iteracao}/{self.num_iteracoes} | Melhor Distância: {evento.custo:.2f}")
         
-        tempo_fim = time.time()
-        tempo_execucao = tempo_fim - tempo_inicio
+        if verbose:
+            if criterio is not None and criterio.parou:
+                print(f"Parada na iteração {len(self.historico_convergencia)}: {criterio.motivo}")
+            if self._busca_local_aplicada:
+                custo_anterior, custo, movimentos = self._busca_local_aplicada
+                print(f"Busca local {busca_local}: {custo_anterior:.2f} -> {custo:.2f} {movimentos}")
         
         # Converte rota de índices para nomes das cidades
         if self.melhor_rota:
@@ -225,7 +641,7 @@ class ACO_TSP:
                 print(f"\n--- Resultados do ACO para TSP ---")
                 print(f"Melhor rota encontrada: {melhor_rota_nomes} -> {melhor_rota_nomes[0]}")
                 print(f"Menor distância total: {self.menor_distancia:.2f}")
-                print(f"Tempo de execução: {tempo_execucao:.4f} segundos")
+                print(f"Tempo de execução: {self.tempo_execucao:.4f} segundos")
                 self._imprimir_convergencia()
             
             return melhor_rota_nomes, self.menor_distancia, self.historico_convergencia
@@ -234,6 +650,255 @@ class ACO_TSP:
                 print("Nenhuma rota válida foi encontrada.")
             return None, float('inf'), self.historico_convergencia
     
+    def iterar(self, cidade_inicial=None, variante=None, busca_local=None, checkpoint=None, criterio=None):
+        """
+        Executa o ACO como um iterador: produz um EventoIteracao ao fim de cada
+        iteração, sem imprimir nada. Os argumentos são os de resolver.
+        
+        A preparação (validação, reinício do resultado, restauração do checkpoint e
+        início do prazo do critério) acontece já na chamada; as iterações, à medida
+        que os eventos são consumidos.
+        
+        Sair do laço de consumo interrompe a execução entre duas iterações (os
+        processos das colônias são encerrados); melhor_rota, menor_distancia e
+        historico_convergencia ficam com o resultado até ali. A busca local final
+        só é aplicada quando o iterador é consumido até o fim.
+        
+        Yields:
+            EventoIteracao: iteração, menor distância, tempo decorrido e se melhorou
+        """
+        variante = variante or self.variante
+        if variante not in self.VARIANTES:
+            raise ValueError(f"Variante inválida: {variante}")
+        if self.num_processos and variante == 'ACS':
+            raise ValueError("A construção paralela não suporta o ACS (atualização local durante a construção)")
+        cidade_inicial_idx, iter_sem_melhora = self._preparar_execucao(cidade_inicial, variante, checkpoint, criterio)
+        return self._executar(cidade_inicial_idx, iter_sem_melhora, variante, busca_local, checkpoint, criterio)
+    
+    def _preparar_execucao(self, cidade_inicial, variante, checkpoint, criterio):
+        """
+        Prepara uma execução de iterar: reinicia o resultado e as estatísticas e
+        inicializa as trilhas da variante ou restaura o checkpoint.
+        
+        Returns:
+            tuple: (cidade_inicial_idx, iter_sem_melhora); a iteração de partida
+            fica em self._iteracao_inicial
+        """
+        # O prazo do critério de parada conta a preparação da execução
+        if criterio is not None:
+            criterio.iniciar()
+        
+        # Define cidade inicial
+        if cidade_inicial is None:
+            cidade_inicial_idx = 0
+        else:
+            cidade_inicial_idx = self.cidade_para_indice.get(cidade_inicial, 0)
+        
+        # Define a variante desta execução
+        self._variante_ativa = variante
+        if not self._num_formigas_informado:
+            self.num_formigas = self._formigas_padrao(variante)
+        
+        # Reinicia variáveis de resultado
+        self.melhor_rota = None
+        self.menor_distancia = float('inf')
+        self.historico_convergencia = []
+        self._busca_local_aplicada = None
+        self._reiniciar_estatisticas()
+        self.perfilador.reiniciar()
+        iter_sem_melhora = 0
+        iteracao_inicial = 0
+        
+        if checkpoint is not None and checkpoint.existe():
+            iteracao_inicial, iter_sem_melhora = self._restaurar_checkpoint(checkpoint, cidade_inicial_idx)
+            self._atualizar_info_escolha()
+        elif variante != 'AS':
+            # MMAS e ACS partem de trilhas escaladas pela rota do vizinho mais próximo
+            self._inicializar_feromonios_variante(cidade_inicial_idx)
+            self._atualizar_info_escolha()
+        self._iteracao_inicial = iteracao_inicial
+        return cidade_inicial_idx, iter_sem_melhora
+    
+    def _executar(self, cidade_inicial_idx, iter_sem_melhora, variante, busca_local, checkpoint, criterio):
+        """Gerador de iterar: executa as iterações e aplica a busca local"""
+        perfilador = self.perfilador
+        iteracao_inicial = self._iteracao_inicial
+        tempo_inicio = time.time()
+        
+        executor = self._iniciar_colonias() if self.num_processos else None
+        try:
+            for iteracao in range(iteracao_inicial, self.num_iteracoes):
+                rotas_iteracao = []
+                custos_iteracao = []
+                menor_distancia_anterior = self.menor_distancia
+                
+                if self.num_processos or self.modo_construcao == 'lote':
+                    with perfilador.fase('construcao'):
+                        if self.num_processos:
+                            # Blocos de formigas construídos (e avaliados) pelos processos das colônias
+                            rotas, custos = self._construir_solucoes_paralelo(executor, cidade_inicial_idx, iteracao)
+                        else:
+                            # Todas as formigas constroem suas rotas simultaneamente
+                            rotas = self._construir_solucoes_lote(cidade_inicial_idx)
+                    if not self.num_processos:
+                        with perfilador.fase('avaliacao'):
+                            custos = self.instancia.custo_rotas(rotas)
+                    rotas_iteracao = list(rotas)
+                    custos_iteracao = custos.tolist()
+                    perfilador.contar('rotas_alocadas', len(rotas))
+                    perfilador.contar('avaliacoes', len(rotas))
+                    
+                    # Atualiza melhor solução global
+                    melhor_formiga = int(np.argmin(custos))
+                    if custos[melhor_formiga] < self.menor_distancia:
+                        self.menor_distancia = float(custos[melhor_formiga])
+                        self.melhor_rota = rotas[melhor_formiga].tolist()
+                        perfilador.contar('melhorias')
+                else:
+                    # Cada formiga constrói uma rota
+                    for _ in range(self.num_formigas):
+                        with perfilador.fase('construcao'):
+                            rota = self._construir_solucao_formiga(cidade_inicial_idx)
+                        perfilador.contar('rotas_alocadas')
+                        
+                        # Verifica se a rota é válida
+                        if len(set(rota)) == self.num_cidades:
+                            with perfilador.fase('avaliacao'):
+                                custo = self.calcular_distancia_total(rota)
+                            perfilador.contar('avaliacoes')
+                            rotas_iteracao.append(rota)
+                            custos_iteracao.append(custo)
+                            
+                            # Atualiza melhor solução global
+                            if custo < self.menor_distancia:
+                                self.menor_distancia = custo
+                                self.melhor_rota = list(rota)
+                                perfilador.contar('melhorias')
+                
+                # Atualiza feromônios
+                with perfilador.fase('feromonio'):
+                    if rotas_iteracao:
+                        if variante == 'MMAS':
+                            if self.menor_distancia < menor_distancia_anterior:
+                                self._atualizar_limites_mmas(self.menor_distancia)
+                            self._atualizar_feromonios_mmas(rotas_iteracao, custos_iteracao, iteracao)
+                        elif variante == 'ACS':
+                            self._atualizar_feromonios_acs()
+                        else:
+                            self._atualizar_feromonios(rotas_iteracao, custos_iteracao)
+                
+                # MMAS: reinicializa as trilhas quando a busca estagna
+                iter_sem_melhora = 0 if self.menor_distancia < menor_distancia_anterior else iter_sem_melhora + 1
+                if variante == 'MMAS' and self.iteracoes_estagnacao and iter_sem_melhora >= self.iteracoes_estagnacao:
+                    self.feromonios.fill(self.tau_max)
+                    self.estatisticas['reinicios_feromonio'] += 1
+                    iter_sem_melhora = 0
+                
+                if rotas_iteracao:
+                    with perfilador.fase('feromonio'):
+                        self._atualizar_info_escolha()
+                
+                self.historico_convergencia.append(self.menor_distancia)
+                
+                if checkpoint is not None and checkpoint.deve_gravar(iteracao + 1):
+                    with perfilador.fase('checkpoint'):
+                        self._gravar_checkpoint(checkpoint, iteracao + 1, iter_sem_melhora, cidade_inicial_idx)
+                
+                avaliacoes = (iteracao + 1 - iteracao_inicial) * self.num_formigas
+                parar = criterio is not None and criterio.deve_parar(self.menor_distancia, avaliacoes)
+                
+                self.tempo_execucao = time.time() - tempo_inicio
+                yield EventoIteracao(iteracao + 1, self.menor_distancia, self.tempo_execucao,
+                                     self.menor_distancia < menor_distancia_anterior)
+                if parar:
+                    break
+            
+        finally:
+            self._encerrar_colonias(executor)
+        
+        # Polimento opcional da melhor rota com busca local
+        if busca_local and self.melhor_rota:
+            with perfilador.fase('busca_local'):
+                self._polir_melhor_rota(busca_local)
+        
+        self.tempo_execucao = time.time() - tempo_inicio
+    
+    def _imprimir_parametros(self, checkpoint):
+        """Imprime os parâmetros da execução iniciada por resolver"""
+        print(f"Resolvendo TSP para {self.num_cidades} cidades.")
+        print(f"Parâmetros: Variante={self._variante_ativa}, Formigas={self.num_formigas}, Iterações={self.num_iteracoes}")
+        print(f"Alfa={self.alfa}, Beta={self.beta}, Evaporação={self.taxa_evaporacao}, Q={self.Q_constante}")
+        if self.num_candidatos:
+            print(f"Listas de candidatos: k={self.num_candidatos}, Fallback={self.politica_fallback}")
+        if self.num_processos:
+            print(f"Construção paralela: {self.num_processos} processo(s)")
+        if self._iteracao_inicial:
+            print(f"Retomando do checkpoint {checkpoint.caminho} na iteração {self._iteracao_inicial + 1}")
+    
+    def _gravar_checkpoint(self, checkpoint, iteracoes_concluidas, iter_sem_melhora, cidade_inicial_idx):
+        """Grava o estado completo da execução após iteracoes_concluidas iterações"""
+        estado = {
+            'solver': 'ACO_TSP',
+            'variante': self._variante_ativa,
+            'num_cidades': self.num_cidades,
+            'cidade_inicial': cidade_inicial_idx,
+            'iteracoes_concluidas': iteracoes_concluidas,
+            'iter_sem_melhora': iter_sem_melhora,
+            'menor_distancia': self.menor_distancia,
+            'tau0': self.tau0,
+            'tau_min': self.tau_min,
+            'tau_max': self.tau_max,
+            'estatisticas': self.estatisticas,
+            'execucoes_colonias': self._execucoes_colonias,
+            'semente_colonias': self._semente_colonias,
+            'rng': self.rng.bit_generator.state,
+            'random': estado_random()
+        }
+        arrays = {'feromonios': self.feromonios,
+                  'historico_convergencia': np.asarray(self.historico_convergencia, dtype=np.float64)}
+        if self.melhor_rota is not None:
+            arrays['melhor_rota'] = np.asarray(self.melhor_rota, dtype=np.intp)
+        checkpoint.gravar(estado, **arrays)
+    
+    def _restaurar_checkpoint(self, checkpoint, cidade_inicial_idx):
+        """
+        Restaura o estado gravado por _gravar_checkpoint.
+        
+        Returns:
+            tuple: (iterações já concluídas, iterações sem melhora)
+        """
+        estado, arrays = checkpoint.carregar()
+        compativel = (estado.get('solver') == 'ACO_TSP' and estado['variante'] == self._variante_ativa and
+                      estado['num_cidades'] == self.num_cidades and estado['cidade_inicial'] == cidade_inicial_idx)
+        if not compativel:
+            raise ValueError(f"Checkpoint incompatível com esta execução: {checkpoint.caminho}")
+        
+        self.feromonios[:] = arrays['feromonios']
+        self.historico_convergencia = arrays['historico_convergencia'].tolist()
+        self.melhor_rota = arrays['melhor_rota'].tolist() if 'melhor_rota' in arrays else None
+        self.menor_distancia = estado['menor_distancia']
+        self.tau0, self.tau_min, self.tau_max = estado['tau0'], estado['tau_min'], estado['tau_max']
+        self.estatisticas = estado['estatisticas']
+        # _iniciar_colonias incrementa o contador: as chaves dos blocos voltam a ser as originais
+        self._execucoes_colonias = estado['execucoes_colonias'] - (1 if self.num_processos else 0)
+        self._semente_colonias = estado['semente_colonias']
+        self.rng.bit_generator.state = estado['rng']
+        restaurar_random(estado['random'])
+        return estado['iteracoes_concluidas'], estado['iter_sem_melhora']
+    
+    def _polir_melhor_rota(self, busca_local):
+        """Aplica a BuscaLocal à melhor rota encontrada, mantendo a cidade inicial"""
+        busca = BuscaLocal(self.instancia, busca_local)
+        rota, custo = busca.otimizar(self.melhor_rota)
+        self.perfilador.contar('avaliacoes', busca.avaliacoes)
+        self.perfilador.contar('movimentos_aceitos', sum(busca.movimentos_aplicados.values()))
+        
+        self._busca_local_aplicada = (self.menor_distancia, custo, busca.movimentos_aplicados)
+        if custo < self.menor_distancia:
+            self.menor_distancia = custo
+            self.melhor_rota = rota.tolist()
+            self.perfilador.contar('melhorias')
+    
     def _imprimir_convergencia(self):
         """Imprime resumo da convergência"""
         if not self.historico_convergencia:
@@ -256,20 +921,41 @@ class ACO_TSP:
         melhor_iteracao = self.historico_convergencia.index(melhor_valor) + 1
         print(f"\nMelhor distância atingida na iteração {melhor_iteracao}: {melhor_valor:.2f}")
     
-    def plotar_convergencia(self):
-        """Plota gráfico de convergência"""
+    def plotar_convergencia(self, caminho='results/convergencia_aco_tsp.png'):
+        """
+        Grava o gráfico de convergência (ver Relatorios.plotar_convergencia)
+        
+        Returns:
+            str: O caminho gravado, ou None sem histórico
+        """
         if not self.historico_convergencia:
             print("Nenhum histórico de convergência disponível.")
-            return
-            
-        plt.figure(figsize=(10, 6))
-        plt.plot(range(1, len(self.historico_convergencia) + 1), 
-                self.historico_convergencia, marker='o', linestyle='-', markersize=4)
-        plt.title(f"Convergência do ACO para TSP ({self.num_cidades} Cidades)")
-        plt.xlabel("Iteração")
-        plt.ylabel("Menor Distância Encontrada")
-        plt.xticks(range(0, len(self.historico_convergencia) + 1, 
-                        max(1, len(self.historico_convergencia)//10)))
-        plt.grid(True)
-        plt.show()
+            return None
+        
+        # Importado só aqui: importar o ACO não carrega o matplotlib
+        from Relatorios import plotar_convergencia
+        caminho = plotar_convergencia(self.historico_convergencia, caminho,
+                                      titulo=f"Convergência do ACO para TSP ({self.num_cidades} Cidades)",
+                                      rotulo_y="Menor Distância Encontrada")
+        print(f"Gráfico de convergência salvo em {caminho}")
+        return caminho
+
+
+_COLONIA = None
+
+
+def _inicializar_colonia(nomes_memorias, forma, tipos, configuracao):
+    # Cada processo liga-se às matrizes compartilhadas sem copiá-las, no tipo de origem
+    global _COLONIA
+    colonia = ACO_TSP.__new__(ACO_TSP)
+    colonia.__dict__.update(configuracao)
+    colonia._memorias_colonias = [shared_memory.SharedMemory(name=nome) for nome in nomes_memorias]
+    colonia.info_escolha = np.ndarray(forma, dtype=tipos[0], buffer=colonia._memorias_colonias[0].buf)
+    colonia.matriz_distancias = np.ndarray(forma, dtype=tipos[1], buffer=colonia._memorias_colonias[1].buf)
+    colonia.rng = None
+    colonia._reiniciar_estatisticas()
+    _COLONIA = colonia
+
 
+def _construir_bloco_colonia(chave, num_formigas, cidade_inicial_idx):
+    return _COLONIA._construir_bloco(chave, num_formigas, cidade_inicial_idx)
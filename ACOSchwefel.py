@@ -1,12 +1,15 @@
-import random
 import math
 import time
-import matplotlib.pyplot as plt
+import numpy as np
+from ACO import ACO_TSP  # mantido para compatibilidade com importações antigas
+from Schwefel import Schwefel
+from Perfilador import PERFILADOR_NULO
+from Eventos import EventoIteracao
 
 class ACO_Schwefel:
     def __init__(self, dimensoes, num_formigas_por_iter=20, num_iteracoes=100, 
                  tamanho_arquivo_solucoes=10, q_seletividade=0.1, xi_exploracao=0.85,
-                 limite_inferior=-500, limite_superior=500):
+                 limite_inferior=-500, limite_superior=500, semente=None, perfilador=None):
         """
         Inicializa o algoritmo ACO para otimização da função Schwefel
         
@@ -19,6 +22,10 @@ class ACO_Schwefel:
             xi_exploracao: Parâmetro de exploração (controla largura da busca)
             limite_inferior: Limite inferior das variáveis
             limite_superior: Limite superior das variáveis
+            semente: Semente do gerador aleatório
+            perfilador: Perfilador com o tempo das fases construcao (amostragem),
+                avaliacao, feromonio (atualização do arquivo) e checkpoint e os
+                contadores de cada execução (None usa o PerfiladorNulo, sem custo)
         """
         self.dimensoes = dimensoes
         self.num_formigas_por_iter = num_formigas_por_iter
@@ -28,71 +35,108 @@ class ACO_Schwefel:
         self.xi_exploracao = xi_exploracao
         self.limite_inferior = limite_inferior
         self.limite_superior = limite_superior
+        self.funcao_objetivo = Schwefel()
+        self.rng = np.random.default_rng(semente)
         
         # Variáveis para armazenar resultados
         self.melhor_solucao = None
         self.melhor_custo = float('inf')
         self.historico_convergencia = []
-        self.arquivo_solucoes = []
+        self.tempo_execucao = 0
+        self._iteracao_inicial = 0
+        self.perfilador = perfilador if perfilador is not None else PERFILADOR_NULO
+        
+        # Arquivo de soluções: matriz (k x dimensões) ordenada pelo custo, e os custos
+        self.arquivo_solucoes = np.empty((0, dimensoes))
+        self.custos_arquivo = np.empty(0)
     
     def funcao_schwefel(self, x_vetor):
-        """Calcula o valor da função Schwefel para um dado vetor x"""
-        d = len(x_vetor)
-        termo_constante = 418.9829 * d
-        soma_senos = 0
-        for xi in x_vetor:
-            soma_senos += xi * math.sin(math.sqrt(abs(xi)))
-        return termo_constante - soma_senos
+        """Calcula o valor da função Schwefel para um vetor x ou uma matriz (lote x dimensões)"""
+        return self.funcao_objetivo(x_vetor)
     
     def _inicializar_arquivo_solucoes(self):
-        """Inicializa o arquivo de soluções com amostras aleatórias"""
-        arquivo = []
-        for _ in range(self.tamanho_arquivo_solucoes):
-            solucao_aleatoria = [random.uniform(self.limite_inferior, self.limite_superior) 
-                               for _ in range(self.dimensoes)]
-            custo_solucao = self.funcao_schwefel(solucao_aleatoria)
-            arquivo.append({'vetor': solucao_aleatoria, 'custo': custo_solucao})
+        """Inicializa o arquivo de soluções com amostras aleatórias, ordenado pelo custo"""
+        arquivo = self.rng.uniform(self.limite_inferior, self.limite_superior,
+                                   (self.tamanho_arquivo_solucoes, self.dimensoes))
+        custos = self.funcao_schwefel(arquivo)
         
         # Ordena o arquivo: melhor custo (menor valor da função) primeiro
-        arquivo.sort(key=lambda s: s['custo'])
-        return arquivo
+        ordem = np.argsort(custos, kind='stable')
+        return arquivo[ordem], custos[ordem]
     
-    def _calcular_pesos_roleta(self, arquivo_solucoes):
+    def _calcular_pesos_roleta(self, tamanho_arquivo):
         """Calcula pesos para seleção por roleta (favorece melhores soluções no arquivo)"""
-        pesos = []
-        soma_pesos_nao_norm = 0
-        rank_max = len(arquivo_solucoes)
-
-        for i_rank in range(rank_max):  # i_rank=0 é a melhor solução
-            # Função de peso Gaussiana baseada no rank
-            expoente = -(i_rank * i_rank) / (2 * self.q_seletividade * self.q_seletividade * rank_max * rank_max)
-            peso = (1 / (self.q_seletividade * rank_max * math.sqrt(2 * math.pi))) * math.exp(expoente)
-            pesos.append(peso)
-            soma_pesos_nao_norm += peso
-
+        # Função de peso Gaussiana baseada no rank (rank 0 é a melhor solução)
+        ranks = np.arange(tamanho_arquivo)
+        largura = self.q_seletividade * tamanho_arquivo
+        pesos = np.exp(-(ranks * ranks) / (2 * largura * largura)) / (largura * math.sqrt(2 * math.pi))
+        
         # Normaliza os pesos para somarem 1
-        if soma_pesos_nao_norm > 0:
-            pesos_normalizados = [p / soma_pesos_nao_norm for p in pesos]
-        else:  # fallback se todos os pesos forem zero (improvável com a Gaussiana)
-            pesos_normalizados = [1.0 / rank_max] * rank_max
-        return pesos_normalizados
+        soma_pesos = pesos.sum()
+        if soma_pesos > 0:
+            return pesos / soma_pesos
+        return np.full(tamanho_arquivo, 1.0 / tamanho_arquivo)  # fallback se todos os pesos forem zero
+    
+    def _calcular_sigmas(self):
+        """
+        Desvio de amostragem de cada solução do arquivo como guia, por dimensão:
+        ξ vezes a distância absoluta média até as outras k-1 soluções.
+        
+        Returns:
+            np.ndarray: Matriz (k x dimensões) de desvios
+        """
+        arquivo = self.arquivo_solucoes
+        k = len(arquivo)
+        if k > 1:
+            # Soluções idênticas à guia contribuem com zero, como se fossem ignoradas
+            distancias = np.abs(arquivo[:, np.newaxis, :] - arquivo[np.newaxis, :, :]).sum(axis=1)
+            sigmas = self.xi_exploracao * distancias / (k - 1)
+        else:  # Se o arquivo tem apenas uma solução
+            sigmas = np.full(arquivo.shape, self.xi_exploracao * abs(self.limite_superior - self.limite_inferior) / 10.0)
+        
+        return np.maximum(sigmas, 1e-5)  # Evita sigma muito pequeno ou zero
+    
+    def _amostrar_formigas(self, pesos_roleta):
+        """
+        Gera as soluções de todas as formigas: sorteia as guias pela roleta e
+        amostra todas as dimensões com uma única chamada Gaussiana.
+        
+        Returns:
+            np.ndarray: Matriz (num_formigas x dimensões) de novas soluções
+        """
+        sigmas = self._calcular_sigmas()
+        guias = self.rng.choice(len(self.arquivo_solucoes), size=self.num_formigas_por_iter, p=pesos_roleta)
+        novas = self.rng.normal(self.arquivo_solucoes[guias], sigmas[guias])
+        
+        # Garante que os novos valores estejam dentro dos limites
+        return np.clip(novas, self.limite_inferior, self.limite_superior)
     
-    def _selecionar_solucao_guia(self, arquivo_solucoes, pesos_roleta):
-        """Seleciona uma solução 'guia' do arquivo usando o método da roleta"""
-        rand_val = random.random()
-        soma_acumulada_pesos = 0.0
-        for i, solucao_candidata in enumerate(arquivo_solucoes):
-            soma_acumulada_pesos += pesos_roleta[i]
-            if rand_val <= soma_acumulada_pesos:
-                return solucao_candidata
-        return arquivo_solucoes[-1]  # fallback: retorna a última (pior) do arquivo ordenado
+    def _atualizar_arquivo(self, novas, custos_novas):
+        """Junta as novas soluções ao arquivo e mantém as k melhores, ordenadas pelo custo"""
+        solucoes = np.concatenate([self.arquivo_solucoes, novas])
+        custos = np.concatenate([self.custos_arquivo, custos_novas])
+        
+        k = min(self.tamanho_arquivo_solucoes, len(custos))
+        if k < len(custos):
+            melhores = np.argpartition(custos, k - 1)[:k]
+        else:
+            melhores = np.arange(len(custos))
+        melhores = melhores[np.argsort(custos[melhores], kind='stable')]
+        
+        self.arquivo_solucoes = solucoes[melhores]
+        self.custos_arquivo = custos[melhores]
     
-    def resolver(self, verbose=True):
+    def resolver(self, verbose=True, checkpoint=None, criterio=None):
         """
         Executa o algoritmo ACO para otimização da função Schwefel
         
         Args:
             verbose: Se deve imprimir progresso
+            checkpoint: Checkpoint gravado a cada checkpoint.intervalo iterações (arquivo
+                de soluções, incumbente, histórico e gerador); se o arquivo já existir,
+                a execução é retomada dele
+            criterio: CriterioParada verificado ao fim de cada iteração; num_iteracoes
+                continua sendo o teto
             
         Returns:
             tuple: (melhor_solucao_vetor, melhor_custo, historico_convergencia)
@@ -103,94 +147,155 @@ class ACO_Schwefel:
             print(f"Arquivo={self.tamanho_arquivo_solucoes}, q={self.q_seletividade}, xi={self.xi_exploracao}")
             print(f"Limites: [{self.limite_inferior}, {self.limite_superior}]")
         
-        tempo_inicio = time.time()
-        
-        # 1. Inicialização
-        self.arquivo_solucoes = self._inicializar_arquivo_solucoes()
-        
-        # Melhor solução global inicial é a melhor do arquivo inicial
-        self.melhor_solucao = list(self.arquivo_solucoes[0]['vetor'])
-        self.melhor_custo = self.arquivo_solucoes[0]['custo']
-        self.historico_convergencia = [self.melhor_custo]
-        
-        # 2. Loop principal de iterações
-        for iteracao_idx in range(self.num_iteracoes):
-            novas_solucoes_geradas_nesta_iteracao = []
-
-            # Calcula os pesos para seleção das guias (uma vez por iteração)
-            pesos_para_roleta = self._calcular_pesos_roleta(self.arquivo_solucoes)
-
-            # Cada formiga gera uma nova solução
-            for _ in range(self.num_formigas_por_iter):
-                # a. Seleciona uma solução guia do arquivo_solucoes
-                solucao_guia_escolhida = self._selecionar_solucao_guia(self.arquivo_solucoes, pesos_para_roleta)
-                vetor_solucao_guia = solucao_guia_escolhida['vetor']
-
-                novo_vetor_solucao_formiga = []
-                # b. Para cada dimensão, amostra um novo valor
-                for d_idx in range(self.dimensoes):
-                    # i. Calcula o desvio padrão (sigma_d) para a dimensão 'd_idx'
-                    soma_diferencas_abs_dim = 0
-                    for outra_sol_no_arquivo in self.arquivo_solucoes:
-                        # Evita comparar com a própria solução guia se ela for a única no arquivo
-                        if outra_sol_no_arquivo['vetor'] != vetor_solucao_guia or len(self.arquivo_solucoes) == 1:
-                             soma_diferencas_abs_dim += abs(vetor_solucao_guia[d_idx] - outra_sol_no_arquivo['vetor'][d_idx])
-
-                    # Média das distâncias para as outras k-1 soluções no arquivo
-                    if len(self.arquivo_solucoes) > 1:
-                        sigma_d = self.xi_exploracao * (soma_diferencas_abs_dim / (len(self.arquivo_solucoes) - 1))
-                    else:  # Se o arquivo tem apenas uma solução
-                        sigma_d = self.xi_exploracao * abs(self.limite_superior - self.limite_inferior) / 10.0
-
-                    if sigma_d < 1e-5: 
-                        sigma_d = 1e-5  # Evita sigma muito pequeno ou zero
-
-                    # ii. Amostra novo valor de uma Gaussiana
-                    novo_valor_dimensao = random.gauss(vetor_solucao_guia[d_idx], sigma_d)
-
-                    # iii. Garante que o novo valor esteja dentro dos limites
-                    novo_valor_dimensao = max(self.limite_inferior, min(novo_valor_dimensao, self.limite_superior))
-                    novo_vetor_solucao_formiga.append(novo_valor_dimensao)
-
-                # Avalia a nova solução gerada pela formiga
-                custo_nova_solucao = self.funcao_schwefel(novo_vetor_solucao_formiga)
-                novas_solucoes_geradas_nesta_iteracao.append({'vetor': novo_vetor_solucao_formiga, 'custo': custo_nova_solucao})
-
-                # Atualiza a melhor solução global se a nova for melhor
-                if custo_nova_solucao < self.melhor_custo:
-                    self.melhor_custo = custo_nova_solucao
-                    self.melhor_solucao = list(novo_vetor_solucao_formiga)
-
-            # 3. Adiciona as novas soluções geradas ao arquivo
-            self.arquivo_solucoes.extend(novas_solucoes_geradas_nesta_iteracao)
-
-            # 4. Ordena o arquivo pelo custo e mantém o tamanho fixo
-            self.arquivo_solucoes.sort(key=lambda s: s['custo'])
-            self.arquivo_solucoes = self.arquivo_solucoes[:self.tamanho_arquivo_solucoes]
-
-            # Atualiza melhor global caso uma solução promovida no arquivo seja melhor
-            if self.arquivo_solucoes[0]['custo'] < self.melhor_custo:
-                self.melhor_custo = self.arquivo_solucoes[0]['custo']
-                self.melhor_solucao = list(self.arquivo_solucoes[0]['vetor'])
-
-            self.historico_convergencia.append(self.melhor_custo)
-            
+        # O progresso impresso é apenas um consumidor dos eventos de iterar; a execução já
+        # está preparada (checkpoint restaurado) quando iterar retorna
+        eventos = self.iterar(checkpoint, criterio)
+        if verbose and self._iteracao_inicial:
+            print(f"Retomando do checkpoint {checkpoint.caminho} na iteração {self._iteracao_inicial + 1}")
+        for evento in eventos:
             if verbose:
-                print(f"Iteração {iteracao_idx+1}/{self.num_iteracoes} | Melhor Custo: {self.melhor_custo:.6f}")
-        
-        tempo_fim = time.time()
-        tempo_execucao = tempo_fim - tempo_inicio
+                print(f"Iteração {evento.iteracao}/{self.num_iteracoes} | Melhor Custo: {evento.custo:.6f}")
         
         if verbose:
+            if criterio is not None and criterio.parou:
+                print(f"Parada na iteração {len(self.historico_convergencia) - 1}: {criterio.motivo}")
             print(f"\n--- Resultados do ACO para Função Schwefel ---")
             print(f"Melhor solução encontrada: {[round(x, 4) for x in self.melhor_solucao]}")
             print(f"Melhor custo: {self.melhor_custo:.6f}")
             print(f"Valor ótimo teórico: {418.9829 * self.dimensoes}")
-            print(f"Tempo de execução: {tempo_execucao:.4f} segundos")
+            print(f"Tempo de execução: {self.tempo_execucao:.4f} segundos")
             self._imprimir_convergencia()
         
         return self.melhor_solucao, self.melhor_custo, self.historico_convergencia
     
+    def iterar(self, checkpoint=None, criterio=None):
+        """
+        Executa o ACO_R como um iterador: produz um EventoIteracao ao fim de cada
+        iteração, sem imprimir nada. Os argumentos são os de resolver.
+        
+        A preparação (arquivo inicial ou restauração do checkpoint e início do
+        prazo do critério) acontece já na chamada; as iterações, à medida que os
+        eventos são consumidos. Sair do laço de consumo interrompe a execução
+        entre duas iterações; melhor_solucao, melhor_custo e historico_convergencia
+        ficam com o resultado até ali.
+        
+        Yields:
+            EventoIteracao: iteração, melhor custo, tempo decorrido e se melhorou
+        """
+        tempo_inicio = time.time()
+        self.funcao_objetivo.reiniciar_contador()
+        self.perfilador.reiniciar()
+        iteracao_inicial = 0
+        if criterio is not None:
+            criterio.iniciar()
+        
+        if checkpoint is not None and checkpoint.existe():
+            iteracao_inicial = self._restaurar_checkpoint(checkpoint)
+        else:
+            # 1. Inicialização
+            self.arquivo_solucoes, self.custos_arquivo = self._inicializar_arquivo_solucoes()
+            
+            # Melhor solução global inicial é a melhor do arquivo inicial
+            self.melhor_solucao = self.arquivo_solucoes[0].tolist()
+            self.melhor_custo = float(self.custos_arquivo[0])
+            self.historico_convergencia = [self.melhor_custo]
+        self._iteracao_inicial = iteracao_inicial
+        return self._executar(tempo_inicio, checkpoint, criterio)
+    
+    def _executar(self, tempo_inicio, checkpoint, criterio):
+        """Gerador de iterar: executa as iterações a partir de self._iteracao_inicial"""
+        perfilador = self.perfilador
+        
+        # Os pesos dependem apenas do rank, e o arquivo mantém tamanho fixo
+        pesos_para_roleta = self._calcular_pesos_roleta(len(self.arquivo_solucoes))
+        
+        # 2. Loop principal de iterações
+        for iteracao_idx in range(self._iteracao_inicial, self.num_iteracoes):
+            # Cada formiga gera uma nova solução a partir de uma guia do arquivo
+            with perfilador.fase('construcao'):
+                novas_solucoes = self._amostrar_formigas(pesos_para_roleta)
+            
+            # Avalia as soluções de todas as formigas em uma única chamada
+            with perfilador.fase('avaliacao'):
+                custos_novas = self.funcao_schwefel(novas_solucoes)
+            
+            # 3. Adiciona as novas soluções ao arquivo e mantém o tamanho fixo
+            with perfilador.fase('feromonio'):
+                self._atualizar_arquivo(novas_solucoes, custos_novas)
+            
+            # Atualiza a melhor solução global (o arquivo guarda a melhor já vista)
+            melhorou = self.custos_arquivo[0] < self.melhor_custo
+            if melhorou:
+                self.melhor_custo = float(self.custos_arquivo[0])
+                self.melhor_solucao = self.arquivo_solucoes[0].tolist()
+                perfilador.contar('melhorias')
+            
+            self.historico_convergencia.append(self.melhor_custo)
+            
+            if checkpoint is not None and checkpoint.deve_gravar(iteracao_idx + 1):
+                with perfilador.fase('checkpoint'):
+                    self._gravar_checkpoint(checkpoint, iteracao_idx + 1)
+            
+            parar = criterio is not None and criterio.deve_parar(self.melhor_custo, self.funcao_objetivo.avaliacoes)
+            
+            self.tempo_execucao = time.time() - tempo_inicio
+            yield EventoIteracao(iteracao_idx + 1, self.melhor_custo, self.tempo_execucao, bool(melhorou))
+            if parar:
+                break
+        
+        perfilador.contar('avaliacoes', self.funcao_objetivo.avaliacoes)
+        self.tempo_execucao = time.time() - tempo_inicio
+    
+    def get_estatisticas(self):
+        """
+        Retorna estatísticas da última execução.
+        
+        Returns:
+            dict: Estatísticas de execução e o perfil por fase (None sem perfilador)
+        """
+        return {
+            'tempo_execucao': self.tempo_execucao,
+            'num_iteracoes': max(0, len(self.historico_convergencia) - 1),
+            'num_formigas_por_iter': self.num_formigas_por_iter,
+            'avaliacoes': self.funcao_objetivo.avaliacoes,
+            'melhor_custo': self.melhor_custo,
+            'perfil': self.perfilador.get_estatisticas()
+        }
+    
+    def _gravar_checkpoint(self, checkpoint, iteracoes_concluidas):
+        """Grava o arquivo de soluções e o estado da execução após iteracoes_concluidas iterações"""
+        estado = {
+            'solver': 'ACO_Schwefel',
+            'iteracoes_concluidas': iteracoes_concluidas,
+            'melhor_custo': self.melhor_custo,
+            'avaliacoes': self.funcao_objetivo.avaliacoes,
+            'rng': self.rng.bit_generator.state
+        }
+        checkpoint.gravar(estado, arquivo_solucoes=self.arquivo_solucoes, custos_arquivo=self.custos_arquivo,
+                          melhor_solucao=np.asarray(self.melhor_solucao, dtype=np.float64),
+                          historico_convergencia=np.asarray(self.historico_convergencia, dtype=np.float64))
+    
+    def _restaurar_checkpoint(self, checkpoint):
+        """
+        Restaura o estado gravado por _gravar_checkpoint.
+        
+        Returns:
+            int: Iterações já concluídas
+        """
+        estado, arrays = checkpoint.carregar()
+        forma = (self.tamanho_arquivo_solucoes, self.dimensoes)
+        if estado.get('solver') != 'ACO_Schwefel' or arrays['arquivo_solucoes'].shape != forma:
+            raise ValueError(f"Checkpoint incompatível com esta execução: {checkpoint.caminho}")
+        
+        self.arquivo_solucoes = arrays['arquivo_solucoes']
+        self.custos_arquivo = arrays['custos_arquivo']
+        self.melhor_solucao = arrays['melhor_solucao'].tolist()
+        self.melhor_custo = estado['melhor_custo']
+        self.historico_convergencia = arrays['historico_convergencia'].tolist()
+        self.funcao_objetivo.avaliacoes = estado['avaliacoes']
+        self.rng.bit_generator.state = estado['rng']
+        return estado['iteracoes_concluidas']
+    
     def _imprimir_convergencia(self):
         """Imprime resumo da convergência"""
         if not self.historico_convergencia:
@@ -213,145 +318,21 @@ class ACO_Schwefel:
         melhor_iteracao = self.historico_convergencia.index(melhor_valor) + 1
         print(f"\nMelhor custo atingido na iteração {melhor_iteracao}: {melhor_valor:.6f}")
     
-    def plotar_convergencia(self):
-        """Plota gráfico de convergência"""
-        if not self.historico_convergencia:
-            print("Nenhum histórico de convergência disponível.")
-            return
-            
-        plt.figure(figsize=(10, 6))
-        plt.plot(range(1, len(self.historico_convergencia) + 1), 
-                self.historico_convergencia, marker='o', linestyle='-', markersize=4)
-        plt.title(f"Convergência ACO - Função Schwefel ({self.dimensoes}D)")
-        plt.xlabel("Iteração")
-        plt.ylabel("Melhor Valor da Função Schwefel")
-        plt.xticks(range(0, len(self.historico_convergencia) + 1, 
-                        max(1, len(self.historico_convergencia)//10)))
-        plt.grid(True)
-        plt.show()
-
-class ACO_TSP:
-    def __init__(self, grafo_adj, num_formigas=None, num_iteracoes=100, 
-                 alfa=1.0, beta=2.0, taxa_evaporacao=0.5, Q_constante=100.0):
+    def plotar_convergencia(self, caminho='results/convergencia_aco_schwefel.png'):
         """
-        Inicializa o algoritmo ACO para TSP
+        Grava o gráfico de convergência (ver Relatorios.plotar_convergencia)
         
-        Args:
-            grafo_adj: Dicionário de adjacência no formato {cidade: {vizinho: distancia, ...}}
-            num_formigas: Número de formigas (padrão: 10 * número de cidades)
-            num_iteracoes: Número de iterações
-            alfa: Parâmetro de influência do feromônio
-            beta: Parâmetro de influência da heurística
-            taxa_evaporacao: Taxa de evaporação do feromônio
-            Q_constante: Constante para deposição de feromônio
+        Returns:
+            str: O caminho gravado, ou None sem histórico
         """
-        self.grafo_adj = grafo_adj
-        self.num_cidades = len(grafo_adj)
-        self.cidades = list(grafo_adj.keys())
-        
-        # Parâmetros do algoritmo
-        self.num_formigas = num_formigas if num_formigas else 10 * self.num_cidades
-        self.num_iteracoes = num_iteracoes
-        self.alfa = alfa
-        self.beta = beta
-        self.taxa_evaporacao = taxa_evaporacao
-        self.Q_constante = Q_constante
-        
-        # Converte lista de adjacência para matriz de distâncias para facilitar cálculos
-        self.matriz_distancias = self._converter_para_matriz()
-        
-        # Inicializa feromônios
-        self._inicializar_feromonios()
-        
-        # Variáveis para armazenar resultados
-        self.melhor_rota = None
-        self.menor_distancia = float('inf')
-        self.historico_convergencia = []
-    
-    def _converter_para_matriz(self):
-        """Converte dicionário de adjacência para matriz de distâncias"""
-        matriz = [[float('inf') for _ in range(self.num_cidades)] for _ in range(self.num_cidades)]
-        
-        # Mapeia cidades para índices
-        self.cidade_para_indice = {cidade: i for i, cidade in enumerate(self.cidades)}
-        self.indice_para_cidade = {i: cidade for i, cidade in enumerate(self.cidades)}
-        
-        # Preenche a matriz
-        for i in range(self.num_cidades):
-            matriz[i][i] = 0  # Distância para si mesmo é 0
-        
-        for cidade, vizinhos in self.grafo_adj.items():
-            i = self.cidade_para_indice[cidade]
-            for vizinho, distancia in vizinhos.items():
-                j = self.cidade_para_indice[vizinho]
-                matriz[i][j] = distancia
-                
-        return matriz
-    
-    def _inicializar_feromonios(self):
-        """Inicializa matriz de feromônios"""
-        feromonio_inicial = 1.0 / (self.num_cidades * self.num_cidades)
-        self.feromonios = [[feromonio_inicial for _ in range(self.num_cidades)] 
-                          for _ in range(self.num_cidades)]
-    
-    def calcular_distancia_total(self, rota):
-        """Calcula a distância total de uma rota"""
-        distancia = 0
-        num_cidades_rota = len(rota)
-        
-        for i in range(num_cidades_rota):
-            cidade_atual = rota[i]
-            proxima_cidade = rota[(i + 1) % num_cidades_rota]
-            distancia += self.matriz_distancias[cidade_atual][proxima_cidade]
-            
-        return distancia
-    
-    def _construir_solucao_formiga(self, cidade_inicial_idx):
-        """Constrói uma solução (rota) para uma formiga"""
-        rota = [cidade_inicial_idx]
-        cidades_disponiveis = list(range(self.num_cidades))
-        cidades_disponiveis.remove(cidade_inicial_idx)
-        
-        cidade_atual = cidade_inicial_idx
+        if not self.historico_convergencia:
+            print("Nenhum histórico de convergência disponível.")
+            return None
         
-        while cidades_disponiveis:
-            probabilidades = []
-            soma_denominador = 0.0
-            
-            # Calcula probabilidades para cada cidade disponível
-            for proxima_cidade in cidades_disponiveis:
-                if self.matriz_distancias[cidade_atual][proxima_cidade] > 0:
-                    fator_feromonio = math.pow(self.feromonios[cidade_atual][proxima_cidade], self.alfa)
-                    fator_heuristico = math.pow(1.0 / self.matriz_distancias[cidade_atual][proxima_cidade], self.beta)
-                    valor_prob = fator_feromonio * fator_heuristico
-                    probabilidades.append({'cidade': proxima_cidade, 'prob': valor_prob})
-                    soma_denominador += valor_prob
-                else:
-                    probabilidades.append({'cidade': proxima_cidade, 'prob': 0})
-            
-            # Seleciona próxima cidade
-            proxima_cidade = None
-            if soma_denominador > 0:
-                # Normaliza probabilidades
-                for item in probabilidades:
-                    item['prob'] /= soma_denominador
-                
-                # Seleção por roleta
-                rand_val = random.random()
-                soma_acumulada = 0.0
-                probabilidades.sort(key=lambda x: x['prob'], reverse=True)
-                
-                for item in probabilidades:
-                    soma_acumulada += item['prob']
-                    if rand_val <= soma_acumulada:
-                        proxima_cidade = item['cidade']
-                        break
-            
-            # Fallback: escolha aleatória se necessário
-            if proxima_cidade is None and cidades_disponiveis:
-                proxima_cidade = random.choice(cidades_disponiveis)
-            
-            if proxima_cidade is not None:
-                rota.append(proxima_cidade)
-                cidades_disponiveis.remove(proxima_cidade)
-         
+        # Importado só aqui: importar o ACO_Schwefel não carrega o matplotlib
+        from Relatorios import plotar_convergencia
+        caminho = plotar_convergencia(self.historico_convergencia, caminho,
+                                      titulo=f"Convergência ACO - Função Schwefel ({self.dimensoes}D)",
+                                      rotulo_y="Melhor Valor da Função Schwefel")
+        print(f"Gráfico de convergência salvo em {caminho}")
+        return caminho
@@ -1,123 +1,467 @@
 import numpy as np
+import os
 import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from InstanciaTSP import InstanciaTSP
+from BuscaLocal import BuscaLocal
+from Checkpoint import estado_random, restaurar_random
+from Perfilador import PERFILADOR_NULO, Perfilador
+from Schwefel import Schwefel
 
 class AlgoritmoGenetico:
-    def __init__(self, grafo, tamanho=100, geracoes=500, taxa_de_mutacao=0.01, cidade_inicial=None):
-        self.grafo = grafo
+    OPERADORES_CROSSOVER = ('ox', 'pmx', 'erx')
+
+    def __init__(self, grafo, tamanho=100, geracoes=500, taxa_de_mutacao=0.01, cidade_inicial=None, semente=None,
+                 operador_crossover='ox', perfilador=None):
+        # Sem grafo o AG atende apenas ao problema contínuo (iniciar_continuo)
+        self.instancia = InstanciaTSP.de_grafo(grafo) if grafo is not None else None
+        self.grafo = self.instancia.grafo_adj if self.instancia is not None else None
         self.tamanho_pop = tamanho
         self.geracoes = geracoes
         self.taxa_de_mutacao = taxa_de_mutacao
         self.cidade_inicial = cidade_inicial
+        self.rng = np.random.default_rng(semente)
+        # Gerador do módulo random derivado do NumPy: operadores por indivíduo ficam reprodutíveis
+        self.random = random.Random(int(self.rng.integers(2**63)))
+        # Função de Schwefel vetorizada usada por iniciar_continuo
+        self.funcao_objetivo = Schwefel()
+        # Incumbente da última execução: melhor indivíduo já avaliado
+        self.melhor_caminho, self.melhor_custo = None, float('inf')
+        self.tempo_execucao = 0
+        # Perfilador das fases avaliacao, selecao, crossover, mutacao, migracao, busca_local e checkpoint
+        # (PerfiladorNulo por padrão, sem custo; em iniciar_ilhas soma os perfis de todas as ilhas)
+        self.perfilador = perfilador if perfilador is not None else PERFILADOR_NULO
+
+        # Operadores de crossover para permutações: OX (order), PMX (partially mapped) e ERX (edge recombination)
+        if operador_crossover not in self.OPERADORES_CROSSOVER:
+            raise ValueError(f'Operador de crossover inválido: {operador_crossover}')
+        self.operador_crossover = operador_crossover
+        self.__operadores = {'pmx': self.__crossover_pmx, 'erx': self.__crossover_erx}
+
+    def iniciar(self, busca_local=None, checkpoint=None, criterio=None):
+        # Com checkpoint, evolui em trechos de checkpoint.intervalo gerações e grava o estado ao fim
+        # de cada trecho; se o arquivo já existir, retoma dele com os mesmos geradores.
+        # Com criterio (CriterioParada), verifica a parada a cada geração; geracoes continua sendo o teto
+        tempo_inicio = time.perf_counter()
+        perfilador = self.perfilador
+        perfilador.reiniciar()
+        self.melhor_caminho, self.melhor_custo = None, float('inf')
+        if checkpoint is not None and checkpoint.existe():
+            populacao, melhores = self.__restaurar_checkpoint(checkpoint)
+        else:
+            populacao, melhores = self._populacao_inicial(), []
+
+        geracao_inicial = len(melhores)
+        if criterio is not None:
+            criterio.iniciar()
+        while len(melhores) < self.geracoes:
+            geracoes = self.geracoes - len(melhores)
+            if checkpoint is not None:
+                geracoes = min(geracoes, checkpoint.intervalo)
+            if criterio is not None:
+                geracoes = 1
+            populacao, melhores_trecho = self._evoluir(populacao, geracoes)
+            melhores.extend(melhores_trecho)
+            if checkpoint is not None and (checkpoint.deve_gravar(len(melhores)) or len(melhores) == self.geracoes):
+                with perfilador.fase('checkpoint'):
+                    self.__gravar_checkpoint(checkpoint, populacao, melhores)
+            avaliacoes = (len(melhores) - geracao_inicial) * self.tamanho_pop
+            if criterio is not None and criterio.deve_parar(self.melhor_custo, avaliacoes):
+                break
 
-    def iniciar(self):
-        cidades = list(self.grafo.keys())
-        populacao = []
-        for _ in range(self.tamanho_pop):
-            perm = list(np.random.permutation([c for c in cidades if c != self.cidade_inicial]))
-            perm = [self.cidade_inicial] + perm  # força o início com a cidade inicial
-            populacao.append(perm)
-        
-        for i in range(self.geracoes):
-
-            custos = list(self.__custo_da_rota(p, self.grafo) for p in populacao)
-            nova_pop = []
-
-            for _ in range(self.tamanho_pop):
-                p1 = self.__selecionar_pais(populacao, custos)
-                p2 = self.__selecionar_pais(populacao, custos)
-
-                filho = self.__crossover(p1,p2)
-                filho = self.__mutacao(filho, self.taxa_de_mutacao)
-                nova_pop.append(filho)
-
-        custos = [self.__custo_da_rota(ind, self.grafo) for ind in populacao]
-        melhor_ind = np.min(custos)
-        print(f'Melhor caminho: {populacao[melhor_ind]} | Custo: {custos[melhor_ind]}')
-        return populacao[melhor_ind], custos[melhor_ind], custos
+        # Melhor entre a população final e o melhor indivíduo já avaliado (incumbente)
+        with perfilador.fase('avaliacao'):
+            custos = self.__custo_populacao(populacao)
+        perfilador.contar('avaliacoes', len(custos))
+        melhor_ind = np.argmin(custos)
+        melhor_caminho, melhor_custo = populacao[melhor_ind], float(custos[melhor_ind])
+        if self.melhor_custo < melhor_custo:
+            melhor_caminho, melhor_custo = self.melhor_caminho, self.melhor_custo
+
+        # Polimento opcional do melhor indivíduo ('2opt', 'oropt' ou '2opt+oropt')
+        if busca_local:
+            busca = BuscaLocal(self.instancia, busca_local)
+            with perfilador.fase('busca_local'):
+                caminho_polido, custo_polido = busca.otimizar(melhor_caminho)
+            perfilador.contar('avaliacoes', busca.avaliacoes)
+            perfilador.contar('movimentos_aceitos', sum(busca.movimentos_aplicados.values()))
+            if custo_polido < melhor_custo:
+                melhor_caminho, melhor_custo = caminho_polido, custo_polido
+
+        self.tempo_execucao = time.perf_counter() - tempo_inicio
+        melhor_rota = self.instancia.para_cidades(melhor_caminho)
+        print(f'Melhor caminho: {melhor_rota} | Custo: {melhor_custo}')
+        return melhor_rota, melhor_custo, melhores
     
-    def iniciar_continuo(self, dim=5, intervalo=(-500, 500)):
-        # Gera população contínua com valores aleatórios entre -500 e 500
-        populacao = [np.random.uniform(intervalo[0], intervalo[1], size=dim) for _ in range(self.tamanho_pop)]
+    def iniciar_ilhas(self, num_ilhas=4, intervalo_migracao=10, num_migrantes=2, topologia='anel',
+                      num_processos=None, busca_local=None):
+        # Modelo de ilhas: populações independentes evoluem em paralelo e trocam os melhores indivíduos
+        # a cada intervalo_migracao gerações, em anel ou para ilhas sorteadas
+        if topologia not in ('anel', 'aleatoria'):
+            raise ValueError(f'Topologia inválida: {topologia}')
+        tempo_inicio = time.perf_counter()
+        perfilador = self.perfilador
+        perfilador.reiniciar()
+        self.melhor_caminho, self.melhor_custo = None, float('inf')
+
+        # Cada ilha tem seus próprios geradores, derivados da semente: o resultado não depende dos processos
+        sementes = np.random.SeedSequence(int(self.rng.integers(2**63))).spawn(num_ilhas)
+        geradores = [np.random.default_rng(s) for s in sementes]
+        populacoes = [self._populacao_inicial(g) for g in geradores]
+        estados = [(g.bit_generator.state, random.Random(int(g.integers(2**63))).getstate()) for g in geradores]
+
+        # Com perfilador ativo, cada processo mede suas ilhas e os tempos são somados aqui
+        # (em paralelo, a soma das fases pode passar do tempo de parede)
+        parametros = {'tamanho': self.tamanho_pop, 'taxa_de_mutacao': self.taxa_de_mutacao,
+                      'cidade_inicial': self.cidade_inicial, 'operador_crossover': self.operador_crossover,
+                      'perfilador': Perfilador() if perfilador.ativo else None}
         melhores = []
+        geracoes_restantes = self.geracoes
 
-        for _ in range(self.geracoes):
-            custos = [self.__schwefel(ind) for ind in populacao]
-            nova_pop = []
+        if num_processos == 1:
+            _inicializar_ilha(self.instancia, parametros)
+            executor = None
+        else:
+            executor = ProcessPoolExecutor(max_workers=num_processos or min(num_ilhas, os.cpu_count() or 1),
+                                           initializer=_inicializar_ilha, initargs=(self.instancia, parametros))
+
+        try:
+            while geracoes_restantes > 0:
+                geracoes = min(intervalo_migracao, geracoes_restantes)
+                tarefas = [(populacoes[k], estados[k][0], estados[k][1], geracoes) for k in range(num_ilhas)]
+                if executor is None:
+                    resultados = [_evoluir_ilha(*t) for t in tarefas]
+                else:
+                    resultados = list(executor.map(_evoluir_ilha, *zip(*tarefas)))
+
+                populacoes = [r[0] for r in resultados]
+                estados = [(r[4], r[5]) for r in resultados]
+                melhores.extend(np.min([r[1] for r in resultados], axis=0).tolist())
+                geracoes_restantes -= geracoes
+
+                # Incumbente global: o melhor indivíduo avaliado em qualquer ilha, mesmo que se perca depois
+                for _, _, caminho, custo, _, _, perfil in resultados:
+                    if custo < self.melhor_custo:
+                        self.melhor_caminho, self.melhor_custo = caminho, custo
+                    if perfil is not None:
+                        perfilador.acumular(perfil)
+
+                if geracoes_restantes > 0 and num_ilhas > 1:
+                    with perfilador.fase('migracao'):
+                        self.__migrar(populacoes, num_migrantes, topologia)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        # Melhor entre as populações finais e o incumbente das ilhas
+        populacao = np.concatenate(populacoes)
+        with perfilador.fase('avaliacao'):
+            custos = self.__custo_populacao(populacao)
+        perfilador.contar('avaliacoes', len(custos))
+        melhor_ind = np.argmin(custos)
+        melhor_caminho, melhor_custo = populacao[melhor_ind], float(custos[melhor_ind])
+        if self.melhor_custo < melhor_custo:
+            melhor_caminho, melhor_custo = self.melhor_caminho, self.melhor_custo
+
+        if busca_local:
+            busca = BuscaLocal(self.instancia, busca_local)
+            with perfilador.fase('busca_local'):
+                caminho_polido, custo_polido = busca.otimizar(melhor_caminho)
+            perfilador.contar('avaliacoes', busca.avaliacoes)
+            perfilador.contar('movimentos_aceitos', sum(busca.movimentos_aplicados.values()))
+            if custo_polido < melhor_custo:
+                melhor_caminho, melhor_custo = caminho_polido, custo_polido
+
+        self.tempo_execucao = time.perf_counter() - tempo_inicio
+        melhor_rota = self.instancia.para_cidades(melhor_caminho)
+        print(f'Melhor caminho ({num_ilhas} ilhas): {melhor_rota} | Custo: {melhor_custo}')
+        return melhor_rota, melhor_custo, melhores
+
+    def __gravar_checkpoint(self, checkpoint, populacao, melhores):
+        estado = {'solver': 'AlgoritmoGenetico', 'melhores': melhores, 'melhor_custo': self.melhor_custo,
+                  'rng': self.rng.bit_generator.state, 'random': estado_random(self.random)}
+        checkpoint.gravar(estado, populacao=populacao, melhor_caminho=self.melhor_caminho)
+
+    def __restaurar_checkpoint(self, checkpoint):
+        estado, arrays = checkpoint.carregar()
+        populacao = arrays['populacao']
+        if estado.get('solver') != 'AlgoritmoGenetico' or populacao.shape != (self.tamanho_pop, self.instancia.num_cidades):
+            raise ValueError(f'Checkpoint incompatível com esta execução: {checkpoint.caminho}')
+        self.rng.bit_generator.state = estado['rng']
+        restaurar_random(estado['random'], self.random)
+        self.melhor_caminho, self.melhor_custo = arrays['melhor_caminho'], estado['melhor_custo']
+        return populacao, estado['melhores']
+
+    def __migrar(self, populacoes, num_migrantes, topologia):
+        # Os melhores de cada ilha substituem os piores da ilha destino
+        num_ilhas = len(populacoes)
+        if topologia == 'anel':
+            destinos = [(k + 1) % num_ilhas for k in range(num_ilhas)]
+        else:
+            destinos = [(k + 1 + int(self.rng.integers(num_ilhas - 1))) % num_ilhas for k in range(num_ilhas)]
+
+        custos = [self.__custo_populacao(p) for p in populacoes]
+        migrantes = [p[np.argsort(c, kind='stable')[:num_migrantes]] for p, c in zip(populacoes, custos)]
+        for origem, destino in enumerate(destinos):
+            piores = np.argsort(custos[destino], kind='stable')[::-1][:num_migrantes]
+            populacoes[destino][piores] = migrantes[origem]
+
+    def _populacao_inicial(self, rng=None):
+        inicial = self.cidade_inicial if self.cidade_inicial is not None else self.instancia.cidades[0]
+        idx_inicial = self.instancia.cidade_para_indice[inicial]
+        demais = np.array([i for i in range(self.instancia.num_cidades) if i != idx_inicial], dtype=np.intp)
+
+        # População como uma única matriz (tamanho_pop x n) de índices compactos (uint16/int32);
+        # a coluna 0 fixa a cidade inicial
+        populacao = np.empty((self.tamanho_pop, self.instancia.num_cidades),
+                             dtype=self.instancia.tipo_indices(self.instancia.num_cidades))
+        populacao[:, 0] = idx_inicial
+        rng = rng if rng is not None else self.rng
+        populacao[:, 1:] = demais[np.argsort(rng.random((self.tamanho_pop, len(demais))), axis=1)]
+        return populacao
+
+    def _evoluir(self, populacao, geracoes):
+        # Evolui a população; retorna a população final e o melhor custo de cada geração
+        melhores = []
+        perfilador = self.perfilador
+
+        for i in range(geracoes):
+
+            with perfilador.fase('avaliacao'):
+                custos = self.__custo_populacao(populacao)
+            nova_pop = np.empty_like(populacao)
+            nova_pop[:, 0] = populacao[:, 0]
+
+            # Incumbente: o melhor indivíduo avaliado até aqui, mesmo que se perca na evolução
+            melhor_ind = int(np.argmin(custos))
+            if custos[melhor_ind] < self.melhor_custo:
+                self.melhor_caminho, self.melhor_custo = populacao[melhor_ind].copy(), float(custos[melhor_ind])
+                perfilador.contar('melhorias')
+
+            with perfilador.fase('selecao'):
+                idx_pais1, idx_pais2 = self.__selecionar_pais(custos)
+
+            # Crossover e mutação atuam só sobre as cidades após a inicial
+            with perfilador.fase('crossover'):
+                filhos = self.__crossover_lote(populacao[idx_pais1, 1:], populacao[idx_pais2, 1:])
+            with perfilador.fase('mutacao'):
+                for k in range(self.tamanho_pop):
+                    nova_pop[k, 1:] = self.__mutacao(filhos[k], self.taxa_de_mutacao)
 
-            for _ in range(self.tamanho_pop):
-                p1 = self.__selecionar_pais(populacao, custos)
-                p2 = self.__selecionar_pais(populacao, custos)
+            # Rotas alocadas na geração: nova população, filhos e cópias da mutação
+            perfilador.contar('avaliacoes', len(custos))
+            perfilador.contar('rotas_alocadas', 3 * self.tamanho_pop)
+            populacao = nova_pop
+            melhores.append(float(custos.min()))
+
+        return populacao, melhores
+
+    def iniciar_continuo(self, dim=5, intervalo=(-500, 500), criterio=None):
+        # Gera população contínua com valores aleatórios no intervalo; todos os sorteios usam self.rng,
+        # então a semente torna a execução reprodutível
+        tempo_inicio = time.perf_counter()
+        perfilador = self.perfilador
+        perfilador.reiniciar()
+        populacao = self.rng.uniform(intervalo[0], intervalo[1], size=(self.tamanho_pop, dim))
+        melhores = []
+        self.funcao_objetivo.reiniciar_contador()
+        melhor_solucao, melhor_custo = None, float('inf')
+        if criterio is not None:
+            criterio.iniciar()
 
-                filho = self.__crossover_continuo(p1, p2)
-                filho = self.__mutacao_continua(filho, self.taxa_de_mutacao, intervalo)
-                nova_pop.append(filho)
+        for _ in range(self.geracoes):
+            # Avalia a geração inteira em uma única chamada
+            with perfilador.fase('avaliacao'):
+                custos = self.funcao_objetivo(populacao)
+            melhor_idx = int(np.argmin(custos))
+            if custos[melhor_idx] < melhor_custo:
+                melhor_solucao, melhor_custo = populacao[melhor_idx].copy(), float(custos[melhor_idx])
+                perfilador.contar('melhorias')
+            melhores.append(float(custos[melhor_idx]))
+            if criterio is not None and criterio.deve_parar(melhor_custo, self.funcao_objetivo.avaliacoes):
+                break
+            nova_pop = np.empty_like(populacao)
+            with perfilador.fase('selecao'):
+                idx_pais1, idx_pais2 = self.__selecionar_pais(custos)
+
+            # Crossover e mutação intercalados por indivíduo
+            crossover, mutacao = perfilador.fase('crossover'), perfilador.fase('mutacao')
+            for k in range(self.tamanho_pop):
+                with crossover:
+                    filho = self.__crossover_continuo(populacao[idx_pais1[k]], populacao[idx_pais2[k]])
+                with mutacao:
+                    nova_pop[k] = self.__mutacao_continua(filho, self.taxa_de_mutacao, intervalo)
 
             populacao = nova_pop
-            melhores.append(np.min(custos))
 
-        custos = [self.__schwefel(ind) for ind in populacao]
-        melhor_idx = np.argmin(custos)
-        melhor_solucao = populacao[melhor_idx]
-        melhor_custo = custos[melhor_idx]
+        # Melhor entre a população final e o incumbente (após uma parada a população já foi avaliada)
+        if criterio is None or not criterio.parou:
+            with perfilador.fase('avaliacao'):
+                custos = self.funcao_objetivo(populacao)
+            melhor_idx = int(np.argmin(custos))
+            if custos[melhor_idx] < melhor_custo:
+                melhor_solucao, melhor_custo = populacao[melhor_idx], float(custos[melhor_idx])
+        perfilador.contar('avaliacoes', self.funcao_objetivo.avaliacoes)
+        self.tempo_execucao = time.perf_counter() - tempo_inicio
         print(f'Melhor vetor: {melhor_solucao} | Custo: {melhor_custo}')
         return melhor_solucao, melhor_custo, melhores
 
+    def get_estatisticas(self):
+        # Estatísticas da última execução de iniciar, iniciar_ilhas ou iniciar_continuo
+        return {
+            'tempo_execucao': self.tempo_execucao,
+            'tamanho_pop': self.tamanho_pop,
+            'geracoes': self.geracoes,
+            'operador_crossover': self.operador_crossover,
+            'perfil': self.perfilador.get_estatisticas()
+        }
 
-    def __custo_da_rota(self, caminho, grafo):
-        custo = 0
-        for i in range(len(caminho)):
-            origem = caminho[i]
-            destino = caminho[(i+1)%len(caminho)]
-
-            for vizinho, peso in grafo[origem].items():
-                if vizinho == destino:
-                    custo += peso
-            
-        return custo
+    def __custo_populacao(self, populacao):
+        # Custo de toda a geração: um gather sobre a matriz de distâncias e soma por linha
+        return self.instancia.custo_rotas(populacao)
     
-    def __selecionar_pais(self, populacao, custos):
-        candidatos = random.sample(list(enumerate(custos)), 5)
-        return populacao[min(candidatos, key=lambda x:x[1])[0]]
+    def __selecionar_pais(self, custos, tamanho_torneio=5):
+        # Todos os torneios da geração de uma vez: matriz (2·pop x 5) de índices e argmin sobre os custos
+        torneios = self.rng.integers(0, len(custos), size=(2 * self.tamanho_pop, tamanho_torneio))
+        vencedores = torneios[np.arange(len(torneios)), np.argmin(custos[torneios], axis=1)]
+        return vencedores[:self.tamanho_pop], vencedores[self.tamanho_pop:]
     
-    def __crossover(self, p1, p2):
+    def __cortes(self, tamanho):
+        return sorted(self.random.sample(range(tamanho), 2))
+
+    def __crossover_lote(self, pais1, pais2):
+        # OX é vetorizado sobre todos os pares; PMX e ERX são lineares por par
+        if self.operador_crossover == 'ox':
+            return self.__crossover_ox_lote(pais1, pais2)
+        operador = self.__operadores[self.operador_crossover]
+        return np.array([operador(p1, p2) for p1, p2 in zip(pais1, pais2)], dtype=pais1.dtype)
+
+    def __crossover_ox_lote(self, pais1, pais2):
+        # Order crossover de todos os pares de uma vez
+        num_pares, len_pais = pais1.shape
+        linhas = np.arange(num_pares)[:, np.newaxis]
+        colunas = np.arange(len_pais)
+
+        a = self.rng.integers(0, len_pais, num_pares)
+        b = self.rng.integers(0, len_pais - 1, num_pares)
+        b += b >= a
+        a, b = np.minimum(a, b)[:, np.newaxis], np.maximum(a, b)[:, np.newaxis]
+
+        no_segmento = np.zeros((num_pares, self.instancia.num_cidades), dtype=bool)
+        no_segmento[linhas, pais1] = (colunas >= a) & (colunas < b)
+
+        # Genes de p2 fora do segmento vêm primeiro, preservando a ordem de p2
+        ordem = np.argsort(no_segmento[linhas, pais2], axis=1, kind='stable')
+        genes_p2 = np.take_along_axis(pais2, ordem, axis=1)
+
+        # A partir de b: primeiro as posições livres, depois as do segmento (a..b-1)
+        posicoes = (b + colunas) % len_pais
+        valores = np.where(colunas < len_pais - (b - a), genes_p2, np.take_along_axis(pais1, posicoes, axis=1))
+
+        filhos = np.empty_like(pais1)
+        filhos[linhas, posicoes] = valores
+        return filhos
+
+    def __crossover_pmx(self, p1, p2):
+        # Partially mapped crossover: copia o segmento de p1 sobre p2 por trocas, com um vetor
+        # de posições indexado pelo gene (índice da cidade)
+        a, b = self.__cortes(len(p1))
+        filho = p2.tolist()
+        pos = [0] * self.instancia.num_cidades
+        for i, gene in enumerate(filho):
+            pos[gene] = i
+
+        for k, gene in enumerate(p1[a:b].tolist(), a):
+            atual = filho[k]
+            if gene != atual:
+                j = pos[gene]
+                filho[k], filho[j] = gene, atual
+                pos[gene], pos[atual] = k, j
+
+        return filho
+
+    def __crossover_erx(self, p1, p2):
+        # Edge recombination: segue arestas dos pais, preferindo o vizinho com menos arestas restantes
         len_pais = len(p1)
-        a, b = sorted(random.sample(range(len_pais), 2))
+        arestas = {gene: set() for gene in p1}
+        for pai in (p1, p2):
+            for i in range(len_pais):
+                gene = pai[i]
+                arestas[gene].add(pai[i - 1])
+                arestas[gene].add(pai[(i + 1) % len_pais])
+
+        restantes = list(p1)
+        indice_restante = {gene: i for i, gene in enumerate(restantes)}
+        filho = []
+        atual = self.random.choice((p1[0], p2[0]))
+
+        while True:
+            filho.append(atual)
+
+            # Remove o gene atual dos restantes (troca com o último, O(1))
+            i = indice_restante.pop(atual)
+            ultimo = restantes.pop()
+            if ultimo != atual:
+                restantes[i] = ultimo
+                indice_restante[ultimo] = i
+            if not restantes:
+                break
 
-        filho = [None] * len_pais
-        filho[a:b] = p1[a:b]
-        pos = b
+            vizinhos = arestas.pop(atual)
+            for v in vizinhos:
+                if v in arestas:
+                    arestas[v].discard(atual)
+            vizinhos = [v for v in vizinhos if v in arestas]
 
-        for p in p2:
-            if p not in filho:
-                if pos == len_pais:
-                    pos = 0
-                filho[pos] = p
-                pos += 1
+            if vizinhos:
+                menor = min(len(arestas[v]) for v in vizinhos)
+                atual = self.random.choice([v for v in vizinhos if len(arestas[v]) == menor])
+            else:
+                atual = self.random.choice(restantes)
 
         return filho
 
     def __mutacao(self, filho, taxa):
-        novo_filho = filho[:]
+        novo_filho = filho.copy()
 
-        if random.random() < taxa:
-            i, j = random.sample(range(len(filho)), 2)
+        if self.random.random() < taxa:
+            i, j = self.random.sample(range(len(filho)), 2)
             novo_filho[i], novo_filho[j] = novo_filho[j], novo_filho[i]
 
         return novo_filho
     
-    def __schwefel(self, x):
-        return 418.9829 * len(x) - np.sum(x * np.sin(np.sqrt(np.abs(x))))
-    
     def __crossover_continuo(self, p1, p2):
-        alpha = np.random.rand()
+        alpha = self.rng.random()
         return alpha * np.array(p1) + (1 - alpha) * np.array(p2)
 
     def __mutacao_continua(self, individuo, taxa, intervalo):
         novo = np.array(individuo)
-        if np.random.rand() < taxa:
-            i = np.random.randint(len(novo))
-            perturbacao = np.random.uniform(-20, 20)
+        if self.rng.random() < taxa:
+            i = int(self.rng.integers(len(novo)))
+            perturbacao = self.rng.uniform(-20, 20)
             novo[i] = np.clip(novo[i] + perturbacao, intervalo[0], intervalo[1])
         return novo
-            
-        
\ No newline at end of file
+
+
+# Estado de cada processo do modelo de ilhas: o AG é criado uma vez por processo
+_AG_ILHA = None
+
+
+def _inicializar_ilha(instancia, parametros):
+    global _AG_ILHA
+    _AG_ILHA = AlgoritmoGenetico(instancia, **parametros)
+
+
+def _evoluir_ilha(populacao, estado_rng, estado_random, geracoes):
+    # Recebe e devolve só arrays inteiros compactos, o incumbente da época, os estados dos
+    # geradores da ilha e o perfil da época (None sem perfilador); o AG do processo atende
+    # várias ilhas, então incumbente e perfil recomeçam a cada chamada
+    ag = _AG_ILHA
+    ag.rng.bit_generator.state = estado_rng
+    ag.random.setstate(estado_random)
+    ag.melhor_caminho, ag.melhor_custo = None, float('inf')
+    ag.perfilador.reiniciar()
+    populacao, melhores = ag._evoluir(populacao, geracoes)
+    return (populacao, melhores, ag.melhor_caminho, ag.melhor_custo,
+            ag.rng.bit_generator.state, ag.random.getstate(), ag.perfilador.get_estatisticas())
@@ -0,0 +1,254 @@
+import argparse
+import ast
+import contextlib
+import csv
+import inspect
+import json
+import os
+import random
+import re
+import sys
+import time
+import numpy as np
+from ACO import ACO_TSP
+from ACOSchwefel import ACO_Schwefel
+from AlgoritmoGenetico import AlgoritmoGenetico
+from HillClimbing import HillClimbing
+from Instancias import INSTANCIAS, carregar_instancia
+
+CAMPOS_RESUMO = ['solver', 'instancia', 'execucoes', 'tempo_medio', 'tempo_mediano', 'tempo_p95',
+                 'avaliacoes_por_segundo', 'melhor_custo', 'custo_medio']
+CAMPOS_EXECUCAO = ['solver', 'instancia', 'semente', 'repeticao', 'tempo', 'avaliacoes', 'custo']
+
+
+# Definidos pelo próprio benchmark em cada execução
+PARAMETROS_RESERVADOS = ('semente', 'verbose')
+
+
+def _filtrar_parametros(funcao, parametros):
+    """Mantém apenas os parâmetros aceitos pela função (ou construtor)"""
+    aceitos = inspect.signature(funcao).parameters
+    return {chave: valor for chave, valor in parametros.items()
+            if chave in aceitos and chave not in PARAMETROS_RESERVADOS}
+
+
+def _executar_aco(variante):
+    def executar(instancia, semente, parametros):
+        configuracao = {'num_iteracoes': 100, 'modo_construcao': 'lote', 'variante': variante}
+        configuracao.update(_filtrar_parametros(ACO_TSP, parametros))
+        aco = ACO_TSP(instancia, semente=semente, **configuracao)
+        _, custo, historico = aco.resolver(verbose=False)
+        return custo, aco.num_formigas * len(historico)
+    return executar
+
+
+def _executar_ag(instancia, semente, parametros):
+    configuracao = {'tamanho': 100, 'geracoes': 200}
+    configuracao.update(_filtrar_parametros(AlgoritmoGenetico, parametros))
+    ag = AlgoritmoGenetico(instancia, semente=semente, **configuracao)
+    _, custo, melhores = ag.iniciar(**_filtrar_parametros(ag.iniciar, parametros))
+    return custo, ag.tamanho_pop * len(melhores)
+
+
+def _executar_hc(vizinhanca):
+    def executar(instancia, semente, parametros):
+        configuracao = {'max_iter_sem_melhora': 100, 'cidade_inicial': instancia.cidades[0], 'vizinhanca': vizinhanca}
+        configuracao.update(_filtrar_parametros(HillClimbing, parametros))
+        hc = HillClimbing(instancia, semente=semente, verbose=False, **configuracao)
+        _, custo, _ = hc.iniciar_tsp()
+        return custo, hc.avaliacoes_vizinhos
+    return executar
+
+
+def _executar_aco_r(dimensoes, semente, parametros):
+    aco = ACO_Schwefel(dimensoes, semente=semente, **_filtrar_parametros(ACO_Schwefel, parametros))
+    _, custo, _ = aco.resolver(verbose=False)
+    return custo, aco.funcao_objetivo.avaliacoes
+
+
+def _executar_ag_schwefel(dimensoes, semente, parametros):
+    configuracao = {'tamanho': 100, 'geracoes': 200}
+    configuracao.update(_filtrar_parametros(AlgoritmoGenetico, parametros))
+    ag = AlgoritmoGenetico(None, semente=semente, **configuracao)
+    _, custo, _ = ag.iniciar_continuo(dimensoes, **_filtrar_parametros(ag.iniciar_continuo, parametros))
+    return custo, ag.funcao_objetivo.avaliacoes
+
+
+def _executar_hc_schwefel(dimensoes, semente, parametros):
+    hc = HillClimbing(semente=semente, verbose=False, **_filtrar_parametros(HillClimbing, parametros))
+    argumentos = {'intervalo': (-500, 500)}
+    argumentos.update(_filtrar_parametros(hc.iniciar_continuo, parametros))
+    _, custo, _ = hc.iniciar_continuo(dimensoes, **argumentos)
+    return custo, hc.funcao_objetivo.avaliacoes
+
+
+# solver -> (problema, função que executa uma vez e retorna (custo, avaliações))
+SOLVERS = {
+    'aco': ('tsp', _executar_aco('AS')),
+    'aco-mmas': ('tsp', _executar_aco('MMAS')),
+    'aco-acs': ('tsp', _executar_aco('ACS')),
+    'ag': ('tsp', _executar_ag),
+    'hc': ('tsp', _executar_hc('troca')),
+    'hc-2opt': ('tsp', _executar_hc('2opt+oropt')),
+    'aco-r': ('continuo', _executar_aco_r),
+    'ag-schwefel': ('continuo', _executar_ag_schwefel),
+    'hc-schwefel': ('continuo', _executar_hc_schwefel)
+}
+
+
+def carregar_problema(nome):
+    """
+    Carrega uma instância pelo nome: 'schwefel<d>' para a função de Schwefel em
+    d dimensões ou qualquer nome aceito por Instancias.carregar_instancia.
+
+    Returns:
+        tuple: (problema, instancia) com problema 'tsp' ou 'continuo'
+    """
+    schwefel = re.fullmatch(r'schwefel(\d+)', nome)
+    if schwefel:
+        return 'continuo', int(schwefel.group(1))
+    return 'tsp', carregar_instancia(nome)
+
+
+def interpretar_parametros(pares):
+    """Converte ['chave=valor', ...] em dicionário, interpretando valores como literais Python"""
+    parametros = {}
+    for par in pares or []:
+        chave, separador, valor = par.partition('=')
+        if not separador:
+            raise ValueError(f"Parâmetro inválido (use chave=valor): {par}")
+        try:
+            parametros[chave.strip()] = ast.literal_eval(valor)
+        except (ValueError, SyntaxError):
+            parametros[chave.strip()] = valor
+    return parametros
+
+
+def executar_benchmark(solvers, instancias, sementes, repeticoes=1, parametros=None, progresso=None):
+    """
+    Executa cada solver em cada instância compatível, para cada semente e repetição.
+    O tempo de parede (time.perf_counter) inclui a construção do solver e a
+    resolução; a carga da instância fica de fora. A saída dos solvers é descartada.
+
+    Args:
+        solvers: Nomes de solvers registrados em SOLVERS
+        instancias: Nomes de instâncias (ver carregar_problema)
+        sementes: Sementes; cada uma também fixa os geradores globais random e np.random
+        repeticoes: Execuções por semente
+        parametros: Parâmetros repassados a todos os solvers que os aceitam
+        progresso: Arquivo onde registrar cada execução (None não registra)
+
+    Returns:
+        list: Um dicionário por execução
+    """
+    invalidos = [s for s in solvers if s not in SOLVERS]
+    if invalidos:
+        raise ValueError(f"Solvers desconhecidos: {invalidos}")
+    parametros = parametros or {}
+
+    execucoes = []
+    for nome_instancia in instancias:
+        problema, instancia = carregar_problema(nome_instancia)
+        for solver in solvers:
+            problema_solver, executar = SOLVERS[solver]
+            if problema_solver != problema:
+                continue
+            for semente in sementes:
+                for repeticao in range(repeticoes):
+                    random.seed(semente)
+                    np.random.seed(semente)
+                    with open(os.devnull, 'w') as nulo, contextlib.redirect_stdout(nulo):
+                        inicio = time.perf_counter()
+                        custo, avaliacoes = executar(instancia, semente, parametros)
+                        tempo = time.perf_counter() - inicio
+
+                    execucoes.append({'solver': solver, 'instancia': nome_instancia, 'semente': semente,
+                                      'repeticao': repeticao, 'tempo': tempo,
+                                      'avaliacoes': int(avaliacoes), 'custo': float(custo)})
+                    if progresso is not None:
+                        print(f"{solver} | {nome_instancia} | semente {semente} | repetição {repeticao + 1}: "
+                              f"custo {custo:.4f} em {tempo:.4f}s", file=progresso)
+    return execucoes
+
+
+def resumir(execucoes):
+    """
+    Agrega as execuções por (solver, instância).
+
+    Returns:
+        list: Um dicionário por par com tempos médio, mediano e percentil 95,
+            avaliações por segundo e melhor custo e custo médio
+    """
+    grupos = {}
+    for execucao in execucoes:
+        grupos.setdefault((execucao['solver'], execucao['instancia']), []).append(execucao)
+
+    resumo = []
+    for (solver, instancia), grupo in grupos.items():
+        tempos = np.array([e['tempo'] for e in grupo])
+        custos = np.array([e['custo'] for e in grupo])
+        tempo_total = tempos.sum()
+        resumo.append({
+            'solver': solver,
+            'instancia': instancia,
+            'execucoes': len(grupo),
+            'tempo_medio': float(tempos.mean()),
+            'tempo_mediano': float(np.median(tempos)),
+            'tempo_p95': float(np.percentile(tempos, 95)),
+            'avaliacoes_por_segundo': sum(e['avaliacoes'] for e in grupo) / tempo_total if tempo_total > 0 else 0.0,
+            'melhor_custo': float(custos.min()),
+            'custo_medio': float(custos.mean())
+        })
+    return resumo
+
+
+def escrever_resultados(arquivo, formato, resumo, execucoes, detalhado=False):
+    """Escreve o resumo (e as execuções) em JSON, ou o resumo (ou as execuções) em CSV"""
+    if formato == 'json':
+        json.dump({'resumo': resumo, 'execucoes': execucoes}, arquivo, indent=4)
+        arquivo.write('\n')
+        return
+
+    campos, linhas = (CAMPOS_EXECUCAO, execucoes) if detalhado else (CAMPOS_RESUMO, resumo)
+    escritor = csv.DictWriter(arquivo, fieldnames=campos)
+    escritor.writeheader()
+    escritor.writerows(linhas)
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(
+        description='Executa solvers em instâncias e sementes e mede tempo, avaliações e custo.',
+        epilog='Exemplo: python Benchmark.py --solvers aco aco-mmas hc --instancias grafo18 aleatoria100 '
+               '--sementes 1 2 3 --repeticoes 5 -p num_iteracoes=50 --saida results/benchmark.csv')
+    parser.add_argument('--solvers', nargs='+', default=['aco', 'ag', 'hc'], help=f'Solvers: {", ".join(SOLVERS)}')
+    parser.add_argument('--instancias', nargs='+', default=['grafo18'],
+                        help=f'Instâncias: {", ".join(INSTANCIAS)}, aleatoria<n>, arquivo .tsp ou schwefel<d>')
+    parser.add_argument('--sementes', nargs='+', type=int, default=[0], help='Sementes dos geradores aleatórios')
+    parser.add_argument('--repeticoes', type=int, default=1, help='Execuções por semente')
+    parser.add_argument('-p', '--parametro', action='append', metavar='CHAVE=VALOR',
+                        help='Parâmetro repassado aos solvers que o aceitam (pode ser repetido)')
+    parser.add_argument('--formato', choices=['json', 'csv'], help='Formato da saída (padrão: extensão de --saida ou json)')
+    parser.add_argument('--saida', help='Arquivo de saída (padrão: saída padrão)')
+    parser.add_argument('--detalhado', action='store_true', help='No CSV, escreve cada execução em vez do resumo')
+    args = parser.parse_args(argumentos)
+
+    formato = args.formato or ('csv' if args.saida and args.saida.endswith('.csv') else 'json')
+    try:
+        parametros = interpretar_parametros(args.parametro)
+        execucoes = executar_benchmark(args.solvers, args.instancias, args.sementes, args.repeticoes,
+                                       parametros, progresso=sys.stderr)
+    except ValueError as erro:
+        parser.error(str(erro))
+    resumo = resumir(execucoes)
+
+    if args.saida:
+        os.makedirs(os.path.dirname(args.saida) or '.', exist_ok=True)
+        with open(args.saida, 'w', newline='') as arquivo:
+            escrever_resultados(arquivo, formato, resumo, execucoes, args.detalhado)
+        print(f"Resultados salvos em {args.saida}", file=sys.stderr)
+    else:
+        escrever_resultados(sys.stdout, formato, resumo, execucoes, args.detalhado)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,220 @@
+import random
+from collections import deque
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from InstanciaTSP import InstanciaTSP
+from Terminacao import CriterioParada
+
+
+class BuscaLocal:
+    """
+    Busca local para o TSP com movimentos 2-opt e Or-opt.
+    Cada movimento é avaliado pela variação de custo das arestas afetadas, os
+    candidatos vêm das listas de vizinhos mais próximos e os don't-look bits
+    mantêm uma passada completa perto de O(n·k) em vez de O(n²).
+    Assume distâncias simétricas, como as das instâncias do projeto.
+    """
+
+    MOVIMENTOS = ("2opt", "oropt")
+
+    def __init__(self, instancia: InstanciaTSP,
+                 movimentos: Union[str, Sequence[str]] = ("2opt", "oropt"),
+                 num_vizinhos: int = 10,
+                 tamanho_max_segmento: int = 3,
+                 rng: Optional[np.random.Generator] = None):
+        """
+        Inicializa a busca local.
+
+        Args:
+            instancia: Instância do TSP
+            movimentos: Movimentos usados, ex. ("2opt", "oropt") ou "2opt+oropt"
+            num_vizinhos: Tamanho das listas de vizinhos mais próximos
+            tamanho_max_segmento: Maior segmento movido pelo Or-opt
+            rng: Gerador da ordem inicial de exame das cidades (None usa o módulo random)
+        """
+        if isinstance(movimentos, str):
+            movimentos = movimentos.split("+")
+        movimentos = tuple(m.strip().lower().replace("-", "") for m in movimentos)
+        invalidos = [m for m in movimentos if m not in self.MOVIMENTOS]
+        if invalidos or not movimentos:
+            raise ValueError(f"Movimentos inválidos: {invalidos or movimentos}")
+
+        self.instancia = instancia
+        self.movimentos = movimentos
+        self.num_vizinhos = num_vizinhos
+        self.tamanho_max_segmento = tamanho_max_segmento
+        self.rng = rng
+
+        # Vizinhos e suas distâncias em listas para acesso escalar rápido; as demais
+        # distâncias vêm de matriz.item, que devolve escalares Python (somas em precisão dupla)
+        vizinhos = instancia.vizinhos_proximos(num_vizinhos)
+        distancias_vizinhos = instancia.matriz_distancias[np.arange(len(vizinhos))[:, np.newaxis], vizinhos]
+        self._vizinhos = [list(zip(v, dv)) for v, dv in zip(vizinhos.tolist(), distancias_vizinhos.tolist())]
+
+        # Estatísticas da última execução
+        self.movimentos_aplicados = {m: 0 for m in self.MOVIMENTOS}
+        self.historico_custos: List[float] = []
+        self.avaliacoes = 0
+
+    def otimizar(self, rota: Sequence[int], criterio: Optional[CriterioParada] = None) -> Tuple[np.ndarray, float]:
+        """
+        Aplica a busca local até um ótimo local da vizinhança escolhida.
+
+        Args:
+            rota: Rota fechada em índices de cidades (sem repetir a cidade inicial)
+            criterio: CriterioParada verificado a cada cidade examinada; ao parar,
+                devolve a rota corrente (a busca só aceita melhoras)
+
+        Returns:
+            Tupla (rota_otimizada, custo), com a rota começando pela mesma cidade
+        """
+        self.movimentos_aplicados = {m: 0 for m in self.MOVIMENTOS}
+        self.avaliacoes = 0
+        n = len(rota)
+        self._rota = [int(c) for c in rota]
+        self._pos = [0] * self.instancia.num_cidades
+        for i, c in enumerate(self._rota):
+            self._pos[c] = i
+
+        custo = self.instancia.custo_rota(self._rota)
+        self.historico_custos = [custo]
+        if n < 5:
+            return np.asarray(self._rota, dtype=np.intp), custo
+
+        # Don't-look bits: só cidades na fila são reexaminadas
+        inativa = [False] * self.instancia.num_cidades
+        if self.rng is not None:
+            fila = deque(self._rota[k] for k in self.rng.permutation(n))
+        else:
+            fila = deque(random.sample(self._rota, n))
+
+        while fila:
+            if criterio is not None and criterio.deve_parar(custo, self.avaliacoes):
+                break
+            a = fila.popleft()
+            if inativa[a]:
+                continue
+
+            resultado = None
+            if "2opt" in self.movimentos:
+                resultado = self._tentar_2opt(a)
+                if resultado is not None:
+                    self.movimentos_aplicados["2opt"] += 1
+            if resultado is None and "oropt" in self.movimentos:
+                resultado = self._tentar_oropt(a)
+                if resultado is not None:
+                    self.movimentos_aplicados["oropt"] += 1
+
+            if resultado is None:
+                inativa[a] = True
+                continue
+
+            delta, afetadas = resultado
+            custo += delta
+            self.historico_custos.append(custo)
+            for c in afetadas:
+                if inativa[c]:
+                    inativa[c] = False
+                    fila.append(c)
+            fila.append(a)
+
+        # Mantém a cidade inicial da rota recebida na primeira posição
+        inicio = self._pos[int(rota[0])]
+        rota_final = np.roll(np.asarray(self._rota, dtype=np.intp), -inicio)
+        custo = self.instancia.custo_rota(rota_final)
+        self.historico_custos[-1] = custo
+        return rota_final, custo
+
+    def _sucessor(self, c: int) -> int:
+        return self._rota[(self._pos[c] + 1) % len(self._rota)]
+
+    def _antecessor(self, c: int) -> int:
+        return self._rota[self._pos[c] - 1]
+
+    def _inverter(self, i: int, j: int):
+        """Inverte o trecho cíclico entre as posições i e j (inclusive), pelo lado mais curto"""
+        rota, pos = self._rota, self._pos
+        n = len(rota)
+        tamanho = (j - i) % n + 1
+        if 2 * tamanho > n:
+            i, j = (j + 1) % n, (i - 1) % n
+            tamanho = n - tamanho
+        for _ in range(tamanho // 2):
+            ci, cj = rota[i], rota[j]
+            rota[i], rota[j] = cj, ci
+            pos[cj], pos[ci] = i, j
+            i = (i + 1) % n
+            j = (j - 1) % n
+
+    def _tentar_2opt(self, a: int) -> Optional[Tuple[float, Tuple[int, ...]]]:
+        """Procura um movimento 2-opt que melhore a rota envolvendo a cidade a"""
+        d = self.instancia.matriz_distancias.item
+        for sentido_sucessor in (True, False):
+            b = self._sucessor(a) if sentido_sucessor else self._antecessor(a)
+            d_ab = d(a, b)
+            for c, d_ac in self._vizinhos[a]:
+                ganho_parcial = d_ab - d_ac
+                if ganho_parcial <= 1e-10:
+                    break
+                e = self._sucessor(c) if sentido_sucessor else self._antecessor(c)
+                if c == b or e == a:
+                    continue
+
+                delta = d_ac + d(b, e) - d_ab - d(c, e)
+                self.avaliacoes += 1
+                if delta < -1e-10:
+                    if sentido_sucessor:
+                        self._inverter(self._pos[b], self._pos[c])
+                    else:
+                        self._inverter(self._pos[a], self._pos[e])
+                    return float(delta), (a, b, c, e)
+        return None
+
+    def _tentar_oropt(self, a: int) -> Optional[Tuple[float, Tuple[int, ...]]]:
+        """Procura um movimento Or-opt que realoque um segmento iniciado na cidade a"""
+        d = self.instancia.matriz_distancias.item
+        n = len(self._rota)
+        for tamanho in range(1, min(self.tamanho_max_segmento, n - 3) + 1):
+            segmento = [self._rota[(self._pos[a] + k) % n] for k in range(tamanho)]
+            fim = segmento[-1]
+            p = self._antecessor(a)
+            q = self._sucessor(fim)
+            ganho_remocao = d(p, a) + d(fim, q) - d(p, q)
+            if ganho_remocao <= 1e-10:
+                continue
+
+            no_segmento = set(segmento)
+            for c, d_ac in self._vizinhos[a]:
+                if d_ac >= ganho_remocao:
+                    break
+                if c in no_segmento:
+                    continue
+
+                # c - a ... fim - sucessor(c)  ou  antecessor(c) - fim ... a - c
+                for invertido in (False, True):
+                    e = self._antecessor(c) if invertido else self._sucessor(c)
+                    if e in no_segmento:
+                        continue
+                    delta = d_ac + d(fim, e) - d(c, e) - ganho_remocao
+                    self.avaliacoes += 1
+                    if delta < -1e-10:
+                        self._mover_segmento(segmento, c, invertido)
+                        return float(delta), (p, q, a, fim, c, e)
+        return None
+
+    def _mover_segmento(self, segmento: List[int], c: int, invertido: bool):
+        """Remove o segmento da rota e o reinsere adjacente à cidade c"""
+        no_segmento = set(segmento)
+        restante = [x for x in self._rota if x not in no_segmento]
+        k = restante.index(c)
+        if invertido:
+            # antecessor(c) - fim ... a - c
+            nova = restante[:k] + segmento[::-1] + restante[k:]
+        else:
+            # c - a ... fim - sucessor(c)
+            nova = restante[:k + 1] + segmento + restante[k + 1:]
+        self._rota = nova
+        for i, x in enumerate(nova):
+            self._pos[x] = i
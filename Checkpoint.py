@@ -0,0 +1,100 @@
+import json
+import os
+import random
+import time
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+
+def _para_json(valor):
+    """Converte arrays e escalares NumPy (ex. em estados de geradores) para JSON"""
+    if isinstance(valor, np.ndarray):
+        return valor.tolist()
+    if isinstance(valor, np.generic):
+        return valor.item()
+    raise TypeError(f"Valor não serializável no checkpoint: {type(valor).__name__}")
+
+
+def estado_random(gerador=random) -> list:
+    """Estado de um random.Random (ou do módulo random) em forma serializável"""
+    versao, estado, gauss = gerador.getstate()
+    return [versao, list(estado), gauss]
+
+
+def restaurar_random(estado: list, gerador=random):
+    """Restaura um estado obtido com estado_random"""
+    versao, estado_interno, gauss = estado
+    gerador.setstate((versao, tuple(estado_interno), gauss))
+
+
+class Checkpoint:
+    """
+    Checkpoints periódicos do estado de um solver em um arquivo .npz.
+
+    Os arrays são gravados sem compressão: np.savez escreve o buffer de cada array
+    contíguo direto no arquivo, sem cópia intermediária. Escalares, listas curtas e
+    estados dos geradores vão como JSON na entrada 'estado'. Cada gravação é atômica
+    (arquivo temporário + os.replace), então um processo interrompido deixa sempre
+    o último checkpoint completo.
+    """
+
+    def __init__(self, caminho: str, intervalo: int = 10):
+        """
+        Inicializa o checkpoint.
+
+        Args:
+            caminho: Arquivo do checkpoint (a extensão .npz é acrescentada se faltar)
+            intervalo: A cada quantos passos do solver (iterações, gerações ou
+                reinícios, conforme o método) o estado é gravado
+        """
+        if intervalo < 1:
+            raise ValueError(f"Intervalo de checkpoint inválido: {intervalo}")
+        self.caminho = caminho if caminho.endswith('.npz') else caminho + '.npz'
+        self.intervalo = intervalo
+        self.gravacoes = 0
+        self.tempo_gravacao = 0.0
+
+    def existe(self) -> bool:
+        """Se há um checkpoint gravado para retomar"""
+        return os.path.exists(self.caminho)
+
+    def deve_gravar(self, passos_concluidos: int) -> bool:
+        """Se o estado deve ser gravado após o número de passos concluídos"""
+        return passos_concluidos % self.intervalo == 0
+
+    def gravar(self, estado: Dict[str, Any], **arrays: np.ndarray):
+        """
+        Grava o estado de forma atômica.
+
+        Args:
+            estado: Valores serializáveis em JSON (arrays e escalares NumPy são convertidos)
+            **arrays: Arrays grandes, gravados como entradas próprias do .npz
+        """
+        inicio = time.perf_counter()
+        os.makedirs(os.path.dirname(self.caminho) or '.', exist_ok=True)
+        temporario = self.caminho + '.tmp'
+        with open(temporario, 'wb') as arquivo:
+            np.savez(arquivo, estado=np.array(json.dumps(estado, default=_para_json)), **arrays)
+            arquivo.flush()
+            os.fsync(arquivo.fileno())
+        os.replace(temporario, self.caminho)
+        self.gravacoes += 1
+        self.tempo_gravacao += time.perf_counter() - inicio
+
+    def carregar(self) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+        """
+        Lê o último checkpoint gravado.
+
+        Returns:
+            tuple: (estado, arrays) como passados a gravar
+        """
+        with np.load(self.caminho) as dados:
+            estado = json.loads(str(dados['estado']))
+            arrays = {chave: dados[chave] for chave in dados.files if chave != 'estado'}
+        return estado, arrays
+
+    def remover(self):
+        """Apaga o checkpoint (ex. ao final de uma execução concluída)"""
+        if self.existe():
+            os.remove(self.caminho)
@@ -0,0 +1,24 @@
+from typing import NamedTuple
+
+
+class EventoIteracao(NamedTuple):
+    """
+    Progresso de um solver ao fim de uma iteração, produzido pelos iteradores
+    ACO_TSP.iterar, ACO_Schwefel.iterar e HillClimbing.iterar_tsp.
+
+    Quem consome os eventos pode imprimir, agregar ou descartar o progresso, e
+    pode interromper a execução entre duas iterações saindo do laço: o solver
+    mantém a melhor solução encontrada até ali.
+    """
+
+    iteracao: int
+    """Número da iteração concluída (a partir de 1, contando as retomadas)"""
+
+    custo: float
+    """Custo do incumbente (melhor solução da execução) ao fim da iteração"""
+
+    tempo: float
+    """Segundos de tempo de parede desde o início do laço principal"""
+
+    melhorou: bool
+    """Se o incumbente melhorou nesta iteração"""
@@ -1,9 +1,17 @@
-import random
 import time
 import math
 import itertools
+import multiprocessing
 import numpy as np
-from typing import Dict, List, Tuple, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Tuple, Any, Optional, Union
+from InstanciaTSP import InstanciaTSP
+from BuscaLocal import BuscaLocal
+from Schwefel import Schwefel
+from Checkpoint import Checkpoint
+from Terminacao import CriterioParada
+from Perfilador import Perfilador, PERFILADOR_NULO
+from Eventos import EventoIteracao
 
 
 class HillClimbing:
@@ -12,26 +20,59 @@ class HillClimbing:
     Suporta tanto o TSP (Traveling Salesman Problem) quanto otimização contínua.
     """
     
-    def __init__(self, grafo: Optional[Dict] = None, 
+    def __init__(self, grafo: Optional[Union[Dict, InstanciaTSP]] = None, 
                  max_iter_sem_melhora: int = 100,
-                 cidade_inicial: int = 1):
+                 cidade_inicial: int = 1,
+                 modo_vizinhanca: str = "melhor",
+                 tamanho_bloco: int = 1024,
+                 vizinhanca: str = "troca",
+                 semente: Optional[int] = None,
+                 verbose: bool = True,
+                 perfilador: Optional[Perfilador] = None):
         """
         Inicializa o Hill Climbing.
         
         Args:
-            grafo: Dicionário representando o grafo para TSP
+            grafo: InstanciaTSP ou dicionário representando o grafo para TSP
             max_iter_sem_melhora: Número máximo de iterações sem melhoria
             cidade_inicial: Cidade inicial para o TSP
+            modo_vizinhanca: "melhor" (best-improvement) ou "primeira" (first-improvement)
+            tamanho_bloco: Quantidade de trocas avaliadas por vez na vizinhança de trocas
+            vizinhanca: "troca" (permutação de duas cidades), "2opt", "oropt" ou "2opt+oropt"
+            semente: Semente do gerador aleatório (também origem das sementes dos reinícios)
+            verbose: Se deve imprimir o progresso
+            perfilador: Perfilador com o tempo das fases vizinhanca, avaliacao e
+                checkpoint e os contadores de cada execução (None usa o
+                PerfiladorNulo, sem custo; iniciar_multiplos não é medido)
         """
-        self.grafo = grafo
+        if modo_vizinhanca not in ("melhor", "primeira"):
+            raise ValueError(f"Modo de vizinhança inválido: {modo_vizinhanca}")
+
+        self.instancia = InstanciaTSP.de_grafo(grafo) if grafo else None
+        self.grafo = self.instancia.grafo_adj if self.instancia else grafo
         self.max_iter_sem_melhora = max_iter_sem_melhora
         self.cidade_inicial = cidade_inicial
-        self.cidades = list(grafo.keys()) if grafo else []
+        self.modo_vizinhanca = modo_vizinhanca
+        self.tamanho_bloco = tamanho_bloco
+        self.vizinhanca = vizinhanca
+        self.cidades = list(self.instancia.cidades) if self.instancia else []
+        self.semente = semente
+        self.rng = np.random.default_rng(semente)
+        self.verbose = verbose
+        self.funcao_objetivo = Schwefel(-500, 500)  # Limites da função Schwefel
+        
+        # Parada antecipada entre reinícios paralelos (ver iniciar_multiplos)
+        self.custo_alvo = None
+        self._melhor_compartilhado = None
         
         # Estatísticas de execução
         self.tempo_execucao = 0
         self.total_iteracoes = 0
+        self.avaliacoes_vizinhos = 0
         self.historico_custos = []
+        self.melhor_rota = None
+        self.menor_distancia = float("inf")
+        self.perfilador = perfilador if perfilador is not None else PERFILADOR_NULO
         
     def calcular_distancia_rota(self, rota: List[int]) -> float:
         """
@@ -43,15 +84,8 @@ class HillClimbing:
         Returns:
             Distância total da rota
         """
-        distancia_total = 0
-        for i in range(len(rota) - 1):
-            cidade_atual = rota[i]
-            proxima_cidade = rota[i + 1]
-            if proxima_cidade in self.grafo.get(cidade_atual, {}):
-                distancia_total += self.grafo[cidade_atual][proxima_cidade]
-            else:
-                return float("inf")
-        return distancia_total
+        indices = self.instancia.para_indices(rota)
+        return self.instancia.custo_rota(indices, fechada=False)
     
     def gerar_rota_inicial(self) -> List[int]:
         """
@@ -61,7 +95,7 @@ class HillClimbing:
             Rota inicial com cidade de partida e chegada iguais
         """
         cidades_a_visitar = [c for c in self.cidades if c != self.cidade_inicial]
-        random.shuffle(cidades_a_visitar)
+        cidades_a_visitar = [cidades_a_visitar[k] for k in self.rng.permutation(len(cidades_a_visitar))]
         return [self.cidade_inicial] + cidades_a_visitar + [self.cidade_inicial]
     
     def gerar_vizinhos_permutacao(self, rota: List[int]) -> List[List[int]]:
@@ -84,84 +118,267 @@ class HillClimbing:
             
         return vizinhos
     
-    def iniciar_tsp(self) -> Tuple[List[int], float, List[float]]:
+    def calcular_deltas_troca(self, rota: np.ndarray, i: np.ndarray, j: np.ndarray) -> np.ndarray:
         """
-        Executa o Hill Climbing para o problema do TSP.
+        Calcula a variação de custo da troca das posições i e j (i < j) da rota,
+        usando apenas as arestas afetadas: quatro, ou três quando i e j são adjacentes.
         
+        Args:
+            rota: Rota em índices de cidades, com a cidade inicial nas duas pontas
+            i: Posições da primeira cidade de cada troca
+            j: Posições da segunda cidade de cada troca
+            
         Returns:
-            Tupla contendo (melhor_rota, menor_distancia, historico_custos)
+            Vetor com a variação de custo de cada troca (negativo = melhora)
         """
-        if not self.grafo:
-            raise ValueError("Grafo não foi definido para resolver TSP")
-            
-        tempo_inicio = time.time()
+        d = self.instancia.matriz_distancias
+        a, b, c = rota[i - 1], rota[i], rota[i + 1]
+        e, f, g = rota[j - 1], rota[j], rota[j + 1]
+        adjacentes = (j - i) == 1
         
-        # Inicialização
-        rota_atual = self.gerar_rota_inicial()
-        distancia_atual = self.calcular_distancia_rota(rota_atual)
-        self.historico_custos = [distancia_atual]
+        # As somas partem de termos float64 para não acumular no tipo compacto da matriz
+        d_ab = d[a, b].astype(np.float64)
+        d_af = d[a, f].astype(np.float64)
+        with np.errstate(invalid="ignore"):
+            removidas = np.where(adjacentes,
+                                 d_ab + d[b, f] + d[f, g],
+                                 d_ab + d[b, c] + d[e, f] + d[f, g])
+            adicionadas = np.where(adjacentes,
+                                   d_af + d[f, b] + d[b, g],
+                                   d_af + d[f, c] + d[e, b] + d[b, g])
+            deltas = adicionadas - removidas
         
-        iter_sem_melhora = 0
-        self.total_iteracoes = 0
+        # inf - inf (arestas inexistentes em grafo não fechado) não é melhora
+        deltas[np.isnan(deltas)] = np.inf
+        return deltas
+    
+    def _escolher_troca(self, rota: np.ndarray, pares_i: np.ndarray,
+                        pares_j: np.ndarray) -> Optional[Tuple[int, int, float]]:
+        """
+        Escolhe uma troca que melhora a rota conforme o modo de vizinhança.
+        
+        Returns:
+            Tupla (i, j, delta) da troca escolhida, ou None se não há melhora
+        """
+        if self.modo_vizinhanca == "primeira":
+            # First-improvement: percorre as trocas em ordem aleatória, em blocos
+            ordem = self.rng.permutation(len(pares_i))
+            for inicio in range(0, len(ordem), self.tamanho_bloco):
+                bloco = ordem[inicio:inicio + self.tamanho_bloco]
+                deltas = self.calcular_deltas_troca(rota, pares_i[bloco], pares_j[bloco])
+                self.avaliacoes_vizinhos += len(bloco)
+                melhoras = np.flatnonzero(deltas < 0)
+                if len(melhoras):
+                    k = bloco[melhoras[0]]
+                    return int(pares_i[k]), int(pares_j[k]), float(deltas[melhoras[0]])
+            return None
         
-        print(f"Rota inicial: {' -> '.join(map(str, rota_atual))}")
-        print(f"Distância inicial: {distancia_atual:.2f}")
+        # Best-improvement: percorre os mesmos blocos guardando o menor delta e os
+        # empates com ele, e sorteia entre as trocas de maior melhora
+        menor_delta = 0.0
+        empates = []
+        for inicio in range(0, len(pares_i), self.tamanho_bloco):
+            fim = inicio + self.tamanho_bloco
+            deltas = self.calcular_deltas_troca(rota, pares_i[inicio:fim], pares_j[inicio:fim])
+            self.avaliacoes_vizinhos += len(deltas)
+            menor_bloco = deltas.min()
+            if menor_bloco < menor_delta:
+                menor_delta = menor_bloco
+                empates = []
+            if menor_bloco == menor_delta and menor_delta < 0:
+                empates.append(inicio + np.flatnonzero(deltas == menor_delta))
+        if not empates:
+            return None
+        k = self.rng.choice(np.concatenate(empates))
+        return int(pares_i[k]), int(pares_j[k]), float(menor_delta)
+    
+    def _iterar_trocas(self, rota: np.ndarray, distancia_atual: float, tempo_inicio: float,
+                       criterio: Optional[CriterioParada] = None) -> Iterator[EventoIteracao]:
+        """
+        Loop principal do Hill Climbing na vizinhança de trocas de duas cidades,
+        com um evento por iteração. A rota é modificada no lugar e menor_distancia
+        acompanha a distância corrente.
+        """
+        pares_i, pares_j = np.triu_indices(len(rota) - 2, k=1)
+        pares_i += 1
+        pares_j += 1
+        iter_sem_melhora = 0
+        vizinhanca = self.perfilador.fase("vizinhanca")
         
-        # Loop principal do Hill Climbing
-        while iter_sem_melhora < self.max_iter_sem_melhora:
+        while iter_sem_melhora < self.max_iter_sem_melhora and not self._alvo_atingido():
             self.total_iteracoes += 1
-            melhor_vizinho = None
-            melhor_distancia_vizinho = distancia_atual
             
-            # Gera e avalia vizinhos
-            vizinhos = self.gerar_vizinhos_permutacao(rota_atual)
-            random.shuffle(vizinhos)
+            with vizinhanca:
+                troca = self._escolher_troca(rota, pares_i, pares_j)
             
-            encontrou_melhor = False
-            for vizinho in vizinhos:
-                distancia_vizinho = self.calcular_distancia_rota(vizinho)
-                if distancia_vizinho < melhor_distancia_vizinho:
-                    melhor_vizinho = vizinho
-                    melhor_distancia_vizinho = distancia_vizinho
-                    encontrou_melhor = True
-            
-            # Atualiza se encontrou melhoria
-            if encontrou_melhor:
-                rota_atual = melhor_vizinho
-                distancia_atual = melhor_distancia_vizinho
+            # Atualiza se encontrou melhoria (a troca é aplicada na própria rota)
+            if troca is not None:
+                self.perfilador.contar("movimentos_aceitos")
+                i, j, delta = troca
+                rota[i], rota[j] = rota[j], rota[i]
+                distancia_atual += delta
+                if not np.isfinite(distancia_atual):
+                    distancia_atual = self.instancia.custo_rota(rota, fechada=False)
                 self.historico_custos.append(distancia_atual)
+                self.menor_distancia = distancia_atual
                 iter_sem_melhora = 0
-                print(f"Iteração {self.total_iteracoes}: Nova melhor distância = {distancia_atual:.2f}")
+                self._publicar_custo(distancia_atual)
             else:
                 iter_sem_melhora += 1
                 self.historico_custos.append(distancia_atual)
+            
+            parar = criterio is not None and criterio.deve_parar(distancia_atual, self.avaliacoes_vizinhos)
+            yield EventoIteracao(self.total_iteracoes, distancia_atual, time.time() - tempo_inicio, troca is not None)
+            if parar:
+                break
+    
+    def _subir_com_busca_local(self, rota: np.ndarray,
+                               criterio: Optional[CriterioParada] = None) -> Tuple[np.ndarray, float]:
+        """
+        Hill Climbing nas vizinhanças 2-opt/Or-opt da BuscaLocal: cada movimento
+        aplicado conta como uma iteração.
+        """
+        busca = BuscaLocal(self.instancia, self.vizinhanca, rng=self.rng)
+        with self.perfilador.fase("vizinhanca"):
+            rota_otimizada, distancia = busca.otimizar(rota[:-1], criterio)
+        self.perfilador.contar("movimentos_aceitos", sum(busca.movimentos_aplicados.values()))
         
-        tempo_fim = time.time()
-        self.tempo_execucao = tempo_fim - tempo_inicio
+        self.historico_custos.extend(busca.historico_custos[1:])
+        self.total_iteracoes = sum(busca.movimentos_aplicados.values())
+        self.avaliacoes_vizinhos = busca.avaliacoes
+        self._publicar_custo(distancia)
+        if self.verbose:
+            print(f"Busca local {self.vizinhanca}: {busca.movimentos_aplicados}")
         
-        print(f"\nAlgoritmo convergiu após {self.total_iteracoes} iterações")
-        print(f"Melhor rota: {' -> '.join(map(str, rota_atual))}")
-        print(f"Menor distância: {distancia_atual:.2f}")
+        return np.append(rota_otimizada, rota_otimizada[0]), distancia
+    
+    def _alvo_atingido(self) -> bool:
+        """Indica se algum reinício já atingiu o custo alvo compartilhado"""
+        return (self.custo_alvo is not None and self._melhor_compartilhado is not None
+                and self._melhor_compartilhado.value <= self.custo_alvo)
+    
+    def _publicar_custo(self, custo: float):
+        """Atualiza o melhor custo compartilhado entre os reinícios, se houver"""
+        melhor = self._melhor_compartilhado
+        if melhor is not None and custo < melhor.value:
+            with melhor.get_lock():
+                if custo < melhor.value:
+                    melhor.value = custo
+    
+    def _reinicio_tsp(self, criterio: Optional[CriterioParada] = None) -> Tuple[List[int], float]:
+        """
+        Executa uma subida completa do TSP a partir de uma rota aleatória,
+        preenchendo historico_custos e total_iteracoes.
         
-        return rota_atual, distancia_atual, self.historico_custos
+        Returns:
+            Tupla (rota, distancia)
+        """
+        for _ in self._iterar_reinicio_tsp(time.time(), criterio):
+            pass
+        return self.melhor_rota, self.menor_distancia
     
-    def schwefel(self, x: np.ndarray) -> float:
+    def _iterar_reinicio_tsp(self, tempo_inicio: float,
+                             criterio: Optional[CriterioParada] = None) -> Iterator[EventoIteracao]:
         """
-        Implementa a função de Schwefel para otimização contínua.
+        Gerador de uma subida completa do TSP a partir de uma rota aleatória. Ao
+        terminar (ou ser interrompido), melhor_rota e menor_distancia têm a rota
+        corrente.
+        """
+        rota_atual = self.gerar_rota_inicial()
+        distancia_atual = self.calcular_distancia_rota(rota_atual)
+        self.historico_custos = [distancia_atual]
+        self.total_iteracoes = 0
+        self.avaliacoes_vizinhos = 0
+        
+        rota = np.array(self.instancia.para_indices(rota_atual), dtype=np.intp)
+        self.perfilador.contar("rotas_alocadas")
+        
+        if self.verbose:
+            print(f"Rota inicial: {' -> '.join(map(str, rota_atual))}")
+            print(f"Distância inicial: {distancia_atual:.2f}")
+        
+        self.menor_distancia = distancia_atual
+        try:
+            if self.vizinhanca == "troca":
+                yield from self._iterar_trocas(rota, distancia_atual, tempo_inicio, criterio)
+            else:
+                # A BuscaLocal não é interrompível: um único evento ao final da busca
+                distancia_inicial = distancia_atual
+                rota, self.menor_distancia = self._subir_com_busca_local(rota, criterio)
+                yield EventoIteracao(self.total_iteracoes, self.menor_distancia, time.time() - tempo_inicio,
+                                     self.menor_distancia < distancia_inicial)
+        finally:
+            self.melhor_rota = self.instancia.para_cidades(rota)
+            self.perfilador.contar("avaliacoes", self.avaliacoes_vizinhos + 1)
+    
+    def iniciar_tsp(self, criterio: Optional[CriterioParada] = None) -> Tuple[List[int], float, List[float]]:
+        """
+        Executa o Hill Climbing para o problema do TSP.
+        As trocas de duas cidades são avaliadas pela variação de custo das arestas
+        afetadas, sem materializar as rotas vizinhas; as vizinhanças 2-opt e Or-opt
+        usam a BuscaLocal.
         
         Args:
-            x: Vetor de entrada
-            
+            criterio: CriterioParada verificado a cada iteração (trocas) ou cidade
+                examinada (2-opt/Or-opt); ao parar, devolve a rota corrente
+        
         Returns:
-            Valor da função Schwefel
+            Tupla contendo (melhor_rota, menor_distancia, historico_custos)
         """
-        if not isinstance(x, np.ndarray):
-            x = np.array(x)
+        # O progresso impresso é apenas um consumidor dos eventos de iterar_tsp
+        for evento in self.iterar_tsp(criterio):
+            if self.verbose and evento.melhorou:
+                print(f"Iteração {evento.iteracao}: Nova melhor distância = {evento.custo:.2f}")
+        
+        if self.verbose:
+            print(f"\nAlgoritmo convergiu após {self.total_iteracoes} iterações")
+            print(f"Melhor rota: {' -> '.join(map(str, self.melhor_rota))}")
+            print(f"Menor distância: {self.menor_distancia:.2f}")
         
-        x = np.clip(x, -500, 500)  # Limites da função Schwefel
-        termo1 = 418.9829 * len(x)
-        termo2 = np.sum(x * np.sin(np.sqrt(np.abs(x))))
-        return termo1 - termo2
+        return self.melhor_rota, self.menor_distancia, self.historico_custos
+    
+    def iterar_tsp(self, criterio: Optional[CriterioParada] = None) -> Iterator[EventoIteracao]:
+        """
+        Executa o Hill Climbing para o TSP como um iterador, com um EventoIteracao
+        por iteração (trocas) ou um único evento ao fim da busca (2-opt/Or-opt).
+        O progresso por iteração não é impresso.
+        
+        Sair do laço de consumo interrompe a subida entre duas iterações;
+        melhor_rota e menor_distancia ficam com a rota corrente.
+        
+        Args:
+            criterio: CriterioParada, como em iniciar_tsp
+        
+        Yields:
+            EventoIteracao: iteração, distância corrente, tempo decorrido e se houve troca
+        """
+        if self.instancia is None:
+            raise ValueError("Grafo não foi definido para resolver TSP")
+        return self._iterar_tsp(criterio)
+    
+    def _iterar_tsp(self, criterio: Optional[CriterioParada]) -> Iterator[EventoIteracao]:
+        """Gerador de iterar_tsp"""
+        tempo_inicio = time.time()
+        self.perfilador.reiniciar()
+        if criterio is not None:
+            criterio.iniciar()
+        
+        try:
+            yield from self._iterar_reinicio_tsp(tempo_inicio, criterio)
+        finally:
+            self.tempo_execucao = time.time() - tempo_inicio
+    
+    def schwefel(self, x: np.ndarray) -> Union[float, np.ndarray]:
+        """
+        Avalia a função de Schwefel para otimização contínua.
+        
+        Args:
+            x: Vetor de entrada ou matriz (lote x dimensões)
+            
+        Returns:
+            Valor da função Schwefel, ou vetor de valores para um lote
+        """
+        return self.funcao_objetivo(x)
     
     def gerar_solucao_aleatoria(self, dimensoes: int, limite_inf: float, limite_sup: float) -> np.ndarray:
         """
@@ -175,12 +392,13 @@ class HillClimbing:
         Returns:
             Vetor solução inicial
         """
-        return np.random.uniform(limite_inf, limite_sup, dimensoes)
+        return self.rng.uniform(limite_inf, limite_sup, dimensoes)
     
     def gerar_vizinho_continuo(self, solucao_atual: np.ndarray, 
                               passo_maximo: float = 5.0,
                               limite_inf: float = -500,
-                              limite_sup: float = 500) -> np.ndarray:
+                              limite_sup: float = 500,
+                              num_vizinhos: Optional[int] = None) -> np.ndarray:
         """
         Gera um vizinho para otimização contínua.
         
@@ -189,16 +407,66 @@ class HillClimbing:
             passo_maximo: Tamanho máximo do passo
             limite_inf: Limite inferior
             limite_sup: Limite superior
+            num_vizinhos: Se informado, gera uma matriz (num_vizinhos x dimensões) de vizinhos
             
         Returns:
-            Solução vizinha
+            Solução vizinha, ou matriz de vizinhos
         """
-        vizinho = solucao_atual + np.random.normal(0, passo_maximo, len(solucao_atual))
+        forma = len(solucao_atual) if num_vizinhos is None else (num_vizinhos, len(solucao_atual))
+        vizinho = solucao_atual + self.rng.normal(0, passo_maximo, forma)
         return np.clip(vizinho, limite_inf, limite_sup)
     
+    def _reinicio_continuo(self, dimensoes: int, limite_inf: float, limite_sup: float,
+                           num_vizinhos_por_iter: int,
+                           criterio: Optional[CriterioParada] = None) -> Tuple[np.ndarray, float, List[float]]:
+        """
+        Executa uma subida contínua a partir de uma solução aleatória.
+        
+        Returns:
+            Tupla (solucao, valor, historico) com o valor corrente a cada iteração
+        """
+        solucao_atual = self.gerar_solucao_aleatoria(dimensoes, limite_inf, limite_sup)
+        valor_atual = self.schwefel(solucao_atual)
+        historico = []
+        if self.verbose:
+            print(f"Valor inicial: {valor_atual:.4f}")
+        
+        iter_sem_melhora = 0
+        vizinhanca, avaliacao = self.perfilador.fase("vizinhanca"), self.perfilador.fase("avaliacao")
+        while iter_sem_melhora < self.max_iter_sem_melhora and not self._alvo_atingido():
+            self.total_iteracoes += 1
+            
+            # Gera e avalia todos os vizinhos da iteração em uma única chamada
+            with vizinhanca:
+                vizinhos = self.gerar_vizinho_continuo(solucao_atual, 
+                                                      limite_inf=limite_inf, 
+                                                      limite_sup=limite_sup,
+                                                      num_vizinhos=num_vizinhos_por_iter)
+            with avaliacao:
+                valores_vizinhos = self.schwefel(vizinhos)
+            melhor = int(np.argmin(valores_vizinhos))
+            
+            # Atualiza se encontrou melhoria local
+            if valores_vizinhos[melhor] < valor_atual:
+                self.perfilador.contar("movimentos_aceitos")
+                solucao_atual = vizinhos[melhor]
+                valor_atual = float(valores_vizinhos[melhor])
+                iter_sem_melhora = 0
+                self._publicar_custo(valor_atual)
+            else:
+                iter_sem_melhora += 1
+            
+            historico.append(valor_atual)
+            if criterio is not None and criterio.deve_parar(valor_atual, self.funcao_objetivo.avaliacoes):
+                break
+        
+        return solucao_atual, valor_atual, historico
+    
     def iniciar_continuo(self, dimensoes: int, intervalo: Tuple[float, float],
                         max_reinicios: int = 10, 
-                        num_vizinhos_por_iter: int = 20) -> Tuple[np.ndarray, float, List[float]]:
+                        num_vizinhos_por_iter: int = 20,
+                        checkpoint: Optional[Checkpoint] = None,
+                        criterio: Optional[CriterioParada] = None) -> Tuple[np.ndarray, float, List[float]]:
         """
         Executa o Hill Climbing com reinício aleatório para otimização contínua.
         
@@ -207,6 +475,10 @@ class HillClimbing:
             intervalo: Tupla (limite_inferior, limite_superior)
             max_reinicios: Número máximo de reinícios
             num_vizinhos_por_iter: Número de vizinhos avaliados por iteração
+            checkpoint: Checkpoint gravado a cada checkpoint.intervalo reinícios
+                concluídos; se o arquivo já existir, a execução é retomada dele
+            criterio: CriterioParada verificado a cada iteração (o melhor custo é o
+                global entre os reinícios); max_reinicios continua sendo o teto
             
         Returns:
             Tupla contendo (melhor_solucao, melhor_valor, historico_custos)
@@ -218,66 +490,176 @@ class HillClimbing:
         melhor_valor_global = float("inf")
         self.historico_custos = []
         self.total_iteracoes = 0
+        self.funcao_objetivo.reiniciar_contador()
+        self.perfilador.reiniciar()
+        reinicio_inicial = 0
+        if checkpoint is not None and checkpoint.existe():
+            reinicio_inicial, melhor_solucao_global, melhor_valor_global = self._restaurar_checkpoint(checkpoint,
+                                                                                                     dimensoes)
         
-        print(f"Iniciando Hill Climbing contínuo com {max_reinicios} reinícios")
-        print(f"Dimensões: {dimensoes}, Intervalo: {intervalo}")
+        if self.verbose:
+            print(f"Iniciando Hill Climbing contínuo com {max_reinicios} reinícios")
+            print(f"Dimensões: {dimensoes}, Intervalo: {intervalo}")
+            if reinicio_inicial:
+                print(f"Retomando do checkpoint {checkpoint.caminho} no reinício {reinicio_inicial + 1}")
+        if criterio is not None:
+            criterio.iniciar()
         
-        for reinicio in range(max_reinicios):
-            print(f"\n--- Reinício {reinicio + 1}/{max_reinicios} ---")
+        for reinicio in range(reinicio_inicial, max_reinicios):
+            if self.verbose:
+                print(f"\n--- Reinício {reinicio + 1}/{max_reinicios} ---")
             
-            # Solução inicial para este reinício
-            solucao_atual = self.gerar_solucao_aleatoria(dimensoes, limite_inf, limite_sup)
-            valor_atual = self.schwefel(solucao_atual)
-            print(f"Valor inicial: {valor_atual:.4f}")
+            solucao, valor, historico = self._reinicio_continuo(dimensoes, limite_inf, limite_sup,
+                                                                num_vizinhos_por_iter, criterio)
             
-            iter_sem_melhora = 0
-            while iter_sem_melhora < self.max_iter_sem_melhora:
-                self.total_iteracoes += 1
-                melhor_vizinho = None
-                melhor_valor_vizinho = valor_atual
-                encontrou_melhor_local = False
-                
-                # Gera e avalia múltiplos vizinhos
-                for _ in range(num_vizinhos_por_iter):
-                    vizinho = self.gerar_vizinho_continuo(solucao_atual, 
-                                                        limite_inf=limite_inf, 
-                                                        limite_sup=limite_sup)
-                    valor_vizinho = self.schwefel(vizinho)
-                    
-                    if valor_vizinho < melhor_valor_vizinho:
-                        melhor_vizinho = vizinho
-                        melhor_valor_vizinho = valor_vizinho
-                        encontrou_melhor_local = True
-                
-                # Atualiza se encontrou melhoria local
-                if encontrou_melhor_local:
-                    solucao_atual = melhor_vizinho
-                    valor_atual = melhor_valor_vizinho
-                    iter_sem_melhora = 0
-                else:
-                    iter_sem_melhora += 1
-                
-                # Atualiza melhor solução global
-                if valor_atual < melhor_valor_global:
-                    melhor_solucao_global = solucao_atual.copy()
-                    melhor_valor_global = valor_atual
+            # Histórico do melhor valor global a cada iteração
+            self.historico_custos.extend(np.minimum.accumulate([melhor_valor_global] + historico)[1:].tolist())
+            
+            # Atualiza melhor solução global
+            if valor < melhor_valor_global:
+                melhor_solucao_global = solucao.copy()
+                melhor_valor_global = valor
+                self.perfilador.contar("melhorias")
+                if self.verbose:
                     print(f"*** Novo melhor global: {melhor_valor_global:.4f} ***")
-                
-                self.historico_custos.append(melhor_valor_global)
+            
+            if checkpoint is not None and checkpoint.deve_gravar(reinicio + 1):
+                with self.perfilador.fase("checkpoint"):
+                    self._gravar_checkpoint(checkpoint, reinicio + 1, melhor_solucao_global,
+                                            melhor_valor_global)
+            if criterio is not None and criterio.parou:
+                if self.verbose:
+                    print(f"Parada no reinício {reinicio + 1}: {criterio.motivo}")
+                break
         
+        self.perfilador.contar("avaliacoes", self.funcao_objetivo.avaliacoes)
         tempo_fim = time.time()
         self.tempo_execucao = tempo_fim - tempo_inicio
         
-        # Calcula precisão (distância ao mínimo global conhecido)
-        minimo_global = np.array([420.968746] * dimensoes)
-        precisao = np.linalg.norm(melhor_solucao_global - minimo_global) if melhor_solucao_global is not None else float("inf")
-        
-        print(f"\nAlgoritmo concluído após {self.total_iteracoes} iterações totais")
-        print(f"Melhor valor encontrado: {melhor_valor_global:.4f}")
-        print(f"Precisão (distância euclidiana): {precisao:.4f}")
+        if self.verbose:
+            # Calcula precisão (distância ao mínimo global conhecido)
+            minimo_global = np.full(dimensoes, Schwefel.MINIMO_GLOBAL)
+            precisao = np.linalg.norm(melhor_solucao_global - minimo_global) if melhor_solucao_global is not None else float("inf")
+            
+            print(f"\nAlgoritmo concluído após {self.total_iteracoes} iterações totais")
+            print(f"Melhor valor encontrado: {melhor_valor_global:.4f}")
+            print(f"Precisão (distância euclidiana): {precisao:.4f}")
         
         return melhor_solucao_global, melhor_valor_global, self.historico_custos
     
+    def _gravar_checkpoint(self, checkpoint: Checkpoint, reinicios_concluidos: int,
+                           melhor_solucao: np.ndarray, melhor_valor: float):
+        """Grava o estado de iniciar_continuo após reinicios_concluidos reinícios"""
+        estado = {
+            'solver': 'HillClimbing',
+            'reinicios_concluidos': reinicios_concluidos,
+            'melhor_valor': melhor_valor,
+            'total_iteracoes': self.total_iteracoes,
+            'avaliacoes': self.funcao_objetivo.avaliacoes,
+            'rng': self.rng.bit_generator.state
+        }
+        checkpoint.gravar(estado, melhor_solucao=melhor_solucao,
+                          historico_custos=np.asarray(self.historico_custos, dtype=np.float64))
+    
+    def _restaurar_checkpoint(self, checkpoint: Checkpoint, dimensoes: int) -> Tuple[int, np.ndarray, float]:
+        """
+        Restaura o estado gravado por _gravar_checkpoint.
+        
+        Returns:
+            Tupla (reinícios concluídos, melhor solução, melhor valor)
+        """
+        estado, arrays = checkpoint.carregar()
+        melhor_solucao = arrays['melhor_solucao']
+        if estado.get('solver') != 'HillClimbing' or melhor_solucao.shape != (dimensoes,):
+            raise ValueError(f"Checkpoint incompatível com esta execução: {checkpoint.caminho}")
+        
+        self.historico_custos = arrays['historico_custos'].tolist()
+        self.total_iteracoes = estado['total_iteracoes']
+        self.funcao_objetivo.avaliacoes = estado['avaliacoes']
+        self.rng.bit_generator.state = estado['rng']
+        return estado['reinicios_concluidos'], melhor_solucao, estado['melhor_valor']
+    
+    def iniciar_multiplos(self, num_reinicios: int, problema: str = "tsp",
+                          dimensoes: Optional[int] = None,
+                          intervalo: Tuple[float, float] = (-500, 500),
+                          num_vizinhos_por_iter: int = 20,
+                          num_processos: Optional[int] = None,
+                          custo_alvo: Optional[float] = None) -> Tuple[Any, float, List[List[float]]]:
+        """
+        Executa reinícios independentes do Hill Climbing distribuídos em processos.
+        Cada reinício usa seu próprio gerador, derivado de SeedSequence(semente).spawn,
+        então o resultado não depende do número de processos (exceto quando a parada
+        antecipada por custo_alvo interrompe reinícios em andamento).
+        
+        Args:
+            num_reinicios: Número de reinícios
+            problema: "tsp" ou "continuo" (Schwefel)
+            dimensoes: Número de dimensões do problema contínuo
+            intervalo: Tupla (limite_inferior, limite_superior) do problema contínuo
+            num_vizinhos_por_iter: Vizinhos avaliados por iteração no problema contínuo
+            num_processos: Número de processos (padrão: um por CPU; 1 executa no próprio processo)
+            custo_alvo: Custo que, atingido por qualquer reinício, encerra os demais
+            
+        Returns:
+            Tupla contendo (melhor_solucao, melhor_valor, historicos_por_reinicio)
+        """
+        if problema not in ("tsp", "continuo"):
+            raise ValueError(f"Problema inválido: {problema}")
+        if problema == "tsp" and self.instancia is None:
+            raise ValueError("Grafo não foi definido para resolver TSP")
+        if problema == "continuo" and not dimensoes:
+            raise ValueError("Dimensões não foram definidas para o problema contínuo")
+        
+        tempo_inicio = time.time()
+        sementes = np.random.SeedSequence(self.semente).spawn(num_reinicios)
+        argumentos = (dimensoes, intervalo[0], intervalo[1], num_vizinhos_por_iter) if problema == "continuo" else ()
+        parametros = {
+            "max_iter_sem_melhora": self.max_iter_sem_melhora,
+            "cidade_inicial": self.cidade_inicial,
+            "modo_vizinhanca": self.modo_vizinhanca,
+            "tamanho_bloco": self.tamanho_bloco,
+            "vizinhanca": self.vizinhanca
+        }
+        melhor_compartilhado = multiprocessing.Value("d", float("inf"))
+        inicializacao = (self.instancia, parametros, melhor_compartilhado, custo_alvo)
+        
+        if self.verbose:
+            print(f"Iniciando {num_reinicios} reinícios do Hill Climbing ({problema})")
+        
+        if num_processos == 1:
+            _inicializar_reinicio(*inicializacao)
+            resultados = [_executar_reinicio(problema, semente, argumentos) for semente in sementes]
+        else:
+            with ProcessPoolExecutor(max_workers=num_processos, initializer=_inicializar_reinicio,
+                                     initargs=inicializacao) as executor:
+                resultados = list(executor.map(_executar_reinicio, [problema] * num_reinicios,
+                                               sementes, [argumentos] * num_reinicios))
+        
+        # Junta os reinícios: melhor solução, históricos e curva do melhor global
+        valores = [r[1] for r in resultados]
+        melhor = int(np.argmin(valores))
+        melhor_solucao, melhor_valor = resultados[melhor][0], valores[melhor]
+        historicos = [r[2] for r in resultados]
+        
+        self.historico_custos = []
+        melhor_valor_global = float("inf")
+        for historico in historicos:
+            self.historico_custos.extend(np.minimum.accumulate([melhor_valor_global] + historico)[1:].tolist())
+            if historico:
+                melhor_valor_global = min(melhor_valor_global, min(historico))
+        self.total_iteracoes = sum(r[3]["total_iteracoes"] for r in resultados)
+        self.avaliacoes_vizinhos = sum(r[3]["avaliacoes_vizinhos"] for r in resultados)
+        self.funcao_objetivo.avaliacoes = sum(r[3]["avaliacoes"] for r in resultados)
+        self.tempo_execucao = time.time() - tempo_inicio
+        
+        if self.verbose:
+            for k, valor in enumerate(valores):
+                print(f"Reinício {k + 1}: {valor:.4f}")
+            print(f"\nMelhor valor encontrado: {melhor_valor:.4f} (reinício {melhor + 1})")
+            print(f"Tempo de execução: {self.tempo_execucao:.4f} segundos")
+        
+        return melhor_solucao, melhor_valor, historicos
+    
     def get_estatisticas(self) -> Dict[str, Any]:
         """
         Retorna estatísticas da última execução.
@@ -289,5 +671,38 @@ class HillClimbing:
             "tempo_execucao": self.tempo_execucao,
             "total_iteracoes": self.total_iteracoes,
             "historico_custos": self.historico_custos,
-            "max_iter_sem_melhora": self.max_iter_sem_melhora
-        }
\ No newline at end of file
+            "max_iter_sem_melhora": self.max_iter_sem_melhora,
+            "avaliacoes": self.funcao_objetivo.avaliacoes,
+            "avaliacoes_vizinhos": self.avaliacoes_vizinhos,
+            "perfil": self.perfilador.get_estatisticas()
+        }
+
+
+_HC_REINICIO = None
+
+
+def _inicializar_reinicio(instancia, parametros, melhor_compartilhado, custo_alvo):
+    global _HC_REINICIO
+    _HC_REINICIO = HillClimbing(instancia, verbose=False, **parametros)
+    _HC_REINICIO._melhor_compartilhado = melhor_compartilhado
+    _HC_REINICIO.custo_alvo = custo_alvo
+
+
+def _executar_reinicio(problema, semente, argumentos):
+    # Cada reinício recebe um gerador novo a partir da sua SeedSequence
+    hc = _HC_REINICIO
+    hc.rng = np.random.default_rng(semente)
+    hc.total_iteracoes = 0
+    hc.avaliacoes_vizinhos = 0
+    hc.funcao_objetivo.reiniciar_contador()
+    if problema == "tsp":
+        solucao, valor = hc._reinicio_tsp()
+        historico = hc.historico_custos
+    else:
+        solucao, valor, historico = hc._reinicio_continuo(*argumentos)
+    contadores = {
+        "total_iteracoes": hc.total_iteracoes,
+        "avaliacoes": hc.funcao_objetivo.avaliacoes,
+        "avaliacoes_vizinhos": hc.avaliacoes_vizinhos
+    }
+    return solucao, float(valor), list(historico), contadores
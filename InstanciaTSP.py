@@ -0,0 +1,326 @@
+import numpy as np
+from typing import Dict, List, Optional, Any
+from OraculoDistancias import OraculoDistancias, distancias_pontos, preparar_pontos
+
+
+class InstanciaTSP:
+    """
+    Instância do TSP compartilhada por todos os solvers.
+    Constrói uma única vez a matriz densa de distâncias (NumPy, contígua) a partir
+    do dicionário de adjacência e, opcionalmente, fecha o grafo esparso sob
+    caminhos mínimos (Floyd-Warshall), guardando a matriz de próximos saltos
+    para expandir cada aresta no caminho real do grafo original.
+    """
+
+    # Bytes de cada bloco de linhas (em float64) nas operações sobre a matriz inteira:
+    # limita os temporários independentemente do número de cidades
+    LIMITE_BYTES_BLOCO = 32 * 2**20
+
+    # Maior distância guardada em int32: deixa folga para somas de algumas arestas (deltas)
+    MAXIMO_INT32 = np.iinfo(np.int32).max // 8
+
+    def __init__(self, grafo_adj: Dict, fechar_caminhos: bool = True):
+        """
+        Inicializa a instância a partir de um grafo de adjacência.
+
+        Args:
+            grafo_adj: Dicionário de adjacência no formato {cidade: {vizinho: distancia, ...}}
+            fechar_caminhos: Se deve substituir arestas inexistentes pela distância
+                do caminho mínimo, tornando toda rota finita
+        """
+        self.grafo_adj = grafo_adj
+        self._definir_cidades(list(grafo_adj.keys()))
+        self.matriz_distancias = self._converter_para_matriz()
+        self._preparar(fechar_caminhos)
+        self.coordenadas = None
+
+    @classmethod
+    def de_matriz(cls, matriz, cidades: Optional[List[Any]] = None,
+                  fechar_caminhos: bool = True,
+                  coordenadas: Optional[np.ndarray] = None) -> "InstanciaTSP":
+        """
+        Constrói uma instância diretamente de uma matriz de distâncias, sem grafo
+        de adjacência (grafo_adj fica None). Matrizes já compactas (int32 ou float32)
+        com diagonal nula são usadas sem cópia, inclusive arrays mapeados em memória;
+        as demais são convertidas para o tipo escolhido por tipo_distancias.
+
+        Args:
+            matriz: Matriz (n x n) de distâncias; np.inf marca arestas inexistentes
+            cidades: Nomes das cidades (padrão: 1..n, como nas instâncias do projeto)
+            fechar_caminhos: Se deve fechar arestas inexistentes por caminhos mínimos
+            coordenadas: Coordenadas (n x 2) das cidades, quando conhecidas
+
+        Returns:
+            Nova InstanciaTSP
+        """
+        matriz = np.asarray(matriz)
+        if matriz.ndim != 2 or matriz.shape[0] != matriz.shape[1]:
+            raise ValueError(f"Matriz de distâncias deve ser quadrada, recebida com forma {matriz.shape}")
+        if np.diagonal(matriz).any():
+            matriz = np.array(matriz)
+            np.fill_diagonal(matriz, 0.0)
+
+        instancia = cls.__new__(cls)
+        instancia.grafo_adj = None
+        instancia._definir_cidades(list(cidades) if cidades is not None else list(range(1, len(matriz) + 1)))
+        instancia.matriz_distancias = matriz
+        instancia._preparar(fechar_caminhos)
+        instancia.coordenadas = coordenadas
+        return instancia
+
+    @classmethod
+    def de_coordenadas(cls, coordenadas, tipo: str = 'EUCLIDIANA', densa: bool = True,
+                       cidades: Optional[List[Any]] = None,
+                       linhas_cache: int = 128) -> "InstanciaTSP":
+        """
+        Constrói uma instância completa a partir das coordenadas das cidades.
+
+        Args:
+            coordenadas: Coordenadas (n x 2) das cidades
+            tipo: 'EUCLIDIANA' (exata) ou as regras TSPLIB 'EUC_2D', 'ATT' e 'GEO'
+            densa: Se deve calcular a matriz n x n; se False, as distâncias vêm de um
+                OraculoDistancias calculado sob demanda (para instâncias muito grandes)
+            cidades: Nomes das cidades (padrão: 1..n)
+            linhas_cache: Linhas mantidas no cache LRU do oráculo
+
+        Returns:
+            Nova InstanciaTSP
+        """
+        coordenadas = np.asarray(coordenadas, dtype=np.float64)
+        if coordenadas.ndim != 2 or coordenadas.shape[1] != 2:
+            raise ValueError(f"Coordenadas devem ter forma (n, 2), recebidas com forma {coordenadas.shape}")
+
+        if densa:
+            pontos = preparar_pontos(coordenadas, tipo)
+            n = len(pontos)
+            # As regras TSPLIB arredondam para inteiros; a euclidiana exata fica em float32
+            matriz = np.empty((n, n), dtype=np.float32 if tipo == 'EUCLIDIANA' else np.int32)
+            linhas_por_bloco = cls.linhas_por_bloco(n)
+            for inicio in range(0, n, linhas_por_bloco):
+                bloco = pontos[inicio:inicio + linhas_por_bloco]
+                matriz[inicio:inicio + len(bloco)] = distancias_pontos(bloco[:, np.newaxis], pontos[np.newaxis], tipo)
+            return cls.de_matriz(matriz, cidades, fechar_caminhos=False, coordenadas=coordenadas)
+
+        instancia = cls.__new__(cls)
+        instancia.grafo_adj = None
+        instancia._definir_cidades(list(cidades) if cidades is not None else list(range(1, len(coordenadas) + 1)))
+        instancia.matriz_distancias = OraculoDistancias(coordenadas, tipo, linhas_cache)
+        instancia._preparar(fechar_caminhos=False)
+        instancia.coordenadas = coordenadas
+        return instancia
+
+    @classmethod
+    def linhas_por_bloco(cls, num_colunas: int) -> int:
+        """Linhas de num_colunas valores float64 que cabem em LIMITE_BYTES_BLOCO (ao menos uma)"""
+        return max(1, cls.LIMITE_BYTES_BLOCO // (8 * max(1, num_colunas)))
+
+    @property
+    def densa(self) -> bool:
+        """Se as distâncias estão em uma matriz densa (e não em um OraculoDistancias)"""
+        return isinstance(self.matriz_distancias, np.ndarray)
+
+    @classmethod
+    def tipo_distancias(cls, matriz: np.ndarray) -> np.dtype:
+        """
+        Escolhe o tipo compacto da matriz de distâncias: int32 quando todas as
+        distâncias são finitas, inteiras e até MAXIMO_INT32; float32 nos demais casos.
+        Matrizes que já são int32 ou float32 mantêm o tipo.
+        """
+        if matriz.dtype in (np.int32, np.float32):
+            return matriz.dtype
+        if np.issubdtype(matriz.dtype, np.integer):
+            inteira = True
+        elif np.issubdtype(matriz.dtype, np.floating):
+            inteira = True
+            linhas_por_bloco = cls.linhas_por_bloco(matriz.shape[1])
+            for inicio in range(0, len(matriz), linhas_por_bloco):
+                bloco = matriz[inicio:inicio + linhas_por_bloco]
+                if not (np.isfinite(bloco).all() and (bloco == np.trunc(bloco)).all()):
+                    inteira = False
+                    break
+        else:
+            inteira = False
+        if inteira and (matriz.size == 0 or np.abs(matriz).max() <= cls.MAXIMO_INT32):
+            return np.dtype(np.int32)
+        return np.dtype(np.float32)
+
+    @staticmethod
+    def tipo_indices(num_cidades: int) -> np.dtype:
+        """Menor tipo inteiro para índices de cidades em rotas e listas de vizinhos (uint16 ou int32)"""
+        return np.dtype(np.uint16 if num_cidades <= np.iinfo(np.uint16).max + 1 else np.int32)
+
+    def _definir_cidades(self, cidades: List[Any]):
+        """Define a lista de cidades e os mapeamentos entre nomes e índices"""
+        self.cidades = cidades
+        self.num_cidades = len(cidades)
+        self.cidade_para_indice = {cidade: i for i, cidade in enumerate(cidades)}
+        self.indice_para_cidade = {i: cidade for i, cidade in enumerate(cidades)}
+
+    def _preparar(self, fechar_caminhos: bool):
+        """Inicializa as estruturas derivadas da matriz de distâncias"""
+        # proximo_salto[i, j]: primeira cidade após i no caminho mínimo até j (-1 se não há caminho)
+        self.proximo_salto = None
+        self.caminhos_fechados = False
+        self._vizinhos_cache = {}
+        if fechar_caminhos and not np.isfinite(self.matriz_distancias).all():
+            self._fechar_caminhos_minimos()
+
+        # Matriz densa no tipo compacto (int32/float32): metade da memória de float64
+        if self.densa:
+            tipo = self.tipo_distancias(self.matriz_distancias)
+            if self.matriz_distancias.dtype != tipo:
+                self.matriz_distancias = self.matriz_distancias.astype(tipo)
+
+    @classmethod
+    def de_grafo(cls, grafo, fechar_caminhos: bool = True) -> "InstanciaTSP":
+        """
+        Retorna a própria instância se já for uma InstanciaTSP, ou constrói uma nova
+        a partir do dicionário de adjacência.
+        """
+        if isinstance(grafo, cls):
+            return grafo
+        return cls(grafo, fechar_caminhos=fechar_caminhos)
+
+    def _converter_para_matriz(self) -> np.ndarray:
+        """Converte dicionário de adjacência para matriz densa de distâncias"""
+        n = self.num_cidades
+        matriz = np.full((n, n), np.inf, dtype=np.float64)
+        np.fill_diagonal(matriz, 0.0)
+
+        for cidade, vizinhos in self.grafo_adj.items():
+            i = self.cidade_para_indice[cidade]
+            for vizinho, distancia in vizinhos.items():
+                j = self.cidade_para_indice.get(vizinho)
+                if j is not None and i != j:
+                    matriz[i, j] = distancia
+
+        return matriz
+
+    def _fechar_caminhos_minimos(self):
+        """Aplica Floyd-Warshall vetorizado, mantendo a matriz de próximos saltos"""
+        n = self.num_cidades
+        dist = self.matriz_distancias
+        indices = np.arange(n)
+
+        proximo = np.where(np.isfinite(dist), indices[np.newaxis, :], -1)
+        proximo[indices, indices] = indices
+
+        for k in range(n):
+            via_k = dist[:, k, np.newaxis] + dist[np.newaxis, k, :]
+            melhora = via_k < dist
+            if melhora.any():
+                dist = np.where(melhora, via_k, dist)
+                proximo = np.where(melhora, proximo[:, k, np.newaxis], proximo)
+
+        self.matriz_distancias = np.ascontiguousarray(dist)
+        self.proximo_salto = proximo.astype(np.int32)
+        self.caminhos_fechados = True
+
+    def vizinhos_proximos(self, k: int) -> np.ndarray:
+        """
+        Calcula as listas de candidatos: os k vizinhos mais próximos de cada cidade.
+
+        Args:
+            k: Número de vizinhos por cidade (limitado a num_cidades - 1)
+
+        Returns:
+            Matriz (num_cidades x k) de índices (tipo_indices), ordenados por distância crescente
+        """
+        k = max(1, min(k, self.num_cidades - 1))
+        if k not in self._vizinhos_cache:
+            n = self.num_cidades
+            vizinhos = np.empty((n, k), dtype=self.tipo_indices(n))
+
+            # Processa blocos de linhas para não copiar a matriz inteira (nem calcular de uma vez
+            # no OraculoDistancias), com memória de pico limitada por LIMITE_BYTES_BLOCO
+            linhas_por_bloco = self.linhas_por_bloco(n)
+            for inicio in range(0, n, linhas_por_bloco):
+                distancias = np.array(self.matriz_distancias[inicio:inicio + linhas_por_bloco], dtype=np.float64)
+                linhas = np.arange(len(distancias))
+                distancias[linhas, inicio + linhas] = np.inf
+
+                bloco = np.argpartition(distancias, k - 1, axis=1)[:, :k]
+                ordem = np.argsort(np.take_along_axis(distancias, bloco, axis=1), axis=1, kind='stable')
+                vizinhos[inicio:inicio + len(bloco)] = np.take_along_axis(bloco, ordem, axis=1)
+            self._vizinhos_cache[k] = vizinhos
+        return self._vizinhos_cache[k]
+
+    def distancia(self, i: int, j: int) -> float:
+        """Distância entre as cidades de índices i e j"""
+        return self.matriz_distancias[i, j]
+
+    def custo_rota(self, rota, fechada: bool = True) -> float:
+        """
+        Calcula o custo de uma rota de índices.
+
+        Args:
+            rota: Sequência de índices de cidades
+            fechada: Se deve somar a aresta de retorno da última para a primeira cidade
+
+        Returns:
+            Custo total da rota (acumulado em float64)
+        """
+        rota = np.asarray(rota, dtype=np.intp)
+        if fechada:
+            return float(self.matriz_distancias[rota, np.roll(rota, -1)].sum(dtype=np.float64))
+        return float(self.matriz_distancias[rota[:-1], rota[1:]].sum(dtype=np.float64))
+
+    def custo_rotas(self, rotas: np.ndarray) -> np.ndarray:
+        """
+        Calcula o custo de várias rotas fechadas de uma vez, com um único gather
+        sobre a matriz de distâncias seguido de uma soma por linha.
+
+        Args:
+            rotas: Matriz (num_rotas x num_cidades) de índices
+
+        Returns:
+            Vetor float64 com o custo de cada rota
+        """
+        return self.matriz_distancias[rotas, np.roll(rotas, -1, axis=1)].sum(axis=1, dtype=np.float64)
+
+    def para_indices(self, rota: List[Any]) -> List[int]:
+        """Converte uma rota de nomes de cidades para índices"""
+        return [self.cidade_para_indice[cidade] for cidade in rota]
+
+    def para_cidades(self, rota) -> List[Any]:
+        """Converte uma rota de índices para nomes de cidades"""
+        return [self.indice_para_cidade[int(idx)] for idx in rota]
+
+    def expandir_caminho(self, i: int, j: int) -> List[int]:
+        """
+        Expande a aresta (i, j) da instância no caminho real do grafo original.
+
+        Returns:
+            Lista de índices de i até j (inclusive); vazia se não há caminho
+        """
+        if not np.isfinite(self.matriz_distancias[i, j]):
+            return []
+        if self.proximo_salto is None:
+            return [i, j] if i != j else [i]
+
+        caminho = [i]
+        while i != j:
+            i = int(self.proximo_salto[i, j])
+            caminho.append(i)
+        return caminho
+
+    def expandir_rota(self, rota: List[Any], fechada: bool = True) -> List[Any]:
+        """
+        Expande uma rota de nomes de cidades no passeio real do grafo original,
+        inserindo as cidades intermediárias de cada caminho mínimo.
+
+        Args:
+            rota: Rota em nomes de cidades
+            fechada: Se deve incluir o retorno da última para a primeira cidade
+
+        Returns:
+            Passeio em nomes de cidades
+        """
+        indices = self.para_indices(rota)
+        if fechada and indices and indices[0] != indices[-1]:
+            indices = indices + [indices[0]]
+
+        passeio = indices[:1]
+        for origem, destino in zip(indices[:-1], indices[1:]):
+            passeio.extend(self.expandir_caminho(origem, destino)[1:])
+        return self.para_cidades(passeio)
@@ -0,0 +1,71 @@
+import re
+import numpy as np
+from InstanciaTSP import InstanciaTSP
+from TSPLIB import LIMITE_MATRIZ_DENSA, carregar_tsplib
+
+# Grafo de 18 cidades do enunciado do projeto
+GRAFO = {
+    1: {2: 20, 8: 29, 12: 29, 13: 37},
+    2: {1: 20, 3: 25, 8: 28, 12: 39},
+    3: {2: 25, 4: 25, 8: 30, 13: 54},
+    4: {3: 25, 6: 32, 5: 39, 9: 23, 10: 33, 7: 42, 14: 56},
+    5: {4: 39, 6: 12, 7: 26, 10: 19},
+    6: {4: 32, 5: 12, 7: 17, 10: 35, 11: 30},
+    7: {4: 42, 5: 26, 6: 17, 11: 38},
+    8: {1: 29, 2: 28, 3: 30, 12: 25, 13: 22},
+    9: {4: 23, 10: 26, 13: 34, 14: 34, 16: 43},
+    10: {4: 33, 5: 19, 6: 35, 9: 26, 11: 24, 14: 30, 15: 19},
+    11: {6: 30, 7: 38, 10: 24, 15: 26, 18: 36},
+    12: {1: 29, 2: 39, 8: 25, 13: 27, 16: 43},
+    13: {1: 37, 3: 54, 8: 22, 9: 34, 12: 27, 14: 24, 16: 19},
+    14: {4: 56, 9: 34, 10: 30, 13: 24, 15: 20, 16: 19, 17: 17},
+    15: {10: 19, 11: 26, 14: 20, 17: 18, 18: 21},
+    16: {9: 43, 12: 43, 13: 19, 14: 19, 17: 26},
+    17: {14: 17, 15: 18, 16: 26, 18: 15},
+    18: {11: 36, 15: 21, 17: 15}
+}
+
+INSTANCIAS = {
+    'grafo18': GRAFO
+}
+
+
+def instancia_aleatoria(num_cidades: int, semente: int = 0) -> InstanciaTSP:
+    """
+    Gera uma instância euclidiana completa com cidades uniformes no quadrado [0, 1000]².
+
+    Args:
+        num_cidades: Número de cidades
+        semente: Semente das coordenadas (a mesma semente gera sempre a mesma instância)
+
+    Returns:
+        InstanciaTSP com as distâncias euclidianas (em OraculoDistancias acima
+        de LIMITE_MATRIZ_DENSA cidades)
+    """
+    coordenadas = np.random.default_rng(semente).uniform(0, 1000, (num_cidades, 2))
+    return InstanciaTSP.de_coordenadas(coordenadas, densa=num_cidades <= LIMITE_MATRIZ_DENSA)
+
+
+def carregar_instancia(nome: str) -> InstanciaTSP:
+    """
+    Carrega uma instância do TSP pelo nome.
+
+    Args:
+        nome: Nome registrado em INSTANCIAS (ex. 'grafo18'), 'aleatoria<n>'
+            para uma instância euclidiana aleatória de n cidades (ex. 'aleatoria200')
+            ou o caminho de um arquivo TSPLIB .tsp (carregado com cache binário)
+
+    Returns:
+        InstanciaTSP correspondente
+    """
+    if nome in INSTANCIAS:
+        return InstanciaTSP(INSTANCIAS[nome])
+
+    if nome.lower().endswith('.tsp'):
+        return carregar_tsplib(nome)
+
+    aleatoria = re.fullmatch(r'aleatoria(\d+)', nome)
+    if aleatoria:
+        return instancia_aleatoria(int(aleatoria.group(1)))
+
+    raise ValueError(f"Instância desconhecida: {nome}")
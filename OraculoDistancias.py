@@ -0,0 +1,157 @@
+import math
+import numbers
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+
+TIPOS_DISTANCIA = ('EUCLIDIANA', 'EUC_2D', 'ATT', 'GEO')
+
+
+def preparar_pontos(coordenadas: np.ndarray, tipo: str = 'EUCLIDIANA') -> np.ndarray:
+    """
+    Converte as coordenadas para a representação usada no cálculo das distâncias:
+    latitude/longitude em radianos no tipo GEO, as próprias coordenadas nos demais.
+    """
+    if tipo not in TIPOS_DISTANCIA:
+        raise ValueError(f"Tipo de distância inválido: {tipo}")
+    pontos = np.ascontiguousarray(coordenadas, dtype=np.float64)
+    if tipo == 'GEO':
+        # Coordenadas em graus.minutos, convertidas como na especificação TSPLIB
+        graus = np.trunc(pontos)
+        pontos = 3.141592 * (graus + 5.0 * (pontos - graus) / 3.0) / 180.0
+    return pontos
+
+
+def distancias_pontos(a: np.ndarray, b: np.ndarray, tipo: str = 'EUCLIDIANA') -> np.ndarray:
+    """
+    Distância elemento a elemento entre pontos já preparados (ver preparar_pontos),
+    com broadcasting: a[:, np.newaxis] contra b[np.newaxis] dá todos os pares.
+
+    Args:
+        a: Pontos (..., 2)
+        b: Pontos (..., 2)
+        tipo: 'EUCLIDIANA' (exata) ou as regras TSPLIB 'EUC_2D', 'ATT' e 'GEO'
+
+    Returns:
+        Distâncias com a forma do broadcasting de a[..., 0] e b[..., 0]
+    """
+    if tipo == 'GEO':
+        q1 = np.cos(a[..., 1] - b[..., 1])
+        q2 = np.cos(a[..., 0] - b[..., 0])
+        q3 = np.cos(a[..., 0] + b[..., 0])
+        argumento = np.clip(0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3), -1.0, 1.0)
+        return np.trunc(6378.388 * np.arccos(argumento) + 1.0)
+
+    dx = a[..., 0] - b[..., 0]
+    dy = a[..., 1] - b[..., 1]
+    if tipo == 'ATT':
+        r = np.sqrt((dx * dx + dy * dy) / 10.0)
+        t = np.floor(r + 0.5)
+        return np.where(t < r, t + 1.0, t)
+    distancias = np.sqrt(dx * dx + dy * dy)
+    if tipo == 'EUC_2D':
+        return np.floor(distancias + 0.5)
+    return distancias
+
+
+class OraculoDistancias:
+    """
+    Distâncias calculadas sob demanda a partir das coordenadas, para instâncias
+    grandes demais para uma matriz n x n. Aceita a mesma indexação usada pelos
+    solvers na matriz densa (d[i, j] com escalares ou arrays, d[i] e fatias de
+    linhas) e mantém em cache LRU um número limitado de linhas inteiras.
+    """
+
+    def __init__(self, coordenadas: np.ndarray, tipo: str = 'EUCLIDIANA',
+                 linhas_cache: int = 128):
+        """
+        Inicializa o oráculo.
+
+        Args:
+            coordenadas: Coordenadas (n x 2) das cidades
+            tipo: 'EUCLIDIANA', 'EUC_2D', 'ATT' ou 'GEO'
+            linhas_cache: Número máximo de linhas mantidas no cache LRU
+        """
+        self.tipo = tipo
+        self.coordenadas = np.asarray(coordenadas)
+        self._pontos = preparar_pontos(coordenadas, tipo)
+        n = len(self._pontos)
+        self.shape = (n, n)
+        self.ndim = 2
+        self.dtype = np.dtype(np.float64)
+
+        # Coordenadas em listas para consultas escalares sem overhead do NumPy
+        self._x = self._pontos[:, 0].tolist()
+        self._y = self._pontos[:, 1].tolist()
+
+        self.linhas_cache = linhas_cache
+        self._cache = OrderedDict()
+        self.acertos_cache = 0
+        self.faltas_cache = 0
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def distancia(self, i: int, j: int) -> float:
+        """Distância entre as cidades de índices i e j"""
+        if self.tipo in ('EUCLIDIANA', 'EUC_2D'):
+            distancia = math.hypot(self._x[i] - self._x[j], self._y[i] - self._y[j])
+            return distancia if self.tipo == 'EUCLIDIANA' else float(math.floor(distancia + 0.5))
+        return float(distancias_pontos(self._pontos[i], self._pontos[j], self.tipo))
+
+    # Mesma interface de ndarray.item(i, j) usada nos laços escalares
+    item = distancia
+
+    def pares(self, i, j) -> np.ndarray:
+        """Distâncias dos pares (i[k], j[k]), com broadcasting entre i e j"""
+        return distancias_pontos(self._pontos[i], self._pontos[j], self.tipo)
+
+    def bloco(self, linhas, colunas=slice(None)) -> np.ndarray:
+        """Submatriz linhas x colunas calculada de uma vez, sem passar pelo cache"""
+        return distancias_pontos(self._pontos[linhas, np.newaxis, :],
+                                 self._pontos[np.newaxis, colunas, :], self.tipo)
+
+    def linha(self, i: int) -> np.ndarray:
+        """Linha i completa (somente leitura), servida pelo cache LRU"""
+        linha = self._cache.get(i)
+        if linha is not None:
+            self._cache.move_to_end(i)
+            self.acertos_cache += 1
+            return linha
+
+        self.faltas_cache += 1
+        linha = distancias_pontos(self._pontos[i], self._pontos, self.tipo)
+        linha.flags.writeable = False
+        if self.linhas_cache:
+            self._cache[i] = linha
+            if len(self._cache) > self.linhas_cache:
+                self._cache.popitem(last=False)
+        return linha
+
+    def linhas(self, indices) -> np.ndarray:
+        """Matriz (len(indices) x n) com as linhas pedidas, reaproveitando o cache"""
+        return np.stack([self.linha(int(i)) for i in indices])
+
+    def __getitem__(self, indice):
+        i, j = indice if isinstance(indice, tuple) else (indice, slice(None))
+        escalar_i = isinstance(i, numbers.Integral)
+
+        if escalar_i and isinstance(j, numbers.Integral):
+            return self.distancia(i, j)
+        if escalar_i:
+            return self.linha(i)[j]
+        if isinstance(j, slice) or isinstance(i, slice):
+            return self.bloco(i, j)
+        return self.pares(np.asarray(i), np.asarray(j))
+
+    def __array__(self, dtype: Optional[np.dtype] = None, copy: Optional[bool] = None):
+        raise TypeError("OraculoDistancias não materializa a matriz completa; use consultas por linha ou por pares")
+
+    def get_estatisticas(self) -> dict:
+        """Estatísticas de uso do cache de linhas"""
+        return {
+            'linhas_em_cache': len(self._cache),
+            'acertos_cache': self.acertos_cache,
+            'faltas_cache': self.faltas_cache
+        }
@@ -0,0 +1,158 @@
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+
+class _Fase:
+    """Gerenciador de contexto que mede uma fase; um por nome, reaproveitado a cada uso"""
+
+    __slots__ = ('perfilador', 'nome', 'inicio')
+
+    def __init__(self, perfilador: 'Perfilador', nome: str):
+        self.perfilador = perfilador
+        self.nome = nome
+        self.inicio = 0.0
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *excecao):
+        self.perfilador.registrar_fase(self.nome, time.perf_counter() - self.inicio)
+        return False
+
+
+class _FaseNula:
+    """Fase que não mede nada (ver PerfiladorNulo)"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        return False
+
+
+_FASE_NULA = _FaseNula()
+
+
+class Perfilador:
+    """
+    Instrumentação leve dos solvers: tempo por fase do laço principal e contadores
+    de eventos. As fases usadas pelos solvers do projeto são:
+
+        construcao  construção das rotas (ACO) ou amostragem das soluções (ACO_R)
+        vizinhanca  geração e avaliação incremental de vizinhos (Hill Climbing)
+        avaliacao   avaliação da função objetivo
+        selecao, crossover, mutacao   operadores do AG
+        migracao    troca de indivíduos entre as ilhas (modelo de ilhas do AG)
+        feromonio   atualização das trilhas (ACO) ou do arquivo de soluções (ACO_R)
+        busca_local polimento final com a BuscaLocal
+        checkpoint  gravação de checkpoints
+
+    e os contadores 'avaliacoes', 'movimentos_aceitos', 'rotas_alocadas' e
+    'melhorias' (do incumbente). Fases do mesmo nome não podem ser aninhadas.
+
+    Os ganchos são chamados ao fim de cada fase como gancho(nome, duracao).
+    """
+
+    CONTADORES = ('avaliacoes', 'movimentos_aceitos', 'rotas_alocadas', 'melhorias')
+
+    ativo = True
+
+    def __init__(self, ganchos: Iterable[Callable[[str, float], Any]] = ()):
+        """
+        Inicializa o perfilador.
+
+        Args:
+            ganchos: Funções gancho(nome_fase, duracao_segundos) chamadas ao fim de cada fase
+        """
+        self.ganchos = list(ganchos)
+        self._fases: Dict[str, _Fase] = {}
+        self.reiniciar()
+
+    def reiniciar(self):
+        """Zera tempos, chamadas e contadores (os solvers chamam no início de cada execução)"""
+        self.tempos: Dict[str, float] = {}
+        self.chamadas: Dict[str, int] = {}
+        self.contadores: Dict[str, int] = dict.fromkeys(self.CONTADORES, 0)
+
+    def adicionar_gancho(self, gancho: Callable[[str, float], Any]):
+        """Registra um gancho chamado ao fim de cada fase"""
+        self.ganchos.append(gancho)
+
+    def fase(self, nome: str) -> _Fase:
+        """Gerenciador de contexto que acumula o tempo de parede do bloco na fase nome"""
+        fase = self._fases.get(nome)
+        if fase is None:
+            fase = self._fases[nome] = _Fase(self, nome)
+        return fase
+
+    def registrar_fase(self, nome: str, duracao: float):
+        """Acumula uma duração medida fora de fase() (ex. em outro processo)"""
+        self.tempos[nome] = self.tempos.get(nome, 0.0) + duracao
+        self.chamadas[nome] = self.chamadas.get(nome, 0) + 1
+        for gancho in self.ganchos:
+            gancho(nome, duracao)
+
+    def contar(self, contador: str, quantidade: int = 1):
+        """Soma quantidade ao contador"""
+        self.contadores[contador] = self.contadores.get(contador, 0) + quantidade
+
+    def acumular(self, estatisticas: Dict[str, Any]):
+        """
+        Soma tempos, chamadas e contadores de outro perfilador (ex. de um processo
+        de ilha do AG), no formato de get_estatisticas(). Os ganchos não são chamados.
+        """
+        for nome, duracao in estatisticas['tempos'].items():
+            self.tempos[nome] = self.tempos.get(nome, 0.0) + duracao
+        for nome, chamadas in estatisticas['chamadas'].items():
+            self.chamadas[nome] = self.chamadas.get(nome, 0) + chamadas
+        for contador, quantidade in estatisticas['contadores'].items():
+            self.contar(contador, quantidade)
+
+    def get_estatisticas(self) -> Optional[Dict[str, Any]]:
+        """
+        Estatísticas acumuladas desde o último reiniciar().
+
+        Returns:
+            Dicionário com 'tempos' (segundos por fase), 'chamadas' (execuções de
+            cada fase), 'tempo_medido' (soma dos tempos) e 'contadores'
+        """
+        return {
+            'tempos': dict(self.tempos),
+            'chamadas': dict(self.chamadas),
+            'tempo_medido': sum(self.tempos.values()),
+            'contadores': dict(self.contadores)
+        }
+
+
+class PerfiladorNulo:
+    """
+    Perfilador padrão dos solvers: mesma interface do Perfilador, sem medir nem
+    contar nada. fase() devolve sempre o mesmo contexto vazio, sem ler o relógio.
+    """
+
+    ativo = False
+
+    def reiniciar(self):
+        pass
+
+    def fase(self, nome: str) -> _FaseNula:
+        return _FASE_NULA
+
+    def registrar_fase(self, nome: str, duracao: float):
+        pass
+
+    def contar(self, contador: str, quantidade: int = 1):
+        pass
+
+    def acumular(self, estatisticas: Dict[str, Any]):
+        pass
+
+    def get_estatisticas(self) -> None:
+        """Sem perfilador ativo não há estatísticas"""
+        return None
+
+
+PERFILADOR_NULO = PerfiladorNulo()
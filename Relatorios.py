@@ -0,0 +1,239 @@
+import argparse
+import json
+import os
+import sys
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+# Chaves dos históricos de custo nos resultados salvos pelos scripts *Execucao
+CHAVES_HISTORICO = ('historico_custos', 'historico_convergencia', 'historico_distancias', 'melhores_custos',
+                    'historico_melhor_valor_global')
+
+# Acima destes tamanhos o desenho da rota omite as arestas do grafo e os rótulos
+LIMITE_ARESTAS_GRAFO = 2000
+LIMITE_ROTULOS = 60
+
+
+def _figura(largura: float, altura: float):
+    """
+    Figura do matplotlib com canvas Agg, criada sem o pyplot: não abre janelas,
+    não depende do backend configurado e não fica registrada em estado global.
+    O matplotlib só é importado aqui, na primeira figura.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figura = Figure(figsize=(largura, altura))
+    FigureCanvasAgg(figura)
+    return figura
+
+
+def _salvar(figura, caminho: str) -> str:
+    """Grava a figura (formato pela extensão do caminho) e retorna o caminho"""
+    os.makedirs(os.path.dirname(caminho) or '.', exist_ok=True)
+    figura.tight_layout()
+    figura.savefig(caminho, dpi=100)
+    return caminho
+
+
+def plotar_convergencia(historicos: Union[Sequence[float], Dict[str, Sequence[float]]], caminho: str,
+                        titulo: str = 'Convergência', rotulo_x: str = 'Iteração',
+                        rotulo_y: str = 'Melhor custo', escala_y: str = 'linear') -> str:
+    """
+    Desenha curvas de convergência e grava a figura.
+
+    Args:
+        historicos: Custos por iteração, ou {rótulo: custos} para várias curvas
+        caminho: Arquivo de saída (ex. 'results/convergencia_aco_tsp.png')
+        titulo: Título do gráfico
+        rotulo_x: Rótulo do eixo x
+        rotulo_y: Rótulo do eixo y
+        escala_y: Escala do eixo y ('linear', 'log' ou 'symlog')
+
+    Returns:
+        str: O caminho gravado
+    """
+    if not isinstance(historicos, dict):
+        historicos = {None: historicos}
+
+    figura = _figura(10, 6)
+    eixo = figura.add_subplot()
+    for rotulo, historico in historicos.items():
+        historico = np.asarray(historico, dtype=np.float64)
+        marcador = 'o' if len(historico) <= 200 else None
+        eixo.plot(np.arange(1, len(historico) + 1), historico, marker=marcador, markersize=3, label=rotulo)
+    eixo.set_title(titulo)
+    eixo.set_xlabel(rotulo_x)
+    eixo.set_ylabel(rotulo_y)
+    eixo.set_yscale(escala_y)
+    eixo.grid(True, alpha=0.3)
+    if any(rotulo is not None for rotulo in historicos):
+        eixo.legend()
+    return _salvar(figura, caminho)
+
+
+def posicoes_cidades(instancia) -> np.ndarray:
+    """
+    Posições 2D das cidades para desenho: as coordenadas da instância, quando
+    conhecidas, ou o escalonamento multidimensional clássico das distâncias
+    (caminhos mínimos nos grafos incompletos), que é determinístico.
+
+    Returns:
+        np.ndarray: Matriz (n x 2) de posições, na ordem de instancia.cidades
+    """
+    if instancia.coordenadas is not None:
+        return np.asarray(instancia.coordenadas, dtype=np.float64)
+    if not instancia.densa:
+        raise ValueError("Instância sem coordenadas e sem matriz densa de distâncias")
+
+    distancias = np.array(instancia.matriz_distancias, dtype=np.float64)
+    finitas = np.isfinite(distancias)
+    distancias[~finitas] = distancias[finitas].max() * 2 if finitas.any() else 1.0
+    distancias = (distancias + distancias.T) / 2
+
+    # Centraliza o quadrado das distâncias e usa os dois maiores autovetores
+    n = len(distancias)
+    centro = np.eye(n) - 1.0 / n
+    produto = -0.5 * centro @ (distancias * distancias) @ centro
+    autovalores, autovetores = np.linalg.eigh(produto)
+    maiores = np.argsort(autovalores)[::-1][:2]
+    posicoes = autovetores[:, maiores] * np.sqrt(np.maximum(autovalores[maiores], 0.0))
+    # Sinal dos autovetores fixado para que o desenho não espelhe entre versões do NumPy
+    posicoes *= np.where(posicoes[np.abs(posicoes).argmax(axis=0), [0, 1]] < 0, -1.0, 1.0)
+    return posicoes
+
+
+def plotar_rota(instancia, rota: Sequence, caminho: str, titulo: str = 'Melhor rota encontrada') -> str:
+    """
+    Desenha a rota sobre as cidades (e as arestas do grafo de adjacência, quando
+    houver) e grava a figura.
+
+    Args:
+        instancia: InstanciaTSP ou dicionário de adjacência
+        rota: Cidades (nomes) na ordem de visita; a volta à primeira é desenhada
+        caminho: Arquivo de saída (ex. 'results/melhor_rota_grafo.png')
+        titulo: Título do gráfico
+
+    Returns:
+        str: O caminho gravado
+    """
+    from InstanciaTSP import InstanciaTSP
+
+    instancia = InstanciaTSP.de_grafo(instancia)
+    posicoes = posicoes_cidades(instancia)
+    indices = np.asarray(instancia.para_indices(list(rota)), dtype=np.intp)
+    if len(indices) > 1 and indices[0] == indices[-1]:
+        indices = indices[:-1]
+    indices = np.append(indices, indices[0])
+    rotulos = instancia.num_cidades <= LIMITE_ROTULOS
+
+    figura = _figura(12, 8)
+    eixo = figura.add_subplot()
+
+    # Arestas do grafo em cinza, com os pesos nos grafos pequenos
+    grafo = instancia.grafo_adj
+    if grafo is not None and sum(len(vizinhos) for vizinhos in grafo.values()) <= LIMITE_ARESTAS_GRAFO:
+        for cidade, vizinhos in grafo.items():
+            i = instancia.cidade_para_indice[cidade]
+            for vizinho, peso in vizinhos.items():
+                j = instancia.cidade_para_indice[vizinho]
+                if i < j or cidade not in grafo.get(vizinho, {}):
+                    (x1, y1), (x2, y2) = posicoes[i], posicoes[j]
+                    eixo.plot((x1, x2), (y1, y2), color='0.7', linewidth=1, zorder=1)
+                    if rotulos:
+                        eixo.text((x1 + x2) / 2, (y1 + y2) / 2, f'{peso:g}', fontsize=8, ha='center', va='center',
+                                  bbox={'facecolor': 'white', 'edgecolor': 'none', 'pad': 0.5}, zorder=2)
+
+    eixo.plot(posicoes[indices, 0], posicoes[indices, 1], color='red', linewidth=2.5, zorder=3)
+    tamanho = 500 if rotulos else max(4, 4000 // instancia.num_cidades)
+    eixo.scatter(posicoes[:, 0], posicoes[:, 1], s=tamanho, color='lightblue', zorder=4)
+    if rotulos:
+        for i, cidade in enumerate(instancia.cidades):
+            eixo.text(posicoes[i, 0], posicoes[i, 1], str(cidade), fontsize=12, fontweight='bold',
+                      ha='center', va='center', zorder=5)
+
+    eixo.set_title(f'{titulo} (custo {instancia.custo_rota(indices[:-1]):g})')
+    eixo.set_aspect('equal', adjustable='datalim')
+    eixo.axis('off')
+    return _salvar(figura, caminho)
+
+
+def _secoes(resultados: dict, nome: str) -> Dict[str, dict]:
+    """Seções de um arquivo de resultados: o próprio dicionário ou um por problema"""
+    if any(chave in resultados for chave in CHAVES_HISTORICO + ('melhor_rota',)):
+        return {nome: resultados}
+    return {chave: valor for chave, valor in resultados.items() if isinstance(valor, dict)}
+
+
+def _grafo_json(grafo: dict) -> dict:
+    """Grafo de adjacência lido de JSON, com os nomes numéricos de volta a int"""
+    def cidade(nome):
+        return int(nome) if isinstance(nome, str) and nome.isdigit() else nome
+    return {cidade(c): {cidade(v): d for v, d in vizinhos.items()} for c, vizinhos in grafo.items()}
+
+
+def gerar_relatorio(caminho_resultados: str, diretorio: Optional[str] = None,
+                    instancia=None, prefixo: str = '') -> List[str]:
+    """
+    Gera as figuras de um arquivo de resultados JSON salvo por uma execução:
+    uma curva de convergência por histórico de custos e o desenho da melhor rota
+    quando há 'melhor_rota' e a instância (argumento ou chave 'grafo' do arquivo).
+
+    Args:
+        caminho_resultados: Arquivo JSON com os resultados, com um dicionário por
+            problema (ex. {'tsp': {...}, 'schwefel': {...}}) ou um só
+        diretorio: Onde gravar as figuras (padrão: o diretório do arquivo)
+        instancia: InstanciaTSP ou dicionário de adjacência das rotas
+        prefixo: Prefixo da seção nos nomes das figuras (ex. 'hc_' gera convergencia_hc_tsp.png)
+
+    Returns:
+        list: Caminhos das figuras gravadas
+    """
+    with open(caminho_resultados) as arquivo:
+        resultados = json.load(arquivo)
+    diretorio = diretorio if diretorio is not None else os.path.dirname(caminho_resultados)
+    nome = os.path.splitext(os.path.basename(caminho_resultados))[0]
+
+    figuras = []
+    for secao, dados in _secoes(resultados, nome).items():
+        historico = next((dados[chave] for chave in CHAVES_HISTORICO if dados.get(chave)), None)
+        if historico:
+            escala = 'symlog' if min(historico) <= 0 < max(historico) else 'linear'
+            figuras.append(plotar_convergencia(historico, os.path.join(diretorio, f'convergencia_{prefixo}{secao}.png'),
+                                               titulo=f'Convergência ({secao})', escala_y=escala))
+
+        grafo = instancia if instancia is not None else dados.get('grafo', resultados.get('grafo'))
+        if dados.get('melhor_rota') and grafo is not None:
+            if isinstance(grafo, dict):
+                grafo = _grafo_json(grafo)
+            figuras.append(plotar_rota(grafo, dados['melhor_rota'], os.path.join(diretorio, f'melhor_rota_{prefixo}{secao}.png'),
+                                       titulo=f'Melhor rota ({secao})'))
+    return figuras
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(
+        description='Gera as figuras (convergência e melhor rota) de resultados salvos, sem interface gráfica.',
+        epilog='Exemplo: python Relatorios.py results/resultados_hill_climbing.json --instancia grafo18 --prefixo hc_')
+    parser.add_argument('resultados', nargs='+', help='Arquivos JSON de resultados')
+    parser.add_argument('--instancia', help='Instância das rotas (nome aceito por Instancias.carregar_instancia)')
+    parser.add_argument('--saida', help='Diretório das figuras (padrão: o de cada arquivo)')
+    parser.add_argument('--prefixo', default='', help='Prefixo dos nomes das figuras')
+    args = parser.parse_args(argumentos)
+
+    instancia = None
+    if args.instancia:
+        from Instancias import carregar_instancia
+        try:
+            instancia = carregar_instancia(args.instancia)
+        except ValueError as erro:
+            parser.error(str(erro))
+
+    for caminho in args.resultados:
+        for figura in gerar_relatorio(caminho, args.saida, instancia, args.prefixo):
+            print(f"Figura salva em {figura}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+import numpy as np
+from typing import Optional, Union
+
+
+class Schwefel:
+    """
+    Função de Schwefel vetorizada, compartilhada pelos solvers contínuos.
+    Avalia um vetor (dim,) ou uma matriz (lote x dim) em uma única chamada NumPy
+    e conta quantas soluções foram avaliadas.
+    """
+
+    CONSTANTE = 418.9829
+    MINIMO_GLOBAL = 420.968746
+
+    def __init__(self, limite_inferior: Optional[float] = None,
+                 limite_superior: Optional[float] = None):
+        """
+        Inicializa a função objetivo.
+
+        Args:
+            limite_inferior: Limite inferior aplicado às variáveis antes da avaliação (None não limita)
+            limite_superior: Limite superior aplicado às variáveis antes da avaliação (None não limita)
+        """
+        self.limite_inferior = limite_inferior
+        self.limite_superior = limite_superior
+        self.avaliacoes = 0
+
+    def __call__(self, x) -> Union[float, np.ndarray]:
+        """
+        Avalia uma solução ou um lote de soluções.
+
+        Args:
+            x: Vetor (dim,) ou matriz (lote x dim)
+
+        Returns:
+            Valor da função para um vetor, ou vetor com o valor de cada linha do lote
+        """
+        x = np.asarray(x, dtype=np.float64)
+        if self.limite_inferior is not None or self.limite_superior is not None:
+            x = np.clip(x, self.limite_inferior, self.limite_superior)
+
+        valores = self.CONSTANTE * x.shape[-1] - np.sum(x * np.sin(np.sqrt(np.abs(x))), axis=-1)
+        if x.ndim == 1:
+            self.avaliacoes += 1
+            return float(valores)
+        self.avaliacoes += x.shape[0]
+        return valores
+
+    def reiniciar_contador(self):
+        """Zera o contador de avaliações"""
+        self.avaliacoes = 0
@@ -0,0 +1,222 @@
+import json
+import os
+import numpy as np
+from typing import Any, Dict, Optional
+from InstanciaTSP import InstanciaTSP
+from OraculoDistancias import distancias_pontos, preparar_pontos
+
+TIPOS_COORDENADAS = ('EUC_2D', 'GEO', 'ATT')
+FORMATOS_EXPLICITOS = ('FULL_MATRIX', 'UPPER_ROW', 'LOWER_ROW', 'UPPER_DIAG_ROW', 'LOWER_DIAG_ROW',
+                       'UPPER_COL', 'LOWER_COL', 'UPPER_DIAG_COL', 'LOWER_DIAG_COL')
+
+# Incrementar quando o conteúdo do cache mudar de formato
+VERSAO_CACHE = 3
+
+# Acima deste número de cidades a matriz não é gravada e as distâncias vêm de um OraculoDistancias
+LIMITE_MATRIZ_DENSA = 20000
+
+
+def ler_tsplib(caminho: str) -> Dict[str, Any]:
+    """
+    Lê um arquivo TSPLIB (.tsp).
+
+    Args:
+        caminho: Caminho do arquivo
+
+    Returns:
+        Dicionário com o cabeçalho (chaves em maiúsculas) e as seções lidas:
+        'coordenadas' (n x 2) e/ou 'pesos' (vetor com os números de EDGE_WEIGHT_SECTION)
+    """
+    with open(caminho) as arquivo:
+        linhas = arquivo.read().splitlines()
+
+    dados = {}
+    i = 0
+    while i < len(linhas):
+        linha = linhas[i].strip()
+        i += 1
+        if not linha or linha == 'EOF':
+            continue
+
+        chave, _, valor = linha.partition(':')
+        chave = chave.strip().upper()
+        if not chave.endswith('_SECTION'):
+            dados[chave] = valor.strip()
+            continue
+
+        # Seção de dados: números até a próxima palavra-chave
+        tokens = valor.split()
+        while i < len(linhas) and (not linhas[i].strip() or linhas[i].lstrip()[0] in '+-.0123456789'):
+            tokens.extend(linhas[i].split())
+            i += 1
+        numeros = np.array(tokens, dtype=np.float64)
+
+        if chave == 'NODE_COORD_SECTION':
+            dados['coordenadas'] = numeros.reshape(-1, 3)[:, 1:]
+        elif chave == 'EDGE_WEIGHT_SECTION':
+            dados['pesos'] = numeros
+        elif chave == 'DISPLAY_DATA_SECTION':
+            dados['coordenadas_exibicao'] = numeros.reshape(-1, 3)[:, 1:]
+
+    if 'DIMENSION' not in dados:
+        raise ValueError(f"Arquivo TSPLIB sem DIMENSION: {caminho}")
+    dados['DIMENSION'] = int(dados['DIMENSION'])
+    return dados
+
+
+def _matriz_explicita(pesos: np.ndarray, n: int, formato: str) -> np.ndarray:
+    """Monta a matriz simétrica a partir de EDGE_WEIGHT_SECTION"""
+    if formato not in FORMATOS_EXPLICITOS:
+        raise ValueError(f"Formato EXPLICIT não suportado: {formato}")
+    if formato == 'FULL_MATRIX':
+        return pesos[:n * n].reshape(n, n)
+
+    # Formatos por coluna equivalem aos por linha do triângulo oposto
+    formato = {'UPPER_COL': 'LOWER_ROW', 'LOWER_COL': 'UPPER_ROW',
+               'UPPER_DIAG_COL': 'LOWER_DIAG_ROW', 'LOWER_DIAG_COL': 'UPPER_DIAG_ROW'}.get(formato, formato)
+    diagonal = 'DIAG' in formato
+    if formato.startswith('UPPER'):
+        linhas, colunas = np.triu_indices(n, k=0 if diagonal else 1)
+    else:
+        linhas, colunas = np.tril_indices(n, k=0 if diagonal else -1)
+
+    matriz = np.zeros((n, n))
+    matriz[linhas, colunas] = pesos[:len(linhas)]
+    matriz[colunas, linhas] = pesos[:len(linhas)]
+    return matriz
+
+
+def _escrever_matriz(dados: Dict[str, Any], caminho: str):
+    """
+    Grava a matriz de distâncias em .npy no tipo compacto: int32 para as regras
+    TSPLIB sobre coordenadas (sempre inteiras), calculada em blocos de linhas, e
+    o tipo de InstanciaTSP.tipo_distancias para matrizes EXPLICIT.
+    """
+    n = dados['DIMENSION']
+    tipo = dados.get('EDGE_WEIGHT_TYPE', 'EUC_2D').upper()
+
+    if tipo == 'EXPLICIT':
+        matriz = _matriz_explicita(dados['pesos'], n, dados.get('EDGE_WEIGHT_FORMAT', 'FULL_MATRIX').upper())
+        saida = np.lib.format.open_memmap(caminho, mode='w+', dtype=InstanciaTSP.tipo_distancias(matriz), shape=(n, n))
+        saida[:] = matriz
+    elif tipo in TIPOS_COORDENADAS:
+        saida = np.lib.format.open_memmap(caminho, mode='w+', dtype=np.int32, shape=(n, n))
+        pontos = preparar_pontos(dados['coordenadas'], tipo)
+        linhas_por_bloco = InstanciaTSP.linhas_por_bloco(n)
+        for inicio in range(0, n, linhas_por_bloco):
+            bloco = pontos[inicio:inicio + linhas_por_bloco]
+            saida[inicio:inicio + len(bloco)] = distancias_pontos(bloco[:, np.newaxis], pontos[np.newaxis], tipo)
+    else:
+        raise ValueError(f"EDGE_WEIGHT_TYPE não suportado: {tipo}")
+
+    np.fill_diagonal(saida, 0.0)
+    saida.flush()
+    del saida
+
+
+def _salvar_npy(caminho: str, array: np.ndarray):
+    """Grava um .npy de forma atômica (arquivo temporário + rename)"""
+    temporario = caminho + '.tmp'
+    with open(temporario, 'wb') as arquivo:
+        np.save(arquivo, array)
+    os.replace(temporario, caminho)
+
+
+def carregar_tsplib(caminho: str, diretorio_cache: Optional[str] = None,
+                    num_vizinhos: int = 10, densa: Optional[bool] = None) -> InstanciaTSP:
+    """
+    Carrega uma instância TSPLIB (EUC_2D, GEO, ATT ou EXPLICIT) com cache binário.
+    Na primeira carga grava coordenadas, matriz compacta (int32) de distâncias e
+    listas de vizinhos em .npy; nas seguintes a matriz é mapeada em memória, sem releitura
+    do texto nem recálculo das distâncias. Sem matriz densa, apenas coordenadas e
+    vizinhos vão para o cache e as distâncias são calculadas por um OraculoDistancias.
+
+    Args:
+        caminho: Caminho do arquivo .tsp
+        diretorio_cache: Diretório do cache (padrão: <arquivo>.cache ao lado do arquivo)
+        num_vizinhos: Tamanho das listas de vizinhos mais próximos guardadas no cache
+        densa: Se deve usar a matriz n x n (padrão: até LIMITE_MATRIZ_DENSA cidades;
+            instâncias EXPLICIT são sempre densas)
+
+    Returns:
+        InstanciaTSP com cidades 1..n, como na numeração TSPLIB
+    """
+    diretorio_cache = diretorio_cache or caminho + '.cache'
+    estado = os.stat(caminho)
+    fonte = {'tamanho': estado.st_size, 'modificado': estado.st_mtime_ns}
+    arquivo_metadados = os.path.join(diretorio_cache, 'metadados.json')
+    arquivo_matriz = os.path.join(diretorio_cache, 'distancias.npy')
+    arquivo_coordenadas = os.path.join(diretorio_cache, 'coordenadas.npy')
+
+    metadados = None
+    alterado = False
+    if os.path.exists(arquivo_metadados):
+        with open(arquivo_metadados) as arquivo:
+            metadados = json.load(arquivo)
+        if metadados.get('versao') != VERSAO_CACHE or metadados.get('fonte') != fonte:
+            metadados = None
+
+    if metadados is not None:
+        if densa is None:
+            densa = metadados['tipo_aresta'] == 'EXPLICIT' or metadados['num_cidades'] <= LIMITE_MATRIZ_DENSA
+        elif not densa and metadados['tipo_aresta'] not in TIPOS_COORDENADAS:
+            raise ValueError(f"EDGE_WEIGHT_TYPE {metadados['tipo_aresta']} exige a matriz densa de distâncias")
+
+    if metadados is None or (densa and not metadados['matriz']):
+        # Primeira carga (fonte alterada ou matriz ausente): lê o texto e compila o cache
+        dados = ler_tsplib(caminho)
+        tipo = dados.get('EDGE_WEIGHT_TYPE', 'EUC_2D').upper()
+        if densa is None:
+            densa = tipo == 'EXPLICIT' or dados['DIMENSION'] <= LIMITE_MATRIZ_DENSA
+        elif not densa and tipo not in TIPOS_COORDENADAS:
+            raise ValueError(f"EDGE_WEIGHT_TYPE {tipo} exige a matriz densa de distâncias")
+
+        os.makedirs(diretorio_cache, exist_ok=True)
+        if densa:
+            _escrever_matriz(dados, arquivo_matriz + '.tmp')
+            os.replace(arquivo_matriz + '.tmp', arquivo_matriz)
+        elif os.path.exists(arquivo_matriz):
+            os.remove(arquivo_matriz)
+
+        coordenadas = dados.get('coordenadas', dados.get('coordenadas_exibicao'))
+        if coordenadas is not None:
+            _salvar_npy(arquivo_coordenadas, coordenadas)
+        elif os.path.exists(arquivo_coordenadas):
+            os.remove(arquivo_coordenadas)
+
+        metadados = {
+            'versao': VERSAO_CACHE,
+            'fonte': fonte,
+            'nome': dados.get('NAME', os.path.basename(caminho)),
+            'tipo_aresta': tipo,
+            'num_cidades': dados['DIMENSION'],
+            'matriz': bool(densa),
+            'vizinhos': []
+        }
+        alterado = True
+
+    coordenadas = np.load(arquivo_coordenadas) if os.path.exists(arquivo_coordenadas) else None
+    if densa:
+        matriz = np.load(arquivo_matriz, mmap_mode='r')
+        instancia = InstanciaTSP.de_matriz(matriz, fechar_caminhos=False, coordenadas=coordenadas)
+    else:
+        instancia = InstanciaTSP.de_coordenadas(coordenadas, metadados['tipo_aresta'], densa=False)
+
+    # Listas de vizinhos: reaproveitadas do cache ou calculadas e guardadas uma vez
+    k = max(1, min(num_vizinhos, instancia.num_cidades - 1))
+    arquivo_vizinhos = os.path.join(diretorio_cache, f'vizinhos_{k}.npy')
+    if k in metadados['vizinhos']:
+        instancia._vizinhos_cache[k] = np.load(arquivo_vizinhos)
+    else:
+        _salvar_npy(arquivo_vizinhos, instancia.vizinhos_proximos(k))
+        metadados['vizinhos'].append(k)
+        alterado = True
+
+    # Os metadados são gravados por último e validam o restante do cache
+    if alterado:
+        temporario = arquivo_metadados + '.tmp'
+        with open(temporario, 'w') as arquivo:
+            json.dump(metadados, arquivo, indent=4)
+        os.replace(temporario, arquivo_metadados)
+
+    return instancia
@@ -0,0 +1,88 @@
+import time
+from typing import Optional
+
+
+class CriterioParada:
+    """
+    Política de parada comum aos solvers: prazo de tempo de parede, máximo de
+    avaliações da função objetivo, custo alvo e janela de estagnação.
+
+    O solver chama iniciar() antes do laço principal e deve_parar() a cada passo
+    (iteração, geração ou movimento, conforme o solver), informando o custo
+    corrente e as avaliações acumuladas. Os limites próprios de cada solver
+    (num_iteracoes, geracoes, max_iter_sem_melhora...) continuam valendo como teto;
+    ao parar, o solver devolve a melhor solução encontrada até ali.
+    """
+
+    MOTIVOS = ('tempo', 'avaliacoes', 'custo_alvo', 'estagnacao')
+
+    def __init__(self, tempo_limite: Optional[float] = None,
+                 max_avaliacoes: Optional[int] = None,
+                 custo_alvo: Optional[float] = None,
+                 janela_estagnacao: Optional[int] = None):
+        """
+        Inicializa o critério. Limites None ficam desativados.
+
+        Args:
+            tempo_limite: Segundos de tempo de parede desde iniciar()
+            max_avaliacoes: Máximo de avaliações da função objetivo
+            custo_alvo: Para assim que o melhor custo for menor ou igual a este valor
+            janela_estagnacao: Passos consecutivos sem melhora do melhor custo
+        """
+        if tempo_limite is not None and tempo_limite < 0:
+            raise ValueError(f"Tempo limite inválido: {tempo_limite}")
+        if max_avaliacoes is not None and max_avaliacoes < 0:
+            raise ValueError(f"Máximo de avaliações inválido: {max_avaliacoes}")
+        if janela_estagnacao is not None and janela_estagnacao < 1:
+            raise ValueError(f"Janela de estagnação inválida: {janela_estagnacao}")
+        self.tempo_limite = tempo_limite
+        self.max_avaliacoes = max_avaliacoes
+        self.custo_alvo = custo_alvo
+        self.janela_estagnacao = janela_estagnacao
+        self.iniciar()
+
+    def iniciar(self):
+        """Reinicia o relógio, o melhor custo visto e o motivo de parada"""
+        self.inicio = time.perf_counter()
+        self._prazo = self.inicio + self.tempo_limite if self.tempo_limite is not None else None
+        self.melhor_custo = float('inf')
+        self.passos = 0
+        self.passos_sem_melhora = 0
+        self.motivo = None
+
+    @property
+    def parou(self) -> bool:
+        """Se algum limite já foi atingido"""
+        return self.motivo is not None
+
+    def tempo_decorrido(self) -> float:
+        """Segundos desde iniciar()"""
+        return time.perf_counter() - self.inicio
+
+    def deve_parar(self, custo: float, avaliacoes: int = 0) -> bool:
+        """
+        Registra um passo do solver e indica se a execução deve parar.
+
+        Args:
+            custo: Custo corrente (ou melhor custo) do solver neste passo
+            avaliacoes: Avaliações da função objetivo acumuladas desde o início
+
+        Returns:
+            True quando algum limite foi atingido; o motivo fica em self.motivo
+        """
+        self.passos += 1
+        if custo < self.melhor_custo:
+            self.melhor_custo = custo
+            self.passos_sem_melhora = 0
+        else:
+            self.passos_sem_melhora += 1
+
+        if self.custo_alvo is not None and self.melhor_custo <= self.custo_alvo:
+            self.motivo = 'custo_alvo'
+        elif self.max_avaliacoes is not None and avaliacoes >= self.max_avaliacoes:
+            self.motivo = 'avaliacoes'
+        elif self.janela_estagnacao is not None and self.passos_sem_melhora >= self.janela_estagnacao:
+            self.motivo = 'estagnacao'
+        elif self._prazo is not None and time.perf_counter() >= self._prazo:
+            self.motivo = 'tempo'
+        return self.motivo is not None